@@ -6,6 +6,25 @@ from pydantic import BaseModel
 from typing import List
 
 
+class BaseResponse(BaseModel):
+    """
+    API 응답이 공통으로 따르는 데이터 구조
+
+    Attributes:
+        status (str): 응답 상태 ("success" 혹은 "error")
+        code (int): HTTP 응답 상태코드
+        message (str): HTTP 관련 메시지
+        data (dict): 결과 데이터 (응답 상태가 성공인 경우에만 존재)
+        details (dict): 에러 응답 세부 정보 (응답 상태가 실패인 경우에만 존재)
+    """
+
+    status: str
+    code: int
+    message: str
+    data: dict = None
+    details: dict = None
+
+
 class TranscriptionCreate(BaseModel):
     """
     음성 인식 API 요청 시 전송해야 하는 본문 데이터 구조
@@ -66,6 +85,48 @@ class PredictionResponse(BaseModel):
     details: dict = None
 
 
+class PredictionBatchItem(BaseModel):
+    """
+    단어 추론 배치 API 요청에 담기는 설명 하나의 데이터 구조
+
+    Attributes:
+        description (str): 단어를 추론하는데 사용될 단어에 관한 묘사 텍스트
+        top_k (int): 추론 결과에 담을 단어의 수
+    """
+
+    description: str
+    top_k: int = 3
+
+
+class PredictionBatchCreate(BaseModel):
+    """
+    단어 추론 배치 API 요청 시 전송해야 하는 본문 데이터 구조
+
+    Attributes:
+        items (List[PredictionBatchItem]): 단어를 추론할 설명 목록
+    """
+
+    items: List[PredictionBatchItem]
+
+
+class PredictionBatchResponse(BaseResponse):
+    """
+    단어 추론 배치 결과를 담은 응답 데이터 구조
+
+    Attributes:
+        data (dict): 요청 순서대로 설명별 추론 결과 혹은 에러를 담은 데이터 (응답 상태가 성공인 경우에만 존재)
+    """
+
+
+class VoicePredictionResponse(BaseResponse):
+    """
+    음성 단어 추론 결과를 담은 응답 데이터 구조
+
+    Attributes:
+        data (dict): 음성 인식 결과, 단어 추론 결과, 단계별 소요 시간 (응답 상태가 성공인 경우에만 존재)
+    """
+
+
 class FeedbackCreate(BaseModel):
     """
     단어 추론에 대한 피드백 API 요청 시 전송해야 하는 본문 데이터 구조
@@ -102,3 +163,48 @@ class FeedbackResponse(BaseModel):
     message: str
     data: dict = None
     details: dict = None
+
+
+class CorpusSyncResponse(BaseResponse):
+    """
+    코퍼스 동기화 API 요청 시 전송하는 응답 데이터 구조
+
+    Attributes:
+        data (dict): 동기화 결과 데이터 (응답 상태가 성공인 경우에만 존재)
+    """
+
+
+class MetricsResponse(BaseResponse):
+    """
+    서버 지표 API 요청 시 전송하는 응답 데이터 구조
+
+    Attributes:
+        data (dict): 지표 데이터 (응답 상태가 성공인 경우에만 존재)
+    """
+
+
+class ModelRegistryResponse(BaseResponse):
+    """
+    모델 버전 목록 API 요청 시 전송하는 응답 데이터 구조
+
+    Attributes:
+        data (dict): 모델 레지스트리 상태 (응답 상태가 성공인 경우에만 존재)
+    """
+
+
+class ModelActivationResponse(BaseResponse):
+    """
+    기본 모델 버전 교체 API 요청 시 전송하는 응답 데이터 구조
+
+    Attributes:
+        data (dict): 교체할 모델 버전 (응답 상태가 성공인 경우에만 존재)
+    """
+
+
+class HealthResponse(BaseResponse):
+    """
+    상태 확인 API(healthz, readyz) 요청 시 전송하는 응답 데이터 구조
+
+    Attributes:
+        data (dict): 시작 상태 데이터 (응답 상태가 성공인 경우에만 존재)
+    """
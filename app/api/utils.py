@@ -3,6 +3,39 @@ API 관련 유틸 함수
 """
 
 import base64
+from typing import AsyncIterator, Optional, Tuple
+
+from starlette.requests import HTTPConnection
+
+from app.core.exceptions import CustomException
+from app.settings.constants import (
+    HTTP_STATUS_CODE,
+    HTTP_STATUS_MESSAGE,
+    PREDICTION_MAX_TOP_K,
+    STT_MAX_AUDIO_BYTES,
+)
+
+
+def decode_audio_content(audio_content: str) -> Optional[bytes]:
+    """
+    base64로 변환된 음성 데이터를 한 번만 디코딩하고, RIFF 헤더로 시작하는지 검증한다.
+
+    Args:
+        audio_content (str): base64로 변환된 음성 데이터
+
+    Returns:
+        Optional[bytes]: 유효한 경우 디코딩된 음성 데이터, 그렇지 않은 경우는 None
+    """
+
+    try:
+        decoded_audio = base64.b64decode(audio_content)
+    except base64.binascii.Error:
+        return None
+
+    if decoded_audio[:4] != b"RIFF":
+        return None
+
+    return decoded_audio
 
 
 def is_audio_content_valid(
@@ -18,14 +51,118 @@ def is_audio_content_valid(
         bool: 음성 데이터가 유효하면 True, 그렇지 않으면 False
     """
 
-    try:
-        decoded_audio = base64.b64decode(audio_content)
+    return decode_audio_content(audio_content) is not None
+
+
+def is_wav_header_valid(header: bytes) -> bool:
+    """
+    음성 데이터의 앞부분이 RIFF/WAVE 헤더인지 검증한다.
+
+    Args:
+        header (bytes): 음성 데이터의 처음 12바이트 이상
+
+    Returns:
+        bool: RIFF/WAVE 헤더이면 True, 그렇지 않으면 False
+    """
+
+    return len(header) >= 12 and header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+
+
+async def read_audio_body(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int = STT_MAX_AUDIO_BYTES,
+) -> bytes:
+    """
+    요청 본문을 청크 단위로 읽어 음성 데이터를 반환한다.
+
+    RIFF/WAVE 헤더는 처음 12바이트가 모이는 즉시 검증하고, 크기가 max_bytes를 넘는 순간
+    나머지를 읽지 않고 거절한다. 청크는 마지막에 한 번만 이어 붙인다.
+
+    Args:
+        chunks (AsyncIterator[bytes]): 요청 본문 청크 (Request.stream())
+        max_bytes (int): 허용하는 최대 크기 (bytes)
+
+    Returns:
+        bytes: 음성 데이터
+
+    Raises:
+        CustomException: 헤더가 RIFF/WAVE가 아닌 경우 (400), 크기가 max_bytes를 넘는 경우 (413)
+    """
+
+    received = []
+    size = 0
+    header_checked = False
+
+    async for chunk in chunks:
+        size += len(chunk)
+
+        if size > max_bytes:
+            raise CustomException(
+                status_code=HTTP_STATUS_CODE["PAYLOAD_TOO_LARGE"],
+                message=HTTP_STATUS_MESSAGE["PAYLOAD_TOO_LARGE"],
+                attribute="audio",
+                reason=f"The audio data should not exceed {max_bytes} bytes.",
+            )
+
+        received.append(chunk)
+
+        if not header_checked and size >= 12:
+            if not is_wav_header_valid(b"".join(received)[:12]):
+                break
+            header_checked = True
+
+    if not header_checked:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
+            message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
+            attribute="audio",
+            reason="The audio data provided is not supported. Please send a valid audio.",
+        )
+
+    return b"".join(received)
+
+
+def get_prediction_item_error(
+    description: str, top_k: int
+) -> Optional[Tuple[str, str]]:
+    """
+    단어 추론 배치 요청에 담긴 설명 하나가 유효한지 검증한다.
+
+    Args:
+        description (str): 단어에 관한 묘사 텍스트
+        top_k (int): 추론 결과에 담을 단어의 수
+
+    Returns:
+        Optional[Tuple[str, str]]: 유효하지 않은 경우 (에러와 관련된 필드명, 사유), 유효한 경우는 None
+    """
+
+    if not description or description.strip() == "":
+        return (
+            "description",
+            "The description is empty. Please check the data and resend it.",
+        )
+
+    if not 1 <= top_k <= PREDICTION_MAX_TOP_K:
+        return ("top_k", f"The top_k should be between 1 and {PREDICTION_MAX_TOP_K}.")
+
+    return None
+
+
+def get_requested_model_version(connection: HTTPConnection) -> Optional[str]:
+    """
+    요청이 지정한 모델 버전을 반환한다.
+
+    경로의 model_version(/models/{model_version}/...)을 X-Model-Version 헤더보다 우선한다.
+
+    Args:
+        connection (HTTPConnection): 요청
+
+    Returns:
+        Optional[str]: 지정한 모델 버전, 지정하지 않은 경우는 None
+    """
 
-        if decoded_audio[:4] == b"RIFF":
-            return True
-        return False
-    except (
-        base64.binascii.Error,
-        IndexError,
-    ):
-        return False
+    return (
+        connection.path_params.get("model_version")
+        or connection.headers.get("x-model-version")
+        or None
+    )
@@ -0,0 +1,160 @@
+"""
+크기와 유효 시간이 제한된 LRU 캐시 모듈
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+
+def estimate_size(value: Any) -> int:
+    """
+    캐시에 저장할 값이 차지하는 메모리 크기를 대략적으로 계산한다.
+
+    Args:
+        value (Any): 크기를 계산할 값
+
+    Returns:
+        int: 값의 대략적인 크기 (bytes)
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes + sys.getsizeof(value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+
+    try:
+        return len(json.dumps(value, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    항목 수, 전체 크기, 유효 시간이 제한된 스레드 안전 LRU 캐시
+
+    한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    유효 시간이 지난 항목은 조회 시 제거한다.
+
+    Attributes:
+        max_entries (int): 최대 항목 수
+        max_bytes (int): 최대 전체 크기 (bytes)
+        ttl_seconds (float): 항목의 유효 시간 (초), 0 이하이면 만료되지 않음
+        hits (int): 캐시 적중 수
+        misses (int): 캐시 미스 수
+        evictions (int): 한도를 넘어 제거된 항목 수
+        expirations (int): 유효 시간이 지나 제거된 항목 수
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        키에 해당하는 값을 반환한다.
+
+        Args:
+            key (Hashable): 조회할 키
+
+        Returns:
+            Optional[Any]: 유효한 값이 있으면 그 값, 없으면 None
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires_at = entry
+
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        키에 값을 저장한다. 값 하나가 max_bytes보다 크면 저장하지 않는다.
+
+        Args:
+            key (Hashable): 저장할 키
+            value (Any): 저장할 값
+        """
+
+        size = estimate_size(value)
+
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else None
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        모든 항목을 제거한다.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        현재 캐시의 통계를 반환한다.
+
+        Returns:
+            Dict[str, int]: 항목 수, 전체 크기, 적중 수, 미스 수, 제거된 항목 수, 만료된 항목 수
+        """
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -2,11 +2,69 @@
 음성 인식 API와 관련된 설정을 위한 모듈
 """
 
+import threading
+from typing import Optional
+
 from google.cloud import speech_v2
 from google.cloud.speech_v2.types import cloud_speech
 
+from app.settings.constants import STT_SAMPLE_RATE, STT_SERVICE_ACCOUNT_FILE
+
 speech_recognition_config = speech_v2.RecognitionConfig(
     auto_decoding_config=cloud_speech.AutoDetectDecodingConfig(),
     language_codes=["en-US"],
     model="short",
 )
+
+# 헤더 없이 스트리밍되는 음성(16비트 모노 LINEAR16, STT_SAMPLE_RATE)은 형식을 알아낼 수 없으므로 명시한다.
+raw_audio_recognition_config = speech_v2.RecognitionConfig(
+    explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
+        encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
+        sample_rate_hertz=STT_SAMPLE_RATE,
+        audio_channel_count=1,
+    ),
+    language_codes=["en-US"],
+    model="short",
+)
+
+speech_client: Optional[speech_v2.SpeechAsyncClient] = None
+speech_client_lock = threading.Lock()
+
+
+def get_speech_client() -> speech_v2.SpeechAsyncClient:
+    """
+    프로세스 전체가 공유하는 비동기 음성 인식 클라이언트를 반환한다.
+
+    클라이언트는 import 시점이 아니라 처음 호출될 때 서비스 계정 파일로 한 번 만들어지며,
+    요청 간에 gRPC 채널을 재사용한다.
+
+    Returns:
+        speech_v2.SpeechAsyncClient: 비동기 음성 인식 클라이언트
+    """
+
+    global speech_client
+
+    if speech_client is not None:
+        return speech_client
+
+    with speech_client_lock:
+        if speech_client is None:
+            speech_client = speech_v2.SpeechAsyncClient.from_service_account_file(
+                STT_SERVICE_ACCOUNT_FILE
+            )
+
+    return speech_client
+
+
+async def close_speech_client() -> None:
+    """
+    공유 음성 인식 클라이언트의 gRPC 채널을 닫는다.
+    """
+
+    global speech_client
+
+    with speech_client_lock:
+        client, speech_client = speech_client, None
+
+    if client is not None:
+        await client.transport.close()
@@ -2,6 +2,8 @@
 예외처리와 에러 응답을 생성하는 모듈
 """
 
+from typing import Any, Dict
+
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -9,6 +11,30 @@ from app.core.exceptions import CustomException
 from app.settings.constants import HTTP_STATUS_CODE, HTTP_STATUS_MESSAGE
 
 
+def create_error_content(
+    status_code: int, message: str, attribute: str, reason: str
+) -> Dict[str, Any]:
+    """
+    규격화된 에러 응답의 본문을 생성한다. WebSocket 메시지에도 같은 형식을 사용한다.
+
+    Args:
+        status_code (int): HTTP 응답 상태코드
+        message (str): HTTP 관련 메시지
+        attribute (str): 에러와 관련된 속성
+        reason (str): 에러 발생 사유
+
+    Returns:
+        Dict[str, Any]: 에러 정보를 담고 있는 딕셔너리
+    """
+
+    return {
+        "status": "error",
+        "code": status_code,
+        "message": message,
+        "details": {"attribute": attribute, "reason": reason},
+    }
+
+
 def create_error_response(
     status_code: int, message: str, attribute: str, reason: str
 ) -> JSONResponse:
@@ -27,12 +53,7 @@ def create_error_response(
 
     return JSONResponse(
         status_code=status_code,
-        content={
-            "status": "error",
-            "code": status_code,
-            "message": message,
-            "details": {"attribute": attribute, "reason": reason},
-        },
+        content=create_error_content(status_code, message, attribute, reason),
     )
 
 
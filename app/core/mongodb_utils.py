@@ -2,31 +2,81 @@
 MongoDB 관련 모듈
 """
 
+import itertools
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Iterator, List
 
-from pymongo import MongoClient
+from pymongo import ASCENDING, MongoClient
 from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure
 import pandas as pd
 
-from app.settings.constants import MONGODB_URI, MONGODB_DB_NAME
+from app.settings.constants import (
+    MONGODB_URI,
+    MONGODB_DB_NAME,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_CONNECT_TIMEOUT_MS,
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+    MONGODB_SOCKET_TIMEOUT_MS,
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+)
 
+mongodb_client: Optional[MongoClient] = None
+mongodb_client_lock = threading.Lock()
 
-def get_mongodb_client() -> Optional[MongoClient]:
+
+def get_mongodb_client() -> MongoClient:
     """
-    MongoDB 데이터베이스와 연결할 수 있는 클라이언트를 반환한다.
+    프로세스 전체가 공유하는 MongoDB 클라이언트를 반환한다.
+
+    클라이언트는 처음 호출될 때 한 번 만들어지며, 커넥션 풀을 통해 요청 간에 연결을 재사용한다.
+    FastAPI 엔드포인트에서는 Depends(get_mongodb_client)로 주입받는다.
 
     Returns:
-        MongoClient 혹은 None: MongoDB 데이터베이스 연결이 성공적인 경우 MongoClient, 실패인 경우는 None
+        MongoClient: 공유 MongoDB 클라이언트
+
+    Raises:
+        ServerSelectionTimeoutError, ConnectionFailure: 클라이언트를 만들지 못한 경우
     """
 
-    try:
-        mongodb_client = MongoClient(MONGODB_URI)
+    global mongodb_client
 
+    if mongodb_client is not None:
         return mongodb_client
-    except (ServerSelectionTimeoutError, ConnectionFailure) as exc:
-        logging.error("Failed to connect to MongoDB")
-        raise
+
+    with mongodb_client_lock:
+        if mongodb_client is not None:
+            return mongodb_client
+
+        try:
+            mongodb_client = MongoClient(
+                MONGODB_URI,
+                maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                minPoolSize=MONGODB_MIN_POOL_SIZE,
+                connectTimeoutMS=MONGODB_CONNECT_TIMEOUT_MS,
+                serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                socketTimeoutMS=MONGODB_SOCKET_TIMEOUT_MS,
+                waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            )
+
+            return mongodb_client
+        except (ServerSelectionTimeoutError, ConnectionFailure):
+            logging.error("Failed to connect to MongoDB")
+            raise
+
+
+def close_mongodb_client() -> None:
+    """
+    공유 MongoDB 클라이언트의 연결을 모두 닫는다. 어플리케이션 종료 시 호출한다.
+    """
+
+    global mongodb_client
+
+    with mongodb_client_lock:
+        if mongodb_client is not None:
+            mongodb_client.close()
+            mongodb_client = None
 
 
 def get_collection(
@@ -64,6 +114,49 @@ def get_collection(
         return None
 
 
+def iter_document_chunks(
+    client: MongoClient,
+    collection_name: str,
+    filters: Optional[Dict] = None,
+    projection: Optional[Dict[str, int]] = None,
+    chunk_size: int = 1000,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    MongoDB 컬렉션의 문서를 _id 순서로 chunk_size개씩 나누어 반환한다.
+
+    get_collection과 달리 전체 문서를 한 번에 메모리에 올리지 않으며,
+    projection으로 필요한 필드만 가져온다. 오류는 호출하는 쪽에서 처리하도록 그대로 전달한다.
+
+    Args:
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        collection_name (str): 데이터를 가져올 컬렉션 이름
+        filters (dict, optional): 데이터 추출 시 적용할 필터, 기본값은 None
+        projection (Dict[str, int], optional): 가져올 필드, 기본값은 None (모든 필드)
+        chunk_size (int): 한 번에 반환할 문서 수 (커서의 batch_size로도 사용)
+
+    Returns:
+        Iterator[List[Dict[str, Any]]]: 최대 chunk_size개의 문서가 담긴 목록
+    """
+
+    collection = client[MONGODB_DB_NAME][collection_name]
+    cursor = (
+        collection.find(filters or {}, projection)
+        .sort("_id", ASCENDING)
+        .batch_size(chunk_size)
+    )
+
+    try:
+        while True:
+            chunk = list(itertools.islice(cursor, chunk_size))
+
+            if not chunk:
+                return
+
+            yield chunk
+    finally:
+        cursor.close()
+
+
 def insert_document(
     client: MongoClient, collection_name: str, document: Dict[str, Any]
 ) -> Optional[str]:
@@ -98,3 +191,30 @@ def insert_document(
         logging.error(f"An error occurred while inserting data into MongoDB: {e}")
 
         return None
+
+
+def insert_documents(
+    client: MongoClient, collection_name: str, documents: List[Dict[str, Any]]
+) -> int:
+    """
+    MongoDB 컬렉션에 여러 문서를 순서와 상관없이 한 번에 추가한다.
+
+    재시도 여부는 호출하는 쪽에서 판단할 수 있도록 예외를 그대로 전달한다.
+
+    Args:
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        collection_name (str): 문서를 추가할 컬렉션의 이름
+        documents (List[Dict[str, Any]]): 추가할 문서 목록
+
+    Returns:
+        int: 추가된 문서의 수
+
+    Raises:
+        BulkWriteError: 일부 문서를 추가하지 못한 경우
+        PyMongoError: 그 밖의 MongoDB 오류가 발생한 경우
+    """
+
+    collection = client[MONGODB_DB_NAME][collection_name]
+    insert_result = collection.insert_many(documents, ordered=False)
+
+    return len(insert_result.inserted_ids)
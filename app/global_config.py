@@ -1,30 +1,378 @@
+"""
+어플리케이션이 공유하는 모델과 코퍼스를 불러오고 보관하는 모듈
+
+모델과 코퍼스는 import 시점이 아니라 어플리케이션의 lifespan에서 백그라운드로 불러온다.
+불러오기를 마치기 전에는 get_model_instance, get_corpus_holder가 503 CustomException을 발생시킨다.
+sentence_transformers(torch), pandas, pymongo는 불러올 때 import하므로,
+단어 추론 라우터를 사용하지 않는 워커는 이 모듈을 import해도 비용을 치르지 않는다.
+
+모델 버전별 문장 인코더와 코퍼스는 model_registry에 보관한다. 시작할 때는 기본 버전
+(MODEL_VERSION_DEFAULT)만 불러오며, 다른 버전은 요청되거나 관리자 API로 교체할 때 불러온다.
+MODEL_ARTIFACT_BACKEND가 설정되어 있으면 모델 파일을 불러오기 전에 저장소에서 받아 온다.
+"""
+
 import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from app.core.exceptions import CustomException
+from app.services.model_artifacts import get_model_revision, model_artifact_manager
+from app.services.model_registry import ModelBundle, ModelRegistry
+from app.settings.constants import (
+    CORPUS_CACHE_DIR,
+    HTTP_STATUS_CODE,
+    HTTP_STATUS_MESSAGE,
+    INFERENCE_POOL_KIND,
+    MODEL_ENCODER_BACKEND,
+    MODEL_LOAD_RETRY_SECONDS,
+    MODEL_MAX_RESIDENT_VERSIONS,
+    MODEL_ONNX_QUANTIZE,
+    MODEL_ROOT,
+    MODEL_VERSION_DEFAULT,
+)
+
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+
+    from app.services.corpus_sync import CorpusHolder
+
+STARTUP_STATE_PENDING = "pending"
+STARTUP_STATE_FETCHING_MODEL = "fetching_model"
+STARTUP_STATE_LOADING_MODEL = "loading_model"
+STARTUP_STATE_LOADING_CORPUS = "loading_corpus"
+STARTUP_STATE_READY = "ready"
+STARTUP_STATE_FAILED = "failed"
+
+startup_state = STARTUP_STATE_PENDING
+startup_error: Optional[str] = None
+startup_seconds: Optional[float] = None
+
+
+def check_inference_pool_kind(kind: str = INFERENCE_POOL_KIND) -> None:
+    """
+    단어 추론에 사용할 수 없는 작업 풀 종류이면 예외를 발생시킨다.
+
+    모델 버전은 model_registry가 실행 중에 불러오고 코퍼스도 주기적으로 동기화되지만,
+    프로세스 풀의 작업자는 fork된 시점의 상태만 보며, torch를 불러온 뒤의 fork도 안전하지 않다.
+
+    Args:
+        kind (str): 작업 풀 종류
+
+    Raises:
+        ValueError: 작업 풀 종류가 "thread"가 아닌 경우
+    """
+
+    if kind != "thread":
+        raise ValueError(
+            f"INFERENCE_POOL_KIND={kind} is not supported by the model routers"
+        )
+
+
+def create_not_ready_exception(attribute: str) -> CustomException:
+    """
+    모델이나 코퍼스를 아직 불러오지 못했을 때 반환할 예외를 만든다.
+
+    Args:
+        attribute (str): 아직 준비되지 않은 속성 ("model" 혹은 "corpus")
+
+    Returns:
+        CustomException: 503 상태 코드의 CustomException
+    """
+
+    if startup_state == STARTUP_STATE_FAILED:
+        reason = "The server failed to load its resources. Please try again later."
+    else:
+        reason = "The server is starting up. Please try again in a moment."
+
+    return CustomException(
+        status_code=HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"],
+        message=HTTP_STATUS_MESSAGE["SERVICE_UNAVAILABLE"],
+        attribute=attribute,
+        reason=reason,
+    )
+
+
+def get_model_bundle(
+    model_version: Optional[str] = None, attribute: str = "model"
+) -> ModelBundle:
+    """
+    모델 버전의 문장 인코더와 코퍼스 묶음을 반환한다.
+
+    기본 버전을 아직 불러오지 못했다면 503 예외를 발생시킨다.
+    다른 버전이 메모리에 없다면 백그라운드로 불러오기 시작하고 503 예외를 발생시킨다.
+
+    Args:
+        model_version (Optional[str]): 모델 버전, None이면 기본 버전
+        attribute (str): 기본 버전을 불러오기 전일 때 예외에 담을 속성
+
+    Returns:
+        ModelBundle: 모델 버전의 문장 인코더와 코퍼스 묶음
+    """
+
+    if model_version in (None, model_registry.default_version):
+        bundle = model_registry.find()
+
+        if bundle is None:
+            raise create_not_ready_exception(attribute)
+
+        return bundle
+
+    return model_registry.get(model_version)
+
+
+def get_model_instance() -> Any:
+    """
+    기본 버전의 문장 인코더를 반환한다. 아직 불러오지 못했다면 503 예외를 발생시킨다.
+
+    Returns:
+        Any: 문장 인코더 (SentenceTransformer)
+    """
+
+    return get_model_bundle(attribute="model").model
+
+
+def get_corpus_holder() -> "CorpusHolder":
+    """
+    기본 버전의 코퍼스 스냅샷을 보관하는 객체를 반환한다. 아직 불러오지 못했다면 503 예외를 발생시킨다.
+
+    Returns:
+        CorpusHolder: 현재 코퍼스 스냅샷을 보관하는 객체
+    """
+
+    return get_model_bundle(attribute="corpus").corpus_holder
+
+
+def is_ready() -> bool:
+    return startup_state == STARTUP_STATE_READY
+
+
+def ensure_ready() -> None:
+    """
+    모델과 코퍼스를 모두 불러오지 않았다면 503 예외를 발생시킨다.
+
+    작업을 추론 풀에 넘기기 전에 호출해, 준비되지 않은 요청을 대기열에 넣지 않고 곧바로 거절한다.
+    """
+
+    if not is_ready():
+        raise create_not_ready_exception(
+            "model" if model_registry.find() is None else "corpus"
+        )
+
+
+def get_startup_status() -> Dict[str, Any]:
+    """
+    불러오기 진행 상태를 반환한다.
+
+    Returns:
+        Dict[str, Any]: 상태, 실패한 경우 에러 종류, 준비를 마치기까지 걸린 시간 (초)
+    """
+
+    return {
+        "state": startup_state,
+        "error": startup_error,
+        "startup_seconds": startup_seconds,
+    }
+
+
+def get_model_path(model_version: str) -> str:
+    return os.path.join(MODEL_ROOT, model_version)
+
+
+def is_model_version_available(model_version: str) -> bool:
+    """
+    모델 버전이 로컬에 있거나 저장소에 있다고 확인된 적이 있는지 확인한다.
+
+    요청 처리 중에 호출되므로 저장소에 묻지 않는다. 저장소에만 있는 버전은
+    관리자 API가 model_artifact_manager.exists로 확인한 뒤부터 사용할 수 있다.
+
+    Args:
+        model_version (str): 모델 버전
+
+    Returns:
+        bool: 사용할 수 있는 버전이면 True
+    """
 
-from sentence_transformers import SentenceTransformer
-from app.core.mongodb_utils import get_mongodb_client, get_collection
+    if model_version in model_artifact_manager.remote_versions:
+        return True
 
-from app.settings.constants import MODEL_LOCAL
+    return os.path.isdir(get_model_path(model_version))
 
-from huggingface_hub.utils._errors import RepositoryNotFoundError
 
-try:
-    model_instance = SentenceTransformer(MODEL_LOCAL)
-except RepositoryNotFoundError:
-    logging.error(
-        "Failed to find the specificed repository. Please check the model name."
+def fetch_model_artifacts(model_version: str) -> None:
+    """
+    모델 버전의 파일을 저장소에서 받아 MODEL_ROOT/<버전>에 준비한다.
+    확인된 로컬 복사본이 있거나 저장소를 설정하지 않았다면 아무것도 받지 않는다.
+
+    Args:
+        model_version (str): 모델 버전
+    """
+
+    model_artifact_manager.ensure(model_version)
+
+
+def create_model_instance(model_version: str = MODEL_VERSION_DEFAULT) -> Any:
+    """
+    모델 버전의 문장 인코더를 MODEL_ENCODER_BACKEND의 실행 방식으로 불러온다.
+
+    Args:
+        model_version (str): 모델 버전 (MODEL_ROOT 아래의 디렉터리 이름)
+
+    Returns:
+        Any: 문장 인코더 (SentenceTransformer 혹은 OnnxSentenceEncoder)
+    """
+
+    if MODEL_ENCODER_BACKEND == "onnx":
+        from app.services.onnx_encoder import create_onnx_encoder
+
+        return create_onnx_encoder(get_model_path(model_version), MODEL_ONNX_QUANTIZE)
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(get_model_path(model_version))
+
+
+def get_embedding_version(model_version: str) -> str:
+    """
+    코퍼스 임베딩 캐시에 기록할 버전을 반환한다.
+
+    같은 버전을 다시 올린 경우를 구분하기 위해 받은 모델의 리비전을 붙이고,
+    ONNX, int8 양자화 모델의 임베딩은 PyTorch 모델과 조금 다르므로 실행 방식별로 캐시를 나눈다.
+
+    Args:
+        model_version (str): 모델 버전
+
+    Returns:
+        str: 모델 버전과 리비전, 실행 방식을 합친 버전
+    """
+
+    revision = get_model_revision(get_model_path(model_version))
+    embedding_version = f"{model_version}@{revision}" if revision else model_version
+
+    if MODEL_ENCODER_BACKEND != "onnx":
+        return embedding_version
+
+    return f"{embedding_version}-onnx{'-int8' if MODEL_ONNX_QUANTIZE else ''}"
+
+
+def create_model_bundle(
+    model_version: str, model: Any, mongodb_client: "MongoClient"
+) -> ModelBundle:
+    """
+    문장 인코더로 코퍼스를 인코딩해 모델 버전의 묶음을 만든다.
+
+    Args:
+        model_version (str): 모델 버전
+        model (Any): 문장 인코더 (SentenceTransformer)
+        mongodb_client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+
+    Returns:
+        ModelBundle: 모델 버전의 문장 인코더와 코퍼스 묶음
+    """
+
+    from app.services import model_inference
+    from app.services.corpus_loader import load_corpus_snapshot
+    from app.services.corpus_sync import CorpusHolder
+
+    corpus_holder = CorpusHolder(
+        load_corpus_snapshot(
+            mongodb_client,
+            model,
+            CORPUS_CACHE_DIR,
+            get_embedding_version(model_version),
+        )
     )
-except ImportError:
-    logging.error("Failed to import model_instance from app.")
-except Exception:
-    logging.error("An unexpected error occurred.")
-
-try:
-    mongodb_client = get_mongodb_client()
-    corpus_df = get_collection(mongodb_client, "training_data")
-except Exception:
-    logging.error("An unexpected error occurred.")
-
-try:
-    corpus_embeddings = model_instance.encode(corpus_df.description)
-except Exception:
-    logging.error("An unexpected error occurred.")
+
+    return model_inference.create_model_bundle(model_version, model, corpus_holder)
+
+
+def load_model_bundle(model_version: str) -> ModelBundle:
+    """
+    모델 버전의 문장 인코더를 불러오고 코퍼스를 인코딩한다. model_registry가 백그라운드로 실행한다.
+
+    Args:
+        model_version (str): 모델 버전
+
+    Returns:
+        ModelBundle: 모델 버전의 문장 인코더와 코퍼스 묶음
+    """
+
+    from app.core.mongodb_utils import get_mongodb_client
+
+    fetch_model_artifacts(model_version)
+
+    return create_model_bundle(
+        model_version, create_model_instance(model_version), get_mongodb_client()
+    )
+
+
+def create_model_registry() -> ModelRegistry:
+    return ModelRegistry(
+        load_model_bundle,
+        MODEL_VERSION_DEFAULT,
+        MODEL_MAX_RESIDENT_VERSIONS,
+        is_model_version_available,
+        MODEL_LOAD_RETRY_SECONDS,
+    )
+
+
+def skip_loading() -> None:
+    """
+    모델과 코퍼스가 필요한 라우터가 없는 워커에서, 불러오지 않고 준비 상태로 바꾼다.
+    """
+
+    global startup_state
+
+    startup_state = STARTUP_STATE_READY
+
+
+def load_resources(mongodb_client: "MongoClient") -> bool:
+    """
+    기본 버전의 문장 인코더를 불러오고 코퍼스를 인코딩해 model_registry에 등록한다.
+
+    블로킹 작업이므로 lifespan에서 asyncio.to_thread로 실행한다.
+    실패하면 에러를 기록하고 상태를 STARTUP_STATE_FAILED로 바꾼다.
+
+    Args:
+        mongodb_client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+
+    Returns:
+        bool: 불러오기에 성공한 경우 True
+    """
+
+    global startup_state, startup_error, startup_seconds
+
+    from huggingface_hub.utils._errors import RepositoryNotFoundError
+
+    model_version = model_registry.default_version
+    started_at = time.perf_counter()
+
+    try:
+        startup_state = STARTUP_STATE_FETCHING_MODEL
+        fetch_model_artifacts(model_version)
+
+        startup_state = STARTUP_STATE_LOADING_MODEL
+        model = create_model_instance(model_version)
+
+        startup_state = STARTUP_STATE_LOADING_CORPUS
+        model_registry.add(create_model_bundle(model_version, model, mongodb_client))
+    except RepositoryNotFoundError as exc:
+        logging.exception(
+            "Failed to find the specified model repository: %s",
+            get_model_path(model_version),
+        )
+        startup_state, startup_error = STARTUP_STATE_FAILED, type(exc).__name__
+        return False
+    except Exception as exc:
+        logging.exception("Failed to load the model and corpus (%s)", startup_state)
+        startup_state, startup_error = STARTUP_STATE_FAILED, type(exc).__name__
+        return False
+
+    startup_seconds = time.perf_counter() - started_at
+    startup_state = STARTUP_STATE_READY
+    logging.info("Loaded the model and corpus in %.2fs", startup_seconds)
+
+    return True
+
+
+model_registry = create_model_registry()
@@ -1,8 +1,15 @@
 """
 어플리케이션의 메인 모듈
+
+ENABLED_ROUTERS에 있는 라우터만 import하므로, 라우터 하나만 제공하는 워커는
+다른 라우터의 의존성(google-cloud-speech, sentence-transformers, pandas, pymongo 등)을 import하지 않는다.
 """
 
+import asyncio
+import importlib
 import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, List
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -12,13 +19,128 @@ from app.core.exceptions import CustomException
 from app.core.exception_handlers import custom_exception_handler
 
 from app import global_config
-from app.routers import transcriptions, predictions
+from app.routers import health
+
+from app.settings.constants import (
+    ALLOWED_ORIGINS,
+    CORPUS_SYNC_INTERVAL_SECONDS,
+    ENABLED_ROUTERS,
+)
 
-from app.settings.constants import ALLOWED_ORIGINS
+if TYPE_CHECKING:
+    from pymongo import MongoClient
 
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI()
+ROUTER_MODULES = {
+    "transcriptions": "app.routers.transcriptions",
+    "predictions": "app.routers.predictions",
+    "admin": "app.routers.admin",
+    "voice_predictions": "app.routers.voice_predictions",
+}
+
+# 단어 추론 모델과 코퍼스가 필요한 라우터
+MODEL_ROUTERS = {"predictions", "admin", "voice_predictions"}
+
+# 음성 인식 클라이언트를 사용하는 라우터
+SPEECH_ROUTERS = {"transcriptions", "voice_predictions"}
+
+
+def get_enabled_routers() -> List[str]:
+    """
+    ENABLED_ROUTERS에서 공백과 빈 항목을 제외한 라우터 이름 목록을 반환한다.
+
+    Returns:
+        List[str]: 라우터 이름 목록
+    """
+
+    enabled_routers = [name.strip() for name in ENABLED_ROUTERS if name.strip()]
+    unknown_routers = set(enabled_routers) - set(ROUTER_MODULES)
+
+    if unknown_routers:
+        raise ValueError(f"Unknown routers in ENABLED_ROUTERS: {unknown_routers}")
+
+    return enabled_routers
+
+
+enabled_routers = get_enabled_routers()
+uses_model = any(name in MODEL_ROUTERS for name in enabled_routers)
+uses_speech = any(name in SPEECH_ROUTERS for name in enabled_routers)
+
+if uses_model:
+    global_config.check_inference_pool_kind()
+
+
+async def load_and_sync_corpus(mongodb_client: "MongoClient") -> None:
+    """
+    모델과 코퍼스를 백그라운드로 불러온 뒤, 성공하면 주기적인 코퍼스 동기화를 시작한다.
+
+    Args:
+        mongodb_client (MongoClient): 어플리케이션이 공유하는 MongoDB 클라이언트
+    """
+
+    from app.services.corpus_sync import run_corpus_sync
+
+    loaded = await asyncio.to_thread(global_config.load_resources, mongodb_client)
+
+    if loaded and CORPUS_SYNC_INTERVAL_SECONDS > 0:
+        await run_corpus_sync(
+            global_config.model_registry.list_bundles,
+            mongodb_client,
+            CORPUS_SYNC_INTERVAL_SECONDS,
+        )
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    어플리케이션 시작 시 공유 MongoDB 클라이언트를 준비하고, 모델과 코퍼스를 백그라운드로 불러온다.
+    불러오는 동안에도 요청을 받으며, 준비 여부는 /readyz로 확인한다.
+    종료 시 작업을 정리하고 MongoDB 연결과 음성 인식 클라이언트의 채널을 닫는다.
+
+    모델과 코퍼스가 필요한 라우터가 없는 워커는 아무것도 불러오지 않고 곧바로 준비 상태가 된다.
+
+    Args:
+        _ (FastAPI): FastAPI 어플리케이션 객체
+    """
+
+    background_tasks = []
+
+    if uses_model:
+        from app.core.mongodb_utils import get_mongodb_client
+
+        mongodb_client = get_mongodb_client()
+        global_config.model_registry.bind_loop(asyncio.get_running_loop())
+        background_tasks.append(
+            asyncio.create_task(load_and_sync_corpus(mongodb_client))
+        )
+    else:
+        global_config.skip_loading()
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+    if uses_speech:
+        from app.core.config import close_speech_client
+
+        await close_speech_client()
+
+    if uses_model:
+        from app.core.mongodb_utils import close_mongodb_client
+        from app.services.feedback_writer import feedback_writer
+        from app.services.model_inference import inference_pool
+
+        await global_config.model_registry.close()
+        inference_pool.shutdown()
+        await feedback_writer.close()
+        close_mongodb_client()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,5 +153,7 @@ app.add_middleware(
 app.add_exception_handler(CustomException, custom_exception_handler)
 app.add_exception_handler(RequestValidationError, custom_exception_handler)
 
-app.include_router(transcriptions.router)
-app.include_router(predictions.router)
+app.include_router(health.router)
+
+for router_name in enabled_routers:
+    app.include_router(importlib.import_module(ROUTER_MODULES[router_name]).router)
@@ -0,0 +1,244 @@
+"""
+서버 운영 관련 엔드포인트
+"""
+
+import asyncio
+import secrets
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import JSONResponse
+from pymongo import MongoClient
+
+from app.api.models import (
+    CorpusSyncResponse,
+    MetricsResponse,
+    ModelActivationResponse,
+    ModelRegistryResponse,
+)
+from app.core.exceptions import CustomException
+from app.settings.constants import (
+    ADMIN_API_KEY,
+    HTTP_STATUS_CODE,
+    HTTP_STATUS_MESSAGE,
+    MODEL_API_VERSION_LATEST,
+)
+
+from app import global_config
+from app.core.mongodb_utils import get_mongodb_client
+from app.services.corpus_sync import sync_corpus
+from app.services.feedback_writer import feedback_writer
+from app.services.model_artifacts import model_artifact_manager
+from app.services.model_inference import inference_pool
+from app.services.model_registry import (
+    MODEL_VERSION_PATTERN,
+    create_model_version_not_found_exception,
+)
+
+router = APIRouter(prefix=f"/api/{MODEL_API_VERSION_LATEST}/admin")
+
+
+def verify_admin_key(x_admin_key: str = Header(default="")) -> None:
+    """
+    요청 헤더의 관리자 키를 검증한다. ADMIN_API_KEY가 설정되지 않은 경우 모든 요청을 거부한다.
+
+    Args:
+        x_admin_key (str): X-Admin-Key 헤더 값
+    """
+
+    if not ADMIN_API_KEY or not secrets.compare_digest(x_admin_key, ADMIN_API_KEY):
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["FORBIDDEN"],
+            message=HTTP_STATUS_MESSAGE["FORBIDDEN"],
+            attribute="X-Admin-Key",
+            reason="The admin key is missing or invalid.",
+        )
+
+
+@router.post(
+    "/corpus/sync",
+    response_model=CorpusSyncResponse,
+    summary="코퍼스 동기화 API",
+    description="training_data 컬렉션에서 새로 추가되거나 변경된 문서를 코퍼스에 반영한다.",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin_key)],
+)
+async def create_corpus_sync(
+    mongodb_client: MongoClient = Depends(get_mongodb_client),
+) -> JSONResponse:
+    """
+    training_data 컬렉션의 변경 사항을 코퍼스에 반영한 결과를 반환한다.
+
+    Args:
+        mongodb_client (MongoClient): 어플리케이션이 공유하는 MongoDB 클라이언트
+
+    Returns:
+        JSONResponse: 추가된 문서 수, 변경된 문서 수, 동기화 후 코퍼스 크기
+    """
+
+    bundle = global_config.get_model_bundle(attribute="corpus")
+
+    try:
+        result = await asyncio.to_thread(
+            sync_corpus, bundle.corpus_holder, mongodb_client, bundle.model
+        )
+
+        return JSONResponse(
+            status_code=HTTP_STATUS_CODE["OK"],
+            content={
+                "status": "success",
+                "code": HTTP_STATUS_CODE["OK"],
+                "message": HTTP_STATUS_MESSAGE["OK"],
+                "data": result,
+            },
+        )
+    except CustomException as exc:
+        raise exc
+    except Exception as exc:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
+            message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
+            attribute="corpus",
+            reason="An error occurred while syncing the corpus. Please try again later.",
+        ) from exc
+
+
+def get_corpus_metrics() -> Optional[Dict[str, Any]]:
+    """
+    기본 버전의 현재 코퍼스 스냅샷의 크기, 버전, 메모리 사용량을 반환한다.
+
+    Returns:
+        Optional[Dict[str, Any]]: 코퍼스 지표, 코퍼스를 아직 불러오지 못한 경우는 None
+    """
+
+    bundle = global_config.model_registry.find()
+
+    if bundle is None:
+        return None
+
+    corpus = bundle.corpus_holder.get()
+
+    return {
+        "size": corpus.size,
+        "version": corpus.version,
+        "embedding_dtype": corpus.store.embeddings.dtype.name,
+        "memory_bytes": corpus.store.memory_usage(),
+    }
+
+
+@router.get(
+    "/metrics",
+    response_model=MetricsResponse,
+    summary="서버 지표 API",
+    description="시작 상태, 단어 추론 배치 크기 분포와 대기 시간, 피드백 저장 대기열, 코퍼스 메모리 사용량 등 서버 지표를 반환한다.",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin_key)],
+)
+async def get_metrics() -> JSONResponse:
+    """
+    서버 지표를 반환한다.
+
+    Returns:
+        JSONResponse: 서버 지표
+    """
+
+    bundle = global_config.model_registry.find()
+
+    return JSONResponse(
+        status_code=HTTP_STATUS_CODE["OK"],
+        content={
+            "status": "success",
+            "code": HTTP_STATUS_CODE["OK"],
+            "message": HTTP_STATUS_MESSAGE["OK"],
+            "data": {
+                "startup": global_config.get_startup_status(),
+                "models": global_config.model_registry.snapshot(),
+                "model_artifacts": model_artifact_manager.snapshot(),
+                "prediction_batcher": bundle
+                and {
+                    **bundle.query_batcher.metrics.snapshot(),
+                    "queue_size": bundle.query_batcher.queue_size,
+                },
+                "inference_pool": inference_pool.snapshot(),
+                "prediction_cache": bundle and bundle.prediction_cache.snapshot(),
+                "feedback_writer": feedback_writer.snapshot(),
+                "corpus": get_corpus_metrics(),
+            },
+        },
+    )
+
+
+@router.get(
+    "/models",
+    response_model=ModelRegistryResponse,
+    summary="모델 버전 목록 API",
+    description="기본 모델 버전과 메모리에 올라와 있거나 불러오는 중인 모델 버전을 반환한다.",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin_key)],
+)
+async def get_models() -> JSONResponse:
+    """
+    모델 레지스트리 상태를 반환한다.
+
+    Returns:
+        JSONResponse: 기본 버전, 메모리에 있는 버전, 불러오는 중인 버전, 불러오기에 실패한 버전
+    """
+
+    return JSONResponse(
+        status_code=HTTP_STATUS_CODE["OK"],
+        content={
+            "status": "success",
+            "code": HTTP_STATUS_CODE["OK"],
+            "message": HTTP_STATUS_MESSAGE["OK"],
+            "data": global_config.model_registry.snapshot(),
+        },
+    )
+
+
+@router.post(
+    "/models/{model_version}/activate",
+    response_model=ModelActivationResponse,
+    status_code=HTTP_STATUS_CODE["ACCEPTED"],
+    summary="기본 모델 버전 교체 API",
+    description="모델 버전을 백그라운드로 불러온 뒤 기본 버전으로 교체한다. 불러오는 동안에는 기존 버전으로 요청을 처리한다.",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin_key)],
+)
+async def activate_model(model_version: str) -> JSONResponse:
+    """
+    모델 버전을 기본 버전으로 교체하는 작업을 시작한다.
+
+    로컬에 없는 버전은 저장소에 있는지 확인한 뒤, 불러올 때 받아 온다.
+    교체가 끝났는지는 GET /admin/models의 default_version으로 확인한다.
+
+    Args:
+        model_version (str): 기본 버전으로 사용할 모델 버전
+
+    Returns:
+        JSONResponse: 교체할 모델 버전
+    """
+
+    registry = global_config.model_registry
+
+    if MODEL_VERSION_PATTERN.match(model_version) and not registry.is_valid(
+        model_version
+    ):
+        # 저장소에만 있는 버전인지 확인해, 있으면 받아 와서 불러올 수 있게 한다.
+        await asyncio.to_thread(model_artifact_manager.exists, model_version)
+
+    if not registry.is_valid(model_version):
+        raise create_model_version_not_found_exception(model_version)
+
+    # 요청이 끝나도 교체가 계속되도록 태스크로 실행하며, 실패는 레지스트리 상태에 기록된다.
+    activation = asyncio.ensure_future(registry.activate(model_version))
+    activation.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    return JSONResponse(
+        status_code=HTTP_STATUS_CODE["ACCEPTED"],
+        content={
+            "status": "success",
+            "code": HTTP_STATUS_CODE["ACCEPTED"],
+            "message": HTTP_STATUS_MESSAGE["ACCEPTED"],
+            "data": {"model_version": model_version},
+        },
+    )
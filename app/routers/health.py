@@ -0,0 +1,70 @@
+"""
+서버 상태 확인 관련 엔드포인트
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.api.models import HealthResponse
+from app.core.exceptions import CustomException
+from app.settings.constants import HTTP_STATUS_CODE, HTTP_STATUS_MESSAGE
+
+from app import global_config
+
+router = APIRouter()
+
+
+def create_status_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=HTTP_STATUS_CODE["OK"],
+        content={
+            "status": "success",
+            "code": HTTP_STATUS_CODE["OK"],
+            "message": HTTP_STATUS_MESSAGE["OK"],
+            "data": global_config.get_startup_status(),
+        },
+    )
+
+
+@router.get(
+    "/healthz",
+    response_model=HealthResponse,
+    summary="생존 확인 API",
+    description="프로세스가 요청에 응답할 수 있는지 확인한다. 모델과 코퍼스를 불러오는 중에도 바로 응답한다.",
+    tags=["health"],
+)
+async def get_health() -> JSONResponse:
+    """
+    프로세스가 살아 있으면 시작 상태와 함께 200을 반환한다.
+
+    Returns:
+        JSONResponse: 시작 상태
+    """
+
+    return create_status_response()
+
+
+@router.get(
+    "/readyz",
+    response_model=HealthResponse,
+    summary="준비 확인 API",
+    description="모델과 코퍼스 인덱스를 모두 불러와 단어 추론 요청을 처리할 수 있는지 확인한다.",
+    tags=["health"],
+)
+async def get_readiness() -> JSONResponse:
+    """
+    모델과 코퍼스 인덱스를 모두 불러왔으면 200을, 그렇지 않으면 503을 반환한다.
+
+    Returns:
+        JSONResponse: 시작 상태
+    """
+
+    if not global_config.is_ready():
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"],
+            message=HTTP_STATUS_MESSAGE["SERVICE_UNAVAILABLE"],
+            attribute="startup",
+            reason=f"The server is not ready yet (state: {global_config.startup_state}).",
+        )
+
+    return create_status_response()
@@ -3,45 +3,68 @@
 """
 
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
 from app.api.models import (
     PredictionCreate,
     PredictionResponse,
+    PredictionBatchCreate,
+    PredictionBatchResponse,
     FeedbackCreate,
     FeedbackResponse,
 )
+from app.api.utils import get_prediction_item_error, get_requested_model_version
 from app.core.exceptions import CustomException
 from app.settings.constants import (
     HTTP_STATUS_CODE,
     HTTP_STATUS_MESSAGE,
     MODEL_API_VERSION_LATEST,
+    PREDICTION_BATCH_MAX_ITEMS,
 )
 
-from app.core.mongodb_utils import get_mongodb_client, insert_document
-
-from app.services.model_inference import get_predictions
+from app import global_config
+from app.services.feedback_writer import feedback_writer
+from app.services.model_inference import (
+    get_bundle_predictor,
+    inference_pool,
+    predict,
+)
 
 router = APIRouter(prefix=f"/api/{MODEL_API_VERSION_LATEST}")
 
+MODEL_VERSION_PREFIX = "/models/{model_version}"
+
 
 @router.post(
     "/predictions",
     response_model=PredictionResponse,
     summary="단어 추론 API",
-    description="사용자의 설명에 가장 가까운 단어를 반환한다.",
+    description="사용자의 설명에 가장 가까운 단어를 반환한다. X-Model-Version 헤더로 모델 버전을 지정할 수 있다.",
+    tags=["predictions"],
+)
+@router.post(
+    f"{MODEL_VERSION_PREFIX}/predictions",
+    response_model=PredictionResponse,
+    summary="모델 버전별 단어 추론 API",
+    description="지정한 모델 버전으로 사용자의 설명에 가장 가까운 단어를 반환한다.",
     tags=["predictions"],
 )
-async def create_prediction(description: PredictionCreate) -> JSONResponse:
+async def create_prediction(
+    description: PredictionCreate, request: Request
+) -> JSONResponse:
     """
     단어 추론 결과를 반환한다.
 
+    모델 버전을 지정하지 않으면 기본 버전으로 추론한다.
+    지정한 버전이 없으면 404, 메모리에 올라와 있지 않으면 불러오기를 시작하고 503으로 응답한다.
+
     Args:
         description (PredictionCreate): 단어에 대한 설명
+        request (Request): 경로나 X-Model-Version 헤더로 모델 버전을 지정한 요청
 
     Returns:
-        JSONResponse: 단어 추론 결과
+        JSONResponse: 단어 추론 결과와 추론에 사용한 모델 버전
     """
 
     query = description.description
@@ -54,8 +77,98 @@ async def create_prediction(description: PredictionCreate) -> JSONResponse:
             reason="The description is empty. Please check the data and resend it.",
         )
 
+    bundle = global_config.get_model_bundle(get_requested_model_version(request))
+
+    try:
+        predictions = await predict(query, bundle=bundle)
+
+        return JSONResponse(
+            status_code=HTTP_STATUS_CODE["OK"],
+            content={
+                "status": "success",
+                "code": HTTP_STATUS_CODE["OK"],
+                "message": HTTP_STATUS_MESSAGE["OK"],
+                "data": {"predictions": predictions, "model_version": bundle.version},
+            },
+        )
+    except CustomException as exc:
+        raise exc
+    except Exception as exc:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
+            message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
+            attribute="model",
+            reason="An error occurred while performing model inference. Please try again later.",
+        ) from exc
+
+
+@router.post(
+    "/predictions/batch",
+    response_model=PredictionBatchResponse,
+    summary="단어 추론 배치 API",
+    description="여러 설명 각각에 가장 가까운 단어를 요청 순서대로 반환한다. X-Model-Version 헤더로 모델 버전을 지정할 수 있다.",
+    tags=["predictions"],
+)
+@router.post(
+    f"{MODEL_VERSION_PREFIX}/predictions/batch",
+    response_model=PredictionBatchResponse,
+    summary="모델 버전별 단어 추론 배치 API",
+    description="지정한 모델 버전으로 여러 설명 각각에 가장 가까운 단어를 요청 순서대로 반환한다.",
+    tags=["predictions"],
+)
+async def create_batch_prediction(
+    batch: PredictionBatchCreate, request: Request
+) -> JSONResponse:
+    """
+    여러 설명에 대한 단어 추론 결과를 요청 순서대로 반환한다.
+
+    유효한 설명은 한 번의 배치 추론으로 처리하고,
+    유효하지 않은 설명은 해당 위치에 에러 정보를 담는다.
+
+    Args:
+        batch (PredictionBatchCreate): 단어에 대한 설명 목록
+        request (Request): 경로나 X-Model-Version 헤더로 모델 버전을 지정한 요청
+
+    Returns:
+        JSONResponse: 설명별 단어 추론 결과 혹은 에러와 추론에 사용한 모델 버전
+    """
+
+    if not 1 <= len(batch.items) <= PREDICTION_BATCH_MAX_ITEMS:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
+            message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
+            attribute="items",
+            reason=f"The items should contain between 1 and {PREDICTION_BATCH_MAX_ITEMS} descriptions.",
+        )
+
+    global_config.ensure_ready()
+    bundle = global_config.get_model_bundle(get_requested_model_version(request))
+
+    results = [None] * len(batch.items)
+    valid_positions = []
+
+    for position, item in enumerate(batch.items):
+        item_error = get_prediction_item_error(item.description, item.top_k)
+
+        if item_error:
+            attribute, reason = item_error
+            results[position] = {
+                "status": "error",
+                "details": {"attribute": attribute, "reason": reason},
+            }
+        else:
+            valid_positions.append(position)
+
     try:
-        predictions = get_predictions(query)
+        if valid_positions:
+            batch_predictions = await inference_pool.run(
+                get_bundle_predictor(bundle),
+                [batch.items[position].description for position in valid_positions],
+                [batch.items[position].top_k for position in valid_positions],
+            )
+
+            for position, predictions in zip(valid_positions, batch_predictions):
+                results[position] = {"status": "success", "predictions": predictions}
 
         return JSONResponse(
             status_code=HTTP_STATUS_CODE["OK"],
@@ -63,7 +176,7 @@ async def create_prediction(description: PredictionCreate) -> JSONResponse:
                 "status": "success",
                 "code": HTTP_STATUS_CODE["OK"],
                 "message": HTTP_STATUS_MESSAGE["OK"],
-                "data": {"predictions": predictions},
+                "data": {"results": results, "model_version": bundle.version},
             },
         )
     except CustomException as exc:
@@ -88,6 +201,8 @@ async def create_feedback(feedback: FeedbackCreate) -> JSONResponse:
     """
     단어 추론 결과에 대한 사용자의 피드백을 처리한다.
 
+    피드백은 저장 대기열에 넣은 뒤 곧바로 응답하며, 실제 저장은 백그라운드에서 모아서 한다.
+
     Args:
         feedback (FeedbackCreate): 사용자가 제공한 피드백
 
@@ -104,19 +219,7 @@ async def create_feedback(feedback: FeedbackCreate) -> JSONResponse:
         )
 
     try:
-        mongodb_client = get_mongodb_client()
-    except Exception as exc:
-        raise CustomException(
-            status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
-            message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
-            attribute="mongodb",
-            reason="An internal error occurred while connecting to MongoDB. Please try again later.",
-        ) from exc
-
-    try:
-        created_id = insert_document(
-            mongodb_client,
-            "feedback_data",
+        created_id = feedback_writer.submit(
             {
                 "description": feedback.description,
                 "user_input": feedback.user_input,
@@ -145,5 +248,3 @@ async def create_feedback(feedback: FeedbackCreate) -> JSONResponse:
             attribute="general",
             reason="An internal error occurred while processing your feeback. Please try again later.",
         ) from exc
-    finally:
-        mongodb_client.close()
@@ -2,67 +2,127 @@
 음성 인식 관련 엔드포인트
 """
 
-import base64
-from fastapi import APIRouter
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect, status
 from fastapi.responses import JSONResponse
 
-from google.cloud import speech_v2
-from google.api_core.exceptions import GoogleAPIError
+from google.api_core.exceptions import DeadlineExceeded, GoogleAPIError
 
 from app.api.models import TranscriptionCreate, TranscriptionResponse
 from app.core.exceptions import CustomException
-from app.api.utils import is_audio_content_valid
+from app.core.exception_handlers import create_error_content
+from app.api.utils import decode_audio_content, read_audio_body
 
-from app.core.config import speech_recognition_config
+from app.services.audio_preprocessor import audio_preprocessor
+from app.services.speech_recognizer import speech_recognizer
+from app.services.transcription_cache import transcription_cache
 from app.settings.constants import *
 
 router = APIRouter(prefix=f"/api/{STT_API_VERSION_LATEST}")
 
-client = speech_v2.SpeechClient.from_service_account_file("app/settings/key.json")
 
+# 음성 데이터 본문으로 받는 Content-Type
+WAV_CONTENT_TYPES = {"audio/wav", "audio/wave", "audio/x-wav", "audio/vnd.wave"}
 
-@router.post(
-    "/transcriptions",
-    response_model=TranscriptionResponse,
-    description="음성 인식 API",
-    tags=["transcriptions"],
+# 음성 데이터를 본문으로 받는 엔드포인트의 OpenAPI 요청 본문 명세
+WAV_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"audio/wav": {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
+
+# 스트리밍 음성 인식에서 클라이언트가 음성 전송을 마쳤음을 알리는 텍스트 메시지
+STREAM_END_MESSAGE = "end"
+
+LOW_QUALITY_AUDIO_REASON = (
+    "The audio quality might be low. Please provide clearer audio."
 )
-async def create_transcription(audio: TranscriptionCreate) -> JSONResponse:
+
+
+def convert_recognition_error(exc: Exception) -> CustomException:
     """
-    음성 데이터를 인식한 결과(텍스트)를 반환한다.
+    음성 인식 중 발생한 예외를 규격화된 CustomException으로 바꾼다.
 
     Args:
-        audio (TranscriptionCreate): 음성 인식을 하려는 파일을 base64로 인코딩 한 값
+        exc (Exception): 음성 인식 중 발생한 예외
 
     Returns:
-        JSONResponse: 음성 인식 결과
+        CustomException: 응답으로 보낼 예외
     """
 
-    try:
-        if not is_audio_content_valid(audio.audio):
-            raise CustomException(
-                status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
-                message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
-                attribute="audio",
-                reason="The audio data provided is not supported. Please send a valid audio.",
-            )
+    if isinstance(exc, CustomException):
+        return exc
+    if isinstance(exc, (asyncio.TimeoutError, DeadlineExceeded)):
+        return CustomException(
+            status_code=HTTP_STATUS_CODE["GATEWAY_TIMEOUT"],
+            message=HTTP_STATUS_MESSAGE["GATEWAY_TIMEOUT"],
+            attribute="external",
+            reason="The speech recognition server did not respond in time. Please try again later.",
+        )
+    if isinstance(exc, GoogleAPIError):
+        return CustomException(
+            status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
+            message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
+            attribute="external",
+            reason="An error occurred while communicating with other servers. Please try again later.",
+        )
+    return CustomException(
+        status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
+        message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
+        attribute="internal",
+        reason="An error occurred while processing the request. Please try again later.",
+    )
 
-        decoded_audio = base64.b64decode(audio.audio)
 
-        request = speech_v2.RecognizeRequest(
-            recognizer=f"projects/{GCP_PROJECT_ID}/locations/global/recognizers/_",
-            content=decoded_audio,
-            config=speech_recognition_config,
-        )
+async def recognize_preprocessed_audio(decoded_audio: bytes) -> Any:
+    """
+    음성 데이터를 모노, STT_SAMPLE_RATE로 바꾸고 앞뒤 무음을 잘라낸 뒤 인식한다.
 
-        response = client.recognize(request=request)
+    Args:
+        decoded_audio (bytes): 음성 데이터 (WAV)
+
+    Returns:
+        speech_v2.RecognizeResponse: 음성 인식 결과
+    """
+
+    preprocessed_audio = await asyncio.to_thread(
+        audio_preprocessor.process, decoded_audio
+    )
+
+    return await speech_recognizer.recognize(preprocessed_audio.content)
+
+
+async def recognize_transcript(decoded_audio: bytes) -> str:
+    """
+    디코딩된 음성 데이터를 인식한 텍스트를 반환한다.
+
+    같은 음성 데이터를 인식한 결과가 캐시에 있으면 음성 인식 서버를 호출하지 않고,
+    없으면 전처리로 줄인 음성 데이터를 보낸다.
+
+    Args:
+        decoded_audio (bytes): 음성 데이터 (WAV)
+
+    Returns:
+        str: 음성 인식 결과 (텍스트)
+
+    Raises:
+        CustomException: 인식 결과가 없거나 신뢰도가 낮은 경우, 음성 인식 서버와의 통신에 실패한 경우
+    """
+
+    try:
+        response = await transcription_cache.recognize(
+            decoded_audio, recognize_preprocessed_audio
+        )
 
         if not response.results:
             raise CustomException(
                 status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
                 message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
                 attribute="audio",
-                reason="The audio quality might be low. Please provide clearer audio.",
+                reason=LOW_QUALITY_AUDIO_REASON,
             )
 
         result = response.results[0].alternatives[0]
@@ -74,32 +134,303 @@ async def create_transcription(audio: TranscriptionCreate) -> JSONResponse:
                 status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
                 message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
                 attribute="audio",
-                reason="The audio quality might be low. Please provide clearer audio.",
+                reason=LOW_QUALITY_AUDIO_REASON,
             )
 
-        return JSONResponse(
-            status_code=HTTP_STATUS_CODE["OK"],
-            content={
-                "status": "success",
-                "code": HTTP_STATUS_CODE["OK"],
-                "message": HTTP_STATUS_MESSAGE["OK"],
-                "data": {"transcription": transcript},
-            },
-        )
+        return transcript
 
     except (CustomException, Exception) as exc:
         if isinstance(exc, CustomException):
             raise exc
-        if isinstance(exc, GoogleAPIError):
-            raise CustomException(
-                status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
-                message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
-                attribute="external",
-                reason="An error occurred while communicating with other servers. Please try again later.",
-            ) from exc
+        raise convert_recognition_error(exc) from exc
+
+
+async def transcribe(decoded_audio: bytes) -> JSONResponse:
+    """
+    디코딩된 음성 데이터를 인식한 결과(텍스트)를 응답으로 만든다.
+
+    Args:
+        decoded_audio (bytes): 음성 데이터 (WAV)
+
+    Returns:
+        JSONResponse: 음성 인식 결과
+    """
+
+    transcript = await recognize_transcript(decoded_audio)
+
+    return JSONResponse(
+        status_code=HTTP_STATUS_CODE["OK"],
+        content={
+            "status": "success",
+            "code": HTTP_STATUS_CODE["OK"],
+            "message": HTTP_STATUS_MESSAGE["OK"],
+            "data": {"transcription": transcript},
+        },
+    )
+
+
+async def read_wav_request(request: Request) -> bytes:
+    """
+    Content-Type이 audio/wav인 요청의 본문을 읽어 음성 데이터를 반환한다.
+
+    본문은 청크 단위로 읽으며, RIFF/WAVE 헤더는 첫 청크에서 검증하고
+    STT_MAX_AUDIO_BYTES를 넘으면 나머지를 읽지 않고 거절한다.
+
+    Args:
+        request (Request): 음성 데이터를 본문으로 담은 요청
+
+    Returns:
+        bytes: 음성 데이터 (WAV)
+
+    Raises:
+        CustomException: Content-Type이 WAV가 아니거나 (415), 본문이 너무 크거나 (413), WAV가 아닌 경우 (400)
+    """
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if content_type.lower() not in WAV_CONTENT_TYPES:
         raise CustomException(
-            status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
-            message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
-            attribute="internal",
-            reason="An error occurred while processing the request. Please try again later.",
-        ) from exc
+            status_code=HTTP_STATUS_CODE["UNSUPPORTED_MEDIA_TYPE"],
+            message=HTTP_STATUS_MESSAGE["UNSUPPORTED_MEDIA_TYPE"],
+            attribute="Content-Type",
+            reason="The audio data should be sent as audio/wav.",
+        )
+
+    content_length = request.headers.get("content-length", "")
+
+    if content_length.isdigit() and int(content_length) > STT_MAX_AUDIO_BYTES:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["PAYLOAD_TOO_LARGE"],
+            message=HTTP_STATUS_MESSAGE["PAYLOAD_TOO_LARGE"],
+            attribute="audio",
+            reason=f"The audio data should not exceed {STT_MAX_AUDIO_BYTES} bytes.",
+        )
+
+    return await read_audio_body(request.stream(), STT_MAX_AUDIO_BYTES)
+
+
+@router.post(
+    "/transcriptions",
+    response_model=TranscriptionResponse,
+    description="음성 인식 API",
+    tags=["transcriptions"],
+)
+async def create_transcription(audio: TranscriptionCreate) -> JSONResponse:
+    """
+    base64로 인코딩된 음성 데이터를 인식한 결과(텍스트)를 반환한다.
+
+    음성 데이터는 한 번만 디코딩하며, 새 클라이언트는 /transcriptions/audio를 사용한다.
+
+    Args:
+        audio (TranscriptionCreate): 음성 인식을 하려는 파일을 base64로 인코딩 한 값
+
+    Returns:
+        JSONResponse: 음성 인식 결과
+    """
+
+    decoded_audio = decode_audio_content(audio.audio)
+
+    if decoded_audio is None:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
+            message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
+            attribute="audio",
+            reason="The audio data provided is not supported. Please send a valid audio.",
+        )
+
+    return await transcribe(decoded_audio)
+
+
+@router.post(
+    "/transcriptions/audio",
+    response_model=TranscriptionResponse,
+    description="음성 인식 API (WAV 파일을 요청 본문으로 그대로 전송)",
+    tags=["transcriptions"],
+    openapi_extra=WAV_REQUEST_BODY,
+)
+async def create_audio_transcription(request: Request) -> JSONResponse:
+    """
+    요청 본문으로 받은 WAV 음성 데이터를 인식한 결과(텍스트)를 반환한다.
+
+    본문은 base64나 JSON 없이 청크 단위로 읽으며, RIFF/WAVE 헤더는 첫 청크에서 검증하고
+    STT_MAX_AUDIO_BYTES를 넘으면 나머지를 읽지 않고 거절한다.
+
+    Args:
+        request (Request): Content-Type이 audio/wav인 요청
+
+    Returns:
+        JSONResponse: 음성 인식 결과
+    """
+
+    decoded_audio = await read_wav_request(request)
+
+    return await transcribe(decoded_audio)
+
+
+async def receive_audio_chunks(
+    websocket: WebSocket, audio_chunks: "asyncio.Queue[Optional[bytes]]"
+) -> bool:
+    """
+    클라이언트가 보낸 음성 청크를 대기열에 넣는다.
+
+    대기열이 가득 차면 자리가 날 때까지 클라이언트에서 읽지 않으므로,
+    음성 인식 서버가 따라오지 못하는 동안에는 클라이언트의 전송도 멈춘다.
+    클라이언트가 STREAM_END_MESSAGE를 보내거나 연결을 끊으면 대기열에 None을 넣는다.
+
+    Args:
+        websocket (WebSocket): 클라이언트와의 연결
+        audio_chunks (asyncio.Queue[Optional[bytes]]): 음성 청크 대기열
+
+    Returns:
+        bool: 클라이언트가 연결을 유지한 채 전송을 마친 경우 True, 연결을 끊은 경우 False
+    """
+
+    connected = True
+
+    while True:
+        message = await websocket.receive()
+
+        if message["type"] == "websocket.disconnect":
+            connected = False
+            break
+
+        if message.get("bytes"):
+            await audio_chunks.put(message["bytes"])
+        elif message.get("text") == STREAM_END_MESSAGE:
+            break
+
+    await audio_chunks.put(None)
+
+    return connected
+
+
+async def iterate_audio_chunks(
+    audio_chunks: "asyncio.Queue[Optional[bytes]]",
+) -> AsyncIterator[bytes]:
+    while (chunk := await audio_chunks.get()) is not None:
+        yield chunk
+
+
+def is_client_disconnected(receiver: "asyncio.Task[bool]") -> bool:
+    return (
+        receiver.done()
+        and not receiver.cancelled()
+        and receiver.exception() is None
+        and not receiver.result()
+    )
+
+
+def create_stream_messages(response: Any) -> List[Dict[str, Any]]:
+    """
+    스트리밍 음성 인식 결과를 클라이언트에 보낼 메시지로 바꾼다.
+
+    중간 결과는 그대로 보내고, 최종 결과는 신뢰도가 STT_API_CONFIDENCE_THRESHOLD보다 낮으면
+    400 에러 메시지로 보낸다.
+
+    Args:
+        response (speech_v2.StreamingRecognizeResponse): 스트리밍 음성 인식 결과
+
+    Returns:
+        List[Dict[str, Any]]: 클라이언트에 보낼 메시지 목록
+    """
+
+    messages = []
+
+    for result in response.results:
+        if not result.alternatives:
+            continue
+
+        alternative = result.alternatives[0]
+
+        if not result.is_final:
+            data = {
+                "transcription": alternative.transcript,
+                "stability": result.stability,
+            }
+            messages.append(
+                {
+                    "type": "interim",
+                    "status": "success",
+                    "code": HTTP_STATUS_CODE["OK"],
+                    "message": HTTP_STATUS_MESSAGE["OK"],
+                    "data": data,
+                }
+            )
+        elif alternative.confidence < STT_API_CONFIDENCE_THRESHOLD:
+            error_content = create_error_content(
+                HTTP_STATUS_CODE["BAD_REQUEST"],
+                HTTP_STATUS_MESSAGE["BAD_REQUEST"],
+                "audio",
+                LOW_QUALITY_AUDIO_REASON,
+            )
+            messages.append({"type": "final", **error_content})
+        else:
+            data = {
+                "transcription": alternative.transcript,
+                "confidence": alternative.confidence,
+            }
+            messages.append(
+                {
+                    "type": "final",
+                    "status": "success",
+                    "code": HTTP_STATUS_CODE["OK"],
+                    "message": HTTP_STATUS_MESSAGE["OK"],
+                    "data": data,
+                }
+            )
+
+    return messages
+
+
+@router.websocket("/transcriptions/stream")
+async def stream_transcription(websocket: WebSocket) -> None:
+    """
+    WebSocket으로 받은 음성 청크(WAV 혹은 STT_SAMPLE_RATE 16비트 모노 raw LINEAR16)를 인식하며
+    중간 결과와 최종 결과를 보낸다.
+
+    클라이언트는 음성을 바이너리 메시지로 보내고, 다 보냈으면 텍스트 메시지 "end"를 보낸다.
+    남은 결과를 모두 보낸 뒤 정상 종료(1000)로 연결을 닫으며, 에러가 발생하면
+    에러 메시지를 보낸 뒤 서버가 바쁜 경우 1013, 그 외에는 1011로 연결을 닫는다.
+
+    Args:
+        websocket (WebSocket): 클라이언트와의 연결
+    """
+
+    await websocket.accept()
+
+    audio_chunks: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(
+        STT_STREAM_QUEUE_SIZE
+    )
+    receiver = asyncio.create_task(receive_audio_chunks(websocket, audio_chunks))
+    close_code = status.WS_1000_NORMAL_CLOSURE
+
+    try:
+        responses = speech_recognizer.streaming_recognize(
+            iterate_audio_chunks(audio_chunks)
+        )
+
+        async for response in responses:
+            for message in create_stream_messages(response):
+                await websocket.send_json(message)
+    except WebSocketDisconnect:
+        return
+    except Exception as exc:
+        if is_client_disconnected(receiver):
+            return
+
+        error = convert_recognition_error(exc)
+        await websocket.send_json(
+            create_error_content(
+                error.status_code, error.message, error.attribute, error.reason
+            )
+        )
+
+        if error.status_code == HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"]:
+            close_code = status.WS_1013_TRY_AGAIN_LATER
+        else:
+            close_code = status.WS_1011_INTERNAL_ERROR
+    finally:
+        receiver.cancel()
+
+    if not is_client_disconnected(receiver):
+        await websocket.close(close_code)
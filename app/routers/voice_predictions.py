@@ -0,0 +1,137 @@
+"""
+음성으로 한 설명으로 단어를 추론하는 엔드포인트
+"""
+
+import time
+from typing import Dict
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from app.api.models import VoicePredictionResponse
+from app.api.utils import get_requested_model_version
+from app.core.exceptions import CustomException
+from app.settings.constants import (
+    HTTP_STATUS_CODE,
+    HTTP_STATUS_MESSAGE,
+    MODEL_API_VERSION_LATEST,
+)
+
+from app import global_config
+from app.routers.transcriptions import (
+    LOW_QUALITY_AUDIO_REASON,
+    WAV_REQUEST_BODY,
+    read_wav_request,
+    recognize_transcript,
+)
+from app.services.model_inference import predict
+
+router = APIRouter(prefix=f"/api/{MODEL_API_VERSION_LATEST}")
+
+
+def get_stage_timings(checkpoints: Dict[str, float], started_at: float) -> Dict:
+    """
+    단계별 종료 시각으로 단계별 소요 시간(ms)과 전체 소요 시간(ms)을 구한다.
+
+    Args:
+        checkpoints (Dict[str, float]): 단계 이름과 단계가 끝난 시각 (time.perf_counter, 진행 순서)
+        started_at (float): 요청 처리를 시작한 시각 (time.perf_counter)
+
+    Returns:
+        Dict: 단계별 소요 시간 ("<단계>_ms")과 전체 소요 시간 ("total_ms")
+    """
+
+    timings = {}
+    previous = started_at
+
+    for stage, finished_at in checkpoints.items():
+        timings[f"{stage}_ms"] = round((finished_at - previous) * 1000, 1)
+        previous = finished_at
+
+    timings["total_ms"] = round((previous - started_at) * 1000, 1)
+
+    return timings
+
+
+def create_server_timing(timings: Dict) -> str:
+    return ", ".join(
+        f"{name.removesuffix('_ms')};dur={duration}"
+        for name, duration in timings.items()
+    )
+
+
+@router.post(
+    "/predictions/voice",
+    response_model=VoicePredictionResponse,
+    summary="음성 단어 추론 API",
+    description="음성으로 한 설명을 인식하고, 인식한 설명에 가장 가까운 단어를 반환한다. X-Model-Version 헤더로 모델 버전을 지정할 수 있다.",
+    tags=["predictions", "transcriptions"],
+    openapi_extra=WAV_REQUEST_BODY,
+)
+async def create_voice_prediction(request: Request) -> JSONResponse:
+    """
+    요청 본문으로 받은 WAV 음성 데이터를 인식하고, 인식한 텍스트로 단어를 추론한 결과를 반환한다.
+
+    음성 인식과 단어 추론을 한 번의 요청으로 처리해, 클라이언트의 왕복과 JSON 변환을 한 번씩 줄인다.
+    모델이 준비되지 않았거나 지정한 모델 버전이 메모리에 없다면 음성 인식 전에 거절한다.
+    단계별 소요 시간은 본문의 timings와 Server-Timing 헤더로 함께 보낸다.
+    본문과 헤더는 모두 추론 결과와 추론 소요 시간이 있어야 만들 수 있으므로, 추론과 겹쳐 실행할
+    응답 준비 작업이 없어 추론은 작업으로 띄우지 않고 곧바로 기다린다.
+
+    Args:
+        request (Request): Content-Type이 audio/wav인 요청, X-Model-Version 헤더로 모델 버전을 지정할 수 있음
+
+    Returns:
+        JSONResponse: 음성 인식 결과, 단어 추론 결과, 추론에 사용한 모델 버전, 단계별 소요 시간
+    """
+
+    started_at = time.perf_counter()
+    checkpoints = {}
+
+    global_config.ensure_ready()
+    bundle = global_config.get_model_bundle(get_requested_model_version(request))
+
+    decoded_audio = await read_wav_request(request)
+    checkpoints["read"] = time.perf_counter()
+
+    transcript = await recognize_transcript(decoded_audio)
+    checkpoints["transcription"] = time.perf_counter()
+
+    if not transcript.strip():
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["BAD_REQUEST"],
+            message=HTTP_STATUS_MESSAGE["BAD_REQUEST"],
+            attribute="audio",
+            reason=LOW_QUALITY_AUDIO_REASON,
+        )
+
+    try:
+        predictions = await predict(transcript, bundle=bundle)
+    except CustomException as exc:
+        raise exc
+    except Exception as exc:
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["INTERNAL_SERVER_ERROR"],
+            message=HTTP_STATUS_MESSAGE["INTERNAL_SERVER_ERROR"],
+            attribute="model",
+            reason="An error occurred while performing model inference. Please try again later.",
+        ) from exc
+
+    checkpoints["prediction"] = time.perf_counter()
+    timings = get_stage_timings(checkpoints, started_at)
+
+    return JSONResponse(
+        status_code=HTTP_STATUS_CODE["OK"],
+        content={
+            "status": "success",
+            "code": HTTP_STATUS_CODE["OK"],
+            "message": HTTP_STATUS_MESSAGE["OK"],
+            "data": {
+                "transcription": transcript,
+                "predictions": predictions,
+                "model_version": bundle.version,
+                "timings": timings,
+            },
+        },
+        headers={"Server-Timing": create_server_timing(timings)},
+    )
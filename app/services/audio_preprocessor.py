@@ -0,0 +1,442 @@
+"""
+음성 인식 서버로 보내기 전에 WAV 음성을 줄이는 전처리 모듈
+
+PCM WAV의 헤더를 읽어 샘플을 복사 없이 NumPy 배열로 본 뒤,
+모노로 합치고 STT_SAMPLE_RATE로 리샘플링한 다음 앞뒤의 무음을 에너지 기반으로 잘라낸다.
+결과는 16비트 PCM 모노 WAV로 다시 만든다. 읽을 수 없는 형식은 그대로 보낸다.
+"""
+
+import logging
+import struct
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.settings.constants import (
+    STT_PREPROCESS_ENABLED,
+    STT_SAMPLE_RATE,
+    STT_VAD_FRAME_MS,
+    STT_VAD_PADDING_MS,
+    STT_VAD_THRESHOLD_DB,
+)
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# 헤더의 샘플링 레이트가 이보다 크면 손상된 파일로 보고 전처리하지 않는다.
+MAX_SAMPLE_RATE = 384000
+
+# (포맷, 샘플 크기)별 NumPy 자료형과 [-1, 1]로 맞추기 위한 배율
+SAMPLE_FORMATS = {
+    (WAVE_FORMAT_PCM, 8): ("u1", 1 / 128),
+    (WAVE_FORMAT_PCM, 16): ("<i2", 1 / 32768),
+    (WAVE_FORMAT_PCM, 32): ("<i4", 1 / 2147483648),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): ("<f4", 1.0),
+}
+
+
+class WavAudio:
+    """
+    WAV 파일의 형식 정보와 샘플
+
+    Attributes:
+        sample_rate (int): 샘플링 레이트 (Hz)
+        channels (int): 채널 수
+        samples (np.ndarray): 원본 버퍼를 복사 없이 본 (샘플 수, 채널 수) 배열
+        scale (float): 샘플 값을 [-1, 1]로 맞추기 위한 배율
+        offset (float): 샘플 값에서 뺄 값 (부호 없는 8비트 PCM은 128)
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        samples: np.ndarray,
+        scale: float,
+        offset: float = 0.0,
+    ):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.samples = samples
+        self.scale = scale
+        self.offset = offset
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+
+class PreprocessedAudio:
+    """
+    전처리한 음성과 전처리로 줄어든 크기
+
+    Attributes:
+        content (bytes): 음성 인식 서버로 보낼 음성 데이터
+        original_bytes (int): 원본 음성 데이터 크기 (bytes)
+        original_seconds (Optional[float]): 원본 음성 길이 (초), 읽을 수 없는 형식이면 None
+        processed_seconds (Optional[float]): 전처리한 음성 길이 (초), 읽을 수 없는 형식이면 None
+    """
+
+    def __init__(
+        self,
+        content: bytes,
+        original_bytes: int,
+        original_seconds: Optional[float] = None,
+        processed_seconds: Optional[float] = None,
+    ):
+        self.content = content
+        self.original_bytes = original_bytes
+        self.original_seconds = original_seconds
+        self.processed_seconds = processed_seconds
+
+    @property
+    def processed_bytes(self) -> int:
+        return len(self.content)
+
+
+def has_wav_header(data: bytes) -> bool:
+    """
+    음성 데이터가 RIFF/WAVE 헤더로 시작하는지 확인한다.
+
+    Args:
+        data (bytes): 음성 데이터
+
+    Returns:
+        bool: WAV 헤더로 시작하면 True, 그렇지 않으면 False
+    """
+
+    return len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WAVE"
+
+
+def parse_wav(data: bytes) -> Optional[WavAudio]:
+    """
+    WAV 파일의 fmt, data 청크를 찾아 샘플을 복사 없이 배열로 본다.
+
+    Args:
+        data (bytes): WAV 음성 데이터
+
+    Returns:
+        Optional[WavAudio]: 지원하는 PCM 혹은 float WAV이면 형식 정보와 샘플, 그렇지 않으면 None
+    """
+
+    if not has_wav_header(data):
+        return None
+
+    position = 12
+    audio_format = None
+    data_offset, data_size = None, 0
+
+    while position + 8 <= len(data):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", data, position)
+        chunk_start = position + 8
+
+        if chunk_id == b"fmt " and 16 <= chunk_size <= len(data) - chunk_start:
+            (
+                audio_format,
+                channels,
+                sample_rate,
+                _,
+                block_align,
+                bits_per_sample,
+            ) = struct.unpack_from("<HHIIHH", data, chunk_start)
+
+            if audio_format == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26:
+                (audio_format,) = struct.unpack_from("<H", data, chunk_start + 24)
+        elif chunk_id == b"data":
+            data_offset = chunk_start
+            # 스트리밍으로 만든 파일은 data 청크 크기가 비어 있거나 실제보다 클 수 있다.
+            data_size = min(chunk_size, len(data) - chunk_start)
+            break
+
+        position = chunk_start + chunk_size + chunk_size % 2
+
+    if audio_format is None or data_offset is None or channels == 0:
+        return None
+
+    if not 0 < sample_rate <= MAX_SAMPLE_RATE:
+        return None
+
+    sample_format = SAMPLE_FORMATS.get((audio_format, bits_per_sample))
+
+    if sample_format is None or block_align != channels * bits_per_sample // 8:
+        return None
+
+    dtype, scale = sample_format
+    frame_count = data_size // block_align
+    samples = np.frombuffer(
+        data, dtype=dtype, count=frame_count * channels, offset=data_offset
+    ).reshape(frame_count, channels)
+
+    return WavAudio(
+        sample_rate, channels, samples, scale, 128.0 if dtype == "u1" else 0.0
+    )
+
+
+def downmix(audio: WavAudio) -> np.ndarray:
+    """
+    모든 채널의 평균으로 [-1, 1] 범위의 float32 모노 샘플을 만든다.
+
+    Args:
+        audio (WavAudio): WAV 파일의 형식 정보와 샘플
+
+    Returns:
+        np.ndarray: 모노 샘플 (1차원)
+    """
+
+    if audio.channels == 1:
+        mono = audio.samples[:, 0].astype(np.float32)
+    else:
+        mono = audio.samples.mean(axis=1, dtype=np.float32)
+
+    if audio.offset:
+        mono -= audio.offset
+
+    mono *= audio.scale
+
+    return mono
+
+
+def resample(samples: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    """
+    선형 보간으로 샘플링 레이트를 바꾼다.
+
+    샘플링 레이트를 낮출 때는 보간 전에 이동 평균으로 높은 주파수를 줄여 앨리어싱을 완화한다.
+
+    Args:
+        samples (np.ndarray): 모노 샘플 (1차원)
+        sample_rate (int): 원본 샘플링 레이트 (Hz)
+        target_rate (int): 바꿀 샘플링 레이트 (Hz)
+
+    Returns:
+        np.ndarray: 리샘플링한 모노 샘플 (1차원)
+    """
+
+    if sample_rate == target_rate or len(samples) == 0:
+        return samples
+
+    window = int(sample_rate // target_rate)
+
+    if window > 1:
+        samples = np.convolve(
+            samples, np.full(window, 1 / window, dtype=np.float32), mode="same"
+        )
+
+    target_length = max(1, round(len(samples) * target_rate / sample_rate))
+    positions = np.arange(target_length, dtype=np.float64) * (sample_rate / target_rate)
+
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def find_voiced_range(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: float = STT_VAD_FRAME_MS,
+    threshold_db: float = STT_VAD_THRESHOLD_DB,
+    padding_ms: float = STT_VAD_PADDING_MS,
+) -> slice:
+    """
+    프레임별 에너지(RMS, dBFS)가 threshold_db 이상인 첫 프레임부터 마지막 프레임까지의 범위를 구한다.
+
+    범위 앞뒤에 padding_ms만큼 여유를 두며, 소리가 있는 프레임이 없으면 전체 범위를 반환한다.
+
+    Args:
+        samples (np.ndarray): [-1, 1] 범위의 모노 샘플 (1차원)
+        sample_rate (int): 샘플링 레이트 (Hz)
+        frame_ms (float): 에너지를 계산할 프레임 길이 (ms)
+        threshold_db (float): 소리가 있다고 볼 최소 에너지 (dBFS)
+        padding_ms (float): 범위 앞뒤에 남길 길이 (ms)
+
+    Returns:
+        slice: 남길 샘플 범위
+    """
+
+    frame_size = max(1, int(sample_rate * frame_ms / 1000))
+    frame_count = len(samples) // frame_size
+
+    if frame_count == 0:
+        return slice(0, len(samples))
+
+    frames = samples[: frame_count * frame_size].reshape(frame_count, frame_size)
+    energies = np.einsum("ij,ij->i", frames, frames) / frame_size
+    voiced = np.flatnonzero(energies >= 10 ** (threshold_db / 10))
+
+    if len(voiced) == 0:
+        return slice(0, len(samples))
+
+    padding = int(sample_rate * padding_ms / 1000)
+    start = max(0, voiced[0] * frame_size - padding)
+    stop = min(len(samples), (voiced[-1] + 1) * frame_size + padding)
+
+    return slice(start, stop)
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """
+    [-1, 1] 범위의 모노 샘플을 16비트 PCM WAV로 만든다.
+
+    Args:
+        samples (np.ndarray): 모노 샘플 (1차원)
+        sample_rate (int): 샘플링 레이트 (Hz)
+
+    Returns:
+        bytes: WAV 음성 데이터
+    """
+
+    pcm = np.clip(samples * 32767, -32768, 32767).astype("<i2").tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + len(pcm),
+        b"WAVE",
+        b"fmt ",
+        16,
+        WAVE_FORMAT_PCM,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        len(pcm),
+    )
+
+    return header + pcm
+
+
+class AudioPreprocessor:
+    """
+    WAV 음성을 모노, sample_rate로 바꾸고 앞뒤 무음을 잘라내는 객체
+
+    원본보다 커지거나 읽을 수 없는 형식이면 원본을 그대로 사용한다.
+
+    Attributes:
+        enabled (bool): 전처리 사용 여부
+        sample_rate (int): 음성 인식 서버로 보낼 샘플링 레이트 (Hz)
+        frame_ms (float): 무음 판단에 사용할 프레임 길이 (ms)
+        threshold_db (float): 소리가 있다고 볼 최소 에너지 (dBFS)
+        padding_ms (float): 잘라낸 범위 앞뒤에 남길 길이 (ms)
+    """
+
+    def __init__(
+        self,
+        enabled: bool = STT_PREPROCESS_ENABLED,
+        sample_rate: int = STT_SAMPLE_RATE,
+        frame_ms: float = STT_VAD_FRAME_MS,
+        threshold_db: float = STT_VAD_THRESHOLD_DB,
+        padding_ms: float = STT_VAD_PADDING_MS,
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.threshold_db = threshold_db
+        self.padding_ms = padding_ms
+        self._totals = {
+            "processed": 0,
+            "skipped": 0,
+            "original_bytes": 0,
+            "processed_bytes": 0,
+            "original_seconds": 0.0,
+            "processed_seconds": 0.0,
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def settings_key(self) -> str:
+        """전처리 결과에 영향을 주는 설정을 이어 붙인 문자열 (음성 인식 결과 캐시 키에 사용)"""
+
+        return (
+            f"{self.enabled}:{self.sample_rate}:{self.frame_ms}:"
+            f"{self.threshold_db}:{self.padding_ms}"
+        )
+
+    def process(self, data: bytes) -> PreprocessedAudio:
+        """
+        음성 인식 서버로 보낼 음성 데이터를 만든다.
+
+        블로킹 작업이므로 이벤트 루프에서는 asyncio.to_thread로 실행한다.
+
+        Args:
+            data (bytes): WAV 음성 데이터
+
+        Returns:
+            PreprocessedAudio: 전처리한 음성과 전처리로 줄어든 크기
+        """
+
+        try:
+            result = self._preprocess(data) if self.enabled else None
+        except Exception:
+            logging.exception("Failed to preprocess the WAV audio, sending it as is")
+            result = None
+
+        if result is None:
+            result = PreprocessedAudio(data, len(data))
+            self._record(result)
+            return result
+
+        self._record(result)
+        logging.debug(
+            "Preprocessed audio: %d -> %d bytes, %.2f -> %.2f seconds",
+            result.original_bytes,
+            result.processed_bytes,
+            result.original_seconds,
+            result.processed_seconds,
+        )
+
+        return result
+
+    def _preprocess(self, data: bytes) -> Optional[PreprocessedAudio]:
+        audio = parse_wav(data)
+
+        if audio is None:
+            return None
+
+        samples = resample(downmix(audio), audio.sample_rate, self.sample_rate)
+        samples = samples[
+            find_voiced_range(
+                samples,
+                self.sample_rate,
+                self.frame_ms,
+                self.threshold_db,
+                self.padding_ms,
+            )
+        ]
+        content = encode_wav(samples, self.sample_rate)
+
+        if len(content) >= len(data):
+            return PreprocessedAudio(
+                data, len(data), audio.duration_seconds, audio.duration_seconds
+            )
+
+        return PreprocessedAudio(
+            content,
+            len(data),
+            audio.duration_seconds,
+            len(samples) / self.sample_rate,
+        )
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        전처리 누적 통계를 반환한다.
+
+        Returns:
+            Dict[str, float]: 전처리한 음성 수, 건너뛴 음성 수, 전처리 전후의 전체 크기와 길이
+        """
+
+        with self._lock:
+            return dict(self._totals)
+
+    def _record(self, result: PreprocessedAudio) -> None:
+        with self._lock:
+            if result.original_seconds is None:
+                self._totals["skipped"] += 1
+                return
+
+            self._totals["processed"] += 1
+            self._totals["original_bytes"] += result.original_bytes
+            self._totals["processed_bytes"] += result.processed_bytes
+            self._totals["original_seconds"] += result.original_seconds
+            self._totals["processed_seconds"] += result.processed_seconds
+
+
+audio_preprocessor = AudioPreprocessor()
@@ -0,0 +1,250 @@
+"""
+MongoDB training_data 컬렉션을 나누어 읽어 코퍼스 스냅샷을 만드는 모듈
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from bson import ObjectId
+from pymongo import MongoClient
+
+from app.core.mongodb_utils import iter_document_chunks
+from app.services.corpus_store import CorpusStore
+from app.services.corpus_sync import CorpusSnapshot, encode_in_batches
+from app.services.embedding_cache import (
+    load_corpus_embeddings,
+    save_corpus_embeddings,
+    update_corpus_hash,
+)
+from app.settings.constants import CORPUS_EMBEDDING_DTYPE, CORPUS_LOAD_CHUNK_SIZE
+
+CORPUS_SCAN_PROJECTION = {"description": 1, "correct_word": 1, "updated_date": 1}
+CORPUS_ENCODE_PROJECTION = {"description": 1}
+
+
+class CorpusScan:
+    """
+    코퍼스를 한 번 훑어 만든 임베딩 이외의 정보
+
+    Attributes:
+        corpus_hash (str): 코퍼스 내용의 sha256 해시 값
+        ids (np.ndarray): 코퍼스 각 문장의 MongoDB 문서 ID (문자열)
+        label_codes (np.ndarray): 코퍼스 각 문장의 정수 레이블 코드
+        labels (List[str]): 레이블 코드에 해당하는 단어 목록
+        last_updated_date (Optional[datetime]): 문서 중 가장 최근의 updated_date
+    """
+
+    def __init__(
+        self,
+        corpus_hash: str,
+        ids: np.ndarray,
+        label_codes: np.ndarray,
+        labels: List[str],
+        last_updated_date: Optional[datetime],
+    ):
+        self.corpus_hash = corpus_hash
+        self.ids = ids
+        self.label_codes = label_codes
+        self.labels = labels
+        self.last_updated_date = last_updated_date
+
+    @property
+    def size(self) -> int:
+        return self.ids.shape[0]
+
+
+def get_chunk_ids(documents: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    문서 목록의 ID를 고정 길이 문자열 배열로 반환한다.
+
+    Args:
+        documents (List[Dict[str, Any]]): MongoDB 문서 목록
+
+    Returns:
+        np.ndarray: 문서 ID 배열
+    """
+
+    return np.array([str(document["_id"]) for document in documents], dtype="U24")
+
+
+def scan_corpus(
+    client: MongoClient, chunk_size: int = CORPUS_LOAD_CHUNK_SIZE
+) -> CorpusScan:
+    """
+    training_data 컬렉션을 chunk_size개씩 읽으며 해시 값, 문서 ID, 레이블 코드를 계산한다.
+
+    문장은 해시 계산에만 쓰고 보관하지 않으므로, 한 번에 메모리에 올라오는 문서는 한 묶음뿐이다.
+
+    Args:
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        chunk_size (int): 한 번에 읽을 문서 수
+
+    Returns:
+        CorpusScan: 코퍼스의 해시 값, 문서 ID, 레이블 코드, 레이블 목록, 가장 최근의 updated_date
+    """
+
+    corpus_hash = hashlib.sha256()
+    id_chunks = []
+    label_code_chunks = []
+    labels = []
+    label_positions = {}
+    last_updated_date = None
+
+    for documents in iter_document_chunks(
+        client,
+        "training_data",
+        projection=CORPUS_SCAN_PROJECTION,
+        chunk_size=chunk_size,
+    ):
+        chunk_labels = [document["correct_word"] for document in documents]
+        update_corpus_hash(
+            corpus_hash,
+            (document["description"] for document in documents),
+            chunk_labels,
+        )
+
+        label_codes = np.empty(len(documents), dtype=np.int32)
+
+        for position, label in enumerate(chunk_labels):
+            if label not in label_positions:
+                label_positions[label] = len(labels)
+                labels.append(label)
+            label_codes[position] = label_positions[label]
+
+        updated_dates = [
+            document["updated_date"]
+            for document in documents
+            if document.get("updated_date") is not None
+        ]
+
+        if updated_dates:
+            last_updated_date = max(
+                updated_dates
+                if last_updated_date is None
+                else updated_dates + [last_updated_date]
+            )
+
+        id_chunks.append(get_chunk_ids(documents))
+        label_code_chunks.append(label_codes)
+
+    return CorpusScan(
+        corpus_hash.hexdigest(),
+        np.concatenate(id_chunks) if id_chunks else np.empty(0, dtype="U24"),
+        (
+            np.concatenate(label_code_chunks)
+            if label_code_chunks
+            else np.empty(0, dtype=np.int32)
+        ),
+        labels,
+        last_updated_date,
+    )
+
+
+def encode_corpus(
+    client: MongoClient,
+    model: Any,
+    scan: CorpusScan,
+    chunk_size: int = CORPUS_LOAD_CHUNK_SIZE,
+    dtype: str = CORPUS_EMBEDDING_DTYPE,
+) -> np.ndarray:
+    """
+    training_data 컬렉션의 문장을 chunk_size개씩 읽어 인코딩하고 정규화한다.
+
+    scan_corpus 이후 추가된 문서는 건너뛰며, 그 사이 문서가 삭제되는 등
+    scan의 문서 ID와 순서가 달라지면 RuntimeError를 발생시킨다.
+
+    Args:
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        model (Any): 문장 인코더 (SentenceTransformer)
+        scan (CorpusScan): scan_corpus의 결과
+        chunk_size (int): 한 번에 읽어 인코딩할 문서 수
+        dtype (str): 임베딩 자료형 ("float32" 혹은 "float16")
+
+    Returns:
+        np.ndarray: 정규화된 코퍼스 임베딩
+    """
+
+    if scan.size == 0:
+        return np.empty((0, 0), dtype=dtype)
+
+    embeddings = None
+    start = 0
+
+    for documents in iter_document_chunks(
+        client,
+        "training_data",
+        {"_id": {"$lte": ObjectId(scan.ids[-1])}},
+        CORPUS_ENCODE_PROJECTION,
+        chunk_size,
+    ):
+        end = start + len(documents)
+
+        if not np.array_equal(get_chunk_ids(documents), scan.ids[start:end]):
+            raise RuntimeError("training_data changed while loading the corpus")
+
+        chunk_embeddings = encode_in_batches(
+            model, [document["description"] for document in documents]
+        )
+
+        if embeddings is None:
+            embeddings = np.empty((scan.size, chunk_embeddings.shape[1]), dtype=dtype)
+
+        embeddings[start:end] = chunk_embeddings
+        start = end
+
+    if start != scan.size:
+        raise RuntimeError("training_data changed while loading the corpus")
+
+    return embeddings
+
+
+def load_corpus_snapshot(
+    client: MongoClient,
+    model: Any,
+    cache_dir: str,
+    model_version: str,
+    chunk_size: int = CORPUS_LOAD_CHUNK_SIZE,
+    dtype: str = CORPUS_EMBEDDING_DTYPE,
+) -> CorpusSnapshot:
+    """
+    training_data 컬렉션으로 코퍼스 스냅샷을 만든다.
+
+    코퍼스 해시에 해당하는 임베딩 캐시가 있으면 불러오고, 없으면 나누어 인코딩한 뒤 캐시에 저장한다.
+
+    Args:
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        model (Any): 문장 인코더 (SentenceTransformer)
+        cache_dir (str): 임베딩 캐시를 저장하는 최상위 디렉터리
+        model_version (str): 임베딩을 만드는 모델 버전
+        chunk_size (int): 한 번에 읽을 문서 수
+        dtype (str): 임베딩 자료형 ("float32" 혹은 "float16")
+
+    Returns:
+        CorpusSnapshot: 코퍼스 스냅샷
+    """
+
+    scan = scan_corpus(client, chunk_size)
+    store = load_corpus_embeddings(cache_dir, model_version, scan.corpus_hash, dtype)
+
+    if store is None:
+        logging.info("Encoding %d training_data documents", scan.size)
+
+        encoded_store = CorpusStore(
+            encode_corpus(client, model, scan, chunk_size, dtype),
+            scan.label_codes,
+            scan.labels,
+        )
+        save_corpus_embeddings(
+            cache_dir, model_version, scan.corpus_hash, encoded_store
+        )
+
+        # 저장한 캐시를 메모리 맵으로 다시 열어, 인코딩한 배열 대신 공유되는 페이지 캐시를 사용한다.
+        store = (
+            load_corpus_embeddings(cache_dir, model_version, scan.corpus_hash, dtype)
+            or encoded_store
+        )
+
+    return CorpusSnapshot(scan.ids, store, scan.last_updated_date)
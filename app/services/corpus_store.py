@@ -0,0 +1,120 @@
+"""
+단어 추론에 필요한 코퍼스 데이터만 배열로 담는 저장소 모듈
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+EMBEDDING_DTYPES = ("float32", "float16")
+
+
+class CorpusStore:
+    """
+    코퍼스 임베딩, 레이블 코드, 레이블 어휘만 담는 저장소
+
+    MongoDB 문서 전체를 담은 DataFrame 대신 단어 추론에 필요한 배열만 보관한다.
+    레이블은 sys.intern으로 같은 문자열 객체를 공유하며, 각 문장의 레이블은 int32 코드로 저장한다.
+
+    Attributes:
+        embeddings (np.ndarray): 코퍼스 임베딩 (float32 혹은 float16, 2차원)
+        label_codes (np.ndarray): 코퍼스 각 문장의 정수 레이블 코드 (int32)
+        labels (tuple): 레이블 코드에 해당하는 단어 목록
+    """
+
+    __slots__ = ("embeddings", "label_codes", "labels")
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        label_codes: np.ndarray,
+        labels: Iterable[str],
+        dtype: Optional[str] = None,
+    ):
+        dtype = dtype or embeddings.dtype.name
+
+        if dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+        self.embeddings = embeddings.astype(dtype, copy=False)
+        self.label_codes = label_codes.astype(np.int32, copy=False)
+        self.labels = tuple(sys.intern(str(label)) for label in labels)
+
+        if self.embeddings.ndim != 2:
+            raise ValueError("Corpus embeddings must be a 2-D array")
+        if self.embeddings.shape[0] != self.label_codes.shape[0]:
+            raise ValueError("Corpus embeddings and label codes differ in length")
+
+    @property
+    def size(self) -> int:
+        return self.embeddings.shape[0]
+
+    def get_labels(self, label_codes: Iterable[int]) -> List[str]:
+        """
+        레이블 코드에 해당하는 단어 목록을 반환한다.
+
+        Args:
+            label_codes (Iterable[int]): 레이블 코드
+
+        Returns:
+            List[str]: 레이블 코드 순서대로의 단어 목록
+        """
+
+        return [self.labels[label_code] for label_code in label_codes]
+
+    def save(self, path: str) -> None:
+        """
+        저장소를 디렉터리에 .npy 파일로 저장한다.
+
+        Args:
+            path (str): 저장할 디렉터리 (없으면 만든다)
+        """
+
+        os.makedirs(path, exist_ok=True)
+        np.save(
+            os.path.join(path, "embeddings.npy"), np.ascontiguousarray(self.embeddings)
+        )
+        np.save(os.path.join(path, "label_codes.npy"), self.label_codes)
+        np.save(os.path.join(path, "labels.npy"), np.array(self.labels, dtype=str))
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = "r") -> "CorpusStore":
+        """
+        save로 저장한 저장소를 불러온다.
+
+        mmap_mode가 "r"이면 임베딩과 레이블 코드를 읽기 전용 메모리 맵으로 연다.
+        같은 호스트의 여러 워커가 같은 파일을 메모리 맵으로 열면 페이지 캐시를 공유한다.
+
+        Args:
+            path (str): 저장소가 저장된 디렉터리
+            mmap_mode (Optional[str]): np.load의 mmap_mode, None이면 메모리에 모두 읽는다.
+
+        Returns:
+            CorpusStore: 불러온 저장소
+        """
+
+        return cls(
+            np.load(os.path.join(path, "embeddings.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, "label_codes.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, "labels.npy")).tolist(),
+        )
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        저장소가 차지하는 메모리 크기를 반환한다. 메모리 맵 배열은 파일 크기로 계산한다.
+
+        Returns:
+            Dict[str, int]: 임베딩, 레이블 코드, 레이블 어휘, 전체 크기 (bytes)
+        """
+
+        usage = {
+            "embeddings": int(self.embeddings.nbytes),
+            "label_codes": int(self.label_codes.nbytes),
+            "labels": sys.getsizeof(self.labels)
+            + sum(sys.getsizeof(label) for label in self.labels),
+        }
+        usage["total"] = sum(usage.values())
+
+        return usage
@@ -0,0 +1,296 @@
+"""
+MongoDB training_data 컬렉션의 변경 사항을 코퍼스에 점진적으로 반영하는 모듈
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from bson import ObjectId
+from pymongo import MongoClient
+
+from app.core.mongodb_utils import iter_document_chunks
+from app.services.corpus_store import CorpusStore
+from app.services.vector_index import build_index, normalize_embeddings
+from app.settings.constants import CORPUS_LOAD_CHUNK_SIZE, CORPUS_SYNC_BATCH_SIZE
+
+CORPUS_SYNC_PROJECTION = {
+    "_id": 1,
+    "description": 1,
+    "correct_word": 1,
+    "updated_date": 1,
+}
+
+snapshot_versions = itertools.count(1)
+
+
+class CorpusSnapshot:
+    """
+    단어 추론에 사용하는 코퍼스의 특정 시점 상태
+
+    한 번 만든 스냅샷은 수정하지 않으며, 코퍼스가 바뀌면 새 스냅샷을 만들어 교체한다.
+
+    Attributes:
+        ids (np.ndarray): 코퍼스 각 문장의 MongoDB 문서 ID (문자열)
+        store (CorpusStore): 코퍼스 임베딩, 레이블 코드, 레이블 어휘
+        index (VectorIndex): 코퍼스 임베딩의 벡터 인덱스
+        last_id (Optional[ObjectId]): 반영된 문서 중 가장 큰 ID
+        last_updated_date (Optional[datetime]): 반영된 문서 중 가장 최근의 updated_date
+        version (int): 프로세스 안에서 스냅샷마다 증가하는 버전 (캐시 무효화에 사용)
+    """
+
+    __slots__ = ("ids", "store", "index", "last_id", "last_updated_date", "version")
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        store: CorpusStore,
+        last_updated_date: Optional[datetime] = None,
+    ):
+        self.ids = ids
+        self.store = store
+        self.index = build_index(store.embeddings)
+        self.last_id = ObjectId(max(ids)) if len(ids) else None
+        self.last_updated_date = last_updated_date
+        self.version = next(snapshot_versions)
+
+    @property
+    def size(self) -> int:
+        return self.ids.shape[0]
+
+
+class CorpusHolder:
+    """
+    현재 코퍼스 스냅샷을 보관하고 원자적으로 교체하는 객체
+
+    요청은 처리 시작 시 get()으로 스냅샷을 한 번 가져와 끝까지 사용하므로,
+    처리 도중 스냅샷이 교체되어도 일관된 상태를 본다.
+
+    Attributes:
+        sync_lock (threading.Lock): 동기화 작업이 동시에 실행되지 않도록 막는 잠금
+    """
+
+    def __init__(self, snapshot: CorpusSnapshot):
+        self._snapshot = snapshot
+        self.sync_lock = threading.Lock()
+
+    def get(self) -> CorpusSnapshot:
+        return self._snapshot
+
+    def swap(self, snapshot: CorpusSnapshot) -> None:
+        self._snapshot = snapshot
+
+
+def get_last_updated_date(
+    documents: List[Dict[str, Any]], default: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    문서 중 가장 최근의 updated_date를 반환한다.
+
+    Args:
+        documents (List[Dict[str, Any]]): training_data 문서
+        default (Optional[datetime]): updated_date가 없을 때 반환할 값
+
+    Returns:
+        Optional[datetime]: 가장 최근의 updated_date와 default 중 더 나중 값
+    """
+
+    updated_dates = [
+        document["updated_date"]
+        for document in documents
+        if document.get("updated_date") is not None
+    ]
+
+    if default is not None:
+        updated_dates.append(default)
+
+    return max(updated_dates, default=None)
+
+
+def encode_in_batches(model: Any, descriptions: List[str]) -> np.ndarray:
+    """
+    문장 목록을 CORPUS_SYNC_BATCH_SIZE개씩 나누어 인코딩하고 정규화한다.
+
+    코퍼스 임베딩은 로드하거나 동기화할 때 한 번만 정규화해 두므로,
+    검색할 때는 질의만 정규화하면 내적이 곧 코사인 유사도가 된다.
+
+    Args:
+        model (Any): 문장 인코더 (SentenceTransformer)
+        descriptions (List[str]): 인코딩할 문장 목록
+
+    Returns:
+        np.ndarray: 정규화된 문장 임베딩 (float32)
+    """
+
+    return normalize_embeddings(
+        np.concatenate(
+            [
+                model.encode(
+                    descriptions[start : start + CORPUS_SYNC_BATCH_SIZE],
+                    batch_size=CORPUS_SYNC_BATCH_SIZE,
+                )
+                for start in range(0, len(descriptions), CORPUS_SYNC_BATCH_SIZE)
+            ]
+        )
+    )
+
+
+def apply_changes(
+    snapshot: CorpusSnapshot, documents: List[Dict[str, Any]], model: Any
+) -> CorpusSnapshot:
+    """
+    새로 추가되거나 변경된 문서만 인코딩해 반영한 새 스냅샷을 만든다.
+
+    기존 스냅샷에 있는 ID의 문서는 해당 행을 교체하고, 없는 ID의 문서는 뒤에 덧붙인다.
+    기존 레이블 코드는 그대로 두고 새 레이블만 어휘 목록 끝에 추가한다.
+
+    Args:
+        snapshot (CorpusSnapshot): 현재 코퍼스 스냅샷
+        documents (List[Dict[str, Any]]): 추가되거나 변경된 training_data 문서
+        model (Any): 문장 인코더 (SentenceTransformer)
+
+    Returns:
+        CorpusSnapshot: 변경 사항이 반영된 새 스냅샷
+    """
+
+    changed_ids = np.array([str(document["_id"]) for document in documents])
+    changed_embeddings = encode_in_batches(
+        model, [document["description"] for document in documents]
+    )
+
+    store = snapshot.store
+    labels = list(store.labels)
+    label_positions = {label: code for code, label in enumerate(labels)}
+    changed_label_codes = np.empty(len(documents), dtype=np.int32)
+
+    for position, label in enumerate(
+        document["correct_word"] for document in documents
+    ):
+        if label not in label_positions:
+            label_positions[label] = len(labels)
+            labels.append(label)
+        changed_label_codes[position] = label_positions[label]
+
+    row_positions = {document_id: row for row, document_id in enumerate(snapshot.ids)}
+    is_update = np.array(
+        [document_id in row_positions for document_id in changed_ids], dtype=bool
+    )
+    updated_rows = [
+        row_positions[document_id] for document_id in changed_ids[is_update]
+    ]
+
+    # 빈 코퍼스로 시작한 경우 기존 임베딩의 차원이 0이므로, 인코딩한 임베딩의 차원에 맞춘다.
+    base_embeddings = (
+        store.embeddings
+        if snapshot.size
+        else np.empty((0, changed_embeddings.shape[1]), dtype=store.embeddings.dtype)
+    )
+
+    ids = np.concatenate((snapshot.ids, changed_ids[~is_update]))
+    embeddings = np.concatenate(
+        (base_embeddings, changed_embeddings[~is_update])
+    ).astype(store.embeddings.dtype, copy=False)
+    label_codes = np.concatenate(
+        (store.label_codes, changed_label_codes[~is_update])
+    ).astype(np.int32, copy=False)
+
+    embeddings[updated_rows] = changed_embeddings[is_update]
+    label_codes[updated_rows] = changed_label_codes[is_update]
+
+    return CorpusSnapshot(
+        ids,
+        CorpusStore(embeddings, label_codes, labels),
+        get_last_updated_date(documents, snapshot.last_updated_date),
+    )
+
+
+def sync_corpus(
+    holder: CorpusHolder,
+    client: MongoClient,
+    model: Any,
+    chunk_size: int = CORPUS_LOAD_CHUNK_SIZE,
+) -> Dict[str, int]:
+    """
+    마지막 동기화 이후 추가되거나 변경된 training_data 문서를 코퍼스에 반영한다.
+
+    _id가 마지막으로 반영한 ID보다 크거나, updated_date가 마지막으로 반영한 시각보다
+    나중인 문서만 필요한 필드로 chunk_size개씩 나누어 가져와 인코딩한 뒤 스냅샷을 교체한다.
+    삭제된 문서는 반영하지 않는다.
+
+    Args:
+        holder (CorpusHolder): 현재 코퍼스 스냅샷을 보관하는 객체
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        model (Any): 문장 인코더 (SentenceTransformer)
+        chunk_size (int): 한 번에 읽을 문서 수
+
+    Returns:
+        Dict[str, int]: 추가된 문서 수, 변경된 문서 수, 동기화 후 코퍼스 크기
+    """
+
+    with holder.sync_lock:
+        snapshot = holder.get()
+
+        filters = {}
+        if snapshot.last_id is not None:
+            filters = {"_id": {"$gt": snapshot.last_id}}
+        if snapshot.last_updated_date is not None:
+            filters = {
+                "$or": [filters, {"updated_date": {"$gt": snapshot.last_updated_date}}]
+            }
+
+        documents = [
+            document
+            for chunk in iter_document_chunks(
+                client, "training_data", filters, CORPUS_SYNC_PROJECTION, chunk_size
+            )
+            for document in chunk
+        ]
+
+        if not documents:
+            return {"added": 0, "updated": 0, "corpus_size": snapshot.size}
+
+        new_snapshot = apply_changes(snapshot, documents, model)
+        holder.swap(new_snapshot)
+
+        added = new_snapshot.size - snapshot.size
+
+        logging.info(
+            "Synced training_data: %d added, %d updated", added, len(documents) - added
+        )
+
+        return {
+            "added": added,
+            "updated": len(documents) - added,
+            "corpus_size": new_snapshot.size,
+        }
+
+
+async def run_corpus_sync(
+    get_bundles: Callable[[], List[Any]], client: MongoClient, interval_seconds: float
+) -> None:
+    """
+    interval_seconds 간격으로 메모리에 있는 모델 버전들의 코퍼스를 동기화하는 백그라운드 작업
+
+    Args:
+        get_bundles (Callable[[], List[Any]]): 동기화할 모델 버전의 묶음(ModelBundle) 목록을 반환하는 함수
+        client (MongoClient): 데이터베이스와의 소통에 사용할 클라이언트
+        interval_seconds (float): 동기화 간격 (초)
+    """
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        for bundle in get_bundles():
+            try:
+                await asyncio.to_thread(
+                    sync_corpus, bundle.corpus_holder, client, bundle.model
+                )
+            except Exception:
+                logging.error(
+                    "An error occurred while syncing training_data (%s)",
+                    bundle.version,
+                )
@@ -0,0 +1,206 @@
+"""
+코퍼스 임베딩을 디스크에 저장하고 메모리 맵으로 불러오는 캐시 모듈
+
+캐시는 모델 버전, 코퍼스 해시, 임베딩 자료형별로 디렉터리를 따로 만들어 저장하며,
+각 디렉터리는 다음 파일로 구성된다.
+    - manifest.json: 캐시 형식 버전, 모델 버전, 코퍼스 해시, 임베딩 자료형과 크기
+    - embeddings.npy: 정규화된 코퍼스 임베딩 (float32 혹은 float16)
+    - label_codes.npy: 코퍼스 각 문장의 정수 레이블 코드 (int32)
+    - labels.npy: 레이블 코드에 해당하는 단어 목록
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Iterable, Optional
+
+from app.services.corpus_store import CorpusStore
+from app.settings.constants import CORPUS_EMBEDDING_DTYPE
+
+# 3: 코퍼스 임베딩을 정규화해서 저장한다.
+CACHE_FORMAT_VERSION = 3
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+def compute_corpus_hash(descriptions: Iterable[str], labels: Iterable[str]) -> str:
+    """
+    코퍼스의 문장과 레이블 내용으로 해시 값을 계산한다.
+
+    Args:
+        descriptions (Iterable[str]): 코퍼스의 문장 목록
+        labels (Iterable[str]): 각 문장의 레이블 목록
+
+    Returns:
+        str: 코퍼스 내용의 sha256 해시 값
+    """
+
+    corpus_hash = hashlib.sha256()
+    update_corpus_hash(corpus_hash, descriptions, labels)
+
+    return corpus_hash.hexdigest()
+
+
+def update_corpus_hash(
+    corpus_hash: Any, descriptions: Iterable[str], labels: Iterable[str]
+) -> None:
+    """
+    코퍼스의 일부 문장과 레이블을 해시 객체에 반영한다. 코퍼스를 나누어 읽을 때 사용한다.
+
+    Args:
+        corpus_hash (Any): hashlib.sha256() 해시 객체
+        descriptions (Iterable[str]): 코퍼스의 문장 목록
+        labels (Iterable[str]): 각 문장의 레이블 목록
+    """
+
+    for description, label in zip(descriptions, labels):
+        corpus_hash.update(str(description).encode("utf-8"))
+        corpus_hash.update(b"\0")
+        corpus_hash.update(str(label).encode("utf-8"))
+        corpus_hash.update(b"\n")
+
+
+def get_cache_path(
+    cache_dir: str,
+    model_version: str,
+    corpus_hash: str,
+    dtype: str = CORPUS_EMBEDDING_DTYPE,
+) -> str:
+    """
+    모델 버전, 코퍼스 해시, 임베딩 자료형에 해당하는 캐시 디렉터리 경로를 반환한다.
+
+    Args:
+        cache_dir (str): 캐시를 저장하는 최상위 디렉터리
+        model_version (str): 임베딩을 만든 모델 버전
+        corpus_hash (str): 코퍼스 해시 값
+        dtype (str): 임베딩 자료형 ("float32" 혹은 "float16")
+
+    Returns:
+        str: 캐시 디렉터리 경로
+    """
+
+    return os.path.join(cache_dir, f"{model_version}-{corpus_hash[:16]}-{dtype}")
+
+
+def load_corpus_embeddings(
+    cache_dir: str,
+    model_version: str,
+    corpus_hash: str,
+    dtype: str = CORPUS_EMBEDDING_DTYPE,
+) -> Optional[CorpusStore]:
+    """
+    저장된 코퍼스 저장소를 읽기 전용 메모리 맵으로 불러온다.
+
+    같은 호스트의 여러 워커가 같은 파일을 메모리 맵으로 열면 페이지 캐시를 공유한다.
+
+    Args:
+        cache_dir (str): 캐시를 저장하는 최상위 디렉터리
+        model_version (str): 임베딩을 만든 모델 버전
+        corpus_hash (str): 코퍼스 해시 값
+        dtype (str): 임베딩 자료형 ("float32" 혹은 "float16")
+
+    Returns:
+        Optional[CorpusStore]: 캐시가 유효한 경우 코퍼스 저장소, 그렇지 않은 경우는 None
+    """
+
+    cache_path = get_cache_path(cache_dir, model_version, corpus_hash, dtype)
+
+    try:
+        with open(
+            os.path.join(cache_path, MANIFEST_FILE_NAME), encoding="utf-8"
+        ) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        expected_manifest = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "model_version": model_version,
+            "corpus_hash": corpus_hash,
+            "dtype": dtype,
+        }
+
+        if any(manifest.get(key) != value for key, value in expected_manifest.items()):
+            logging.warning("Corpus embedding cache does not match: %s", cache_path)
+            return None
+
+        store = CorpusStore.load(cache_path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logging.warning("Failed to load corpus embedding cache: %s", cache_path)
+        return None
+
+    if (
+        list(store.embeddings.shape) != manifest["shape"]
+        or store.embeddings.dtype != dtype
+    ):
+        logging.warning("Corpus embedding cache is truncated: %s", cache_path)
+        return None
+
+    return store
+
+
+def save_corpus_embeddings(
+    cache_dir: str,
+    model_version: str,
+    corpus_hash: str,
+    store: CorpusStore,
+) -> Optional[str]:
+    """
+    코퍼스 저장소를 캐시 디렉터리에 저장한다.
+
+    임시 디렉터리에 모든 파일을 쓴 뒤 이름을 바꾸므로,
+    동시에 시작한 다른 워커가 쓰다 만 캐시를 읽는 일은 없다.
+
+    Args:
+        cache_dir (str): 캐시를 저장하는 최상위 디렉터리
+        model_version (str): 임베딩을 만든 모델 버전
+        corpus_hash (str): 코퍼스 해시 값
+        store (CorpusStore): 저장할 코퍼스 저장소
+
+    Returns:
+        Optional[str]: 저장에 성공한 경우 캐시 디렉터리 경로, 실패한 경우는 None
+    """
+
+    dtype = store.embeddings.dtype.name
+    cache_path = get_cache_path(cache_dir, model_version, corpus_hash, dtype)
+
+    if os.path.isdir(cache_path):
+        return cache_path
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = tempfile.mkdtemp(dir=cache_dir, prefix=".tmp-")
+    except OSError:
+        logging.warning("Failed to create corpus embedding cache in %s", cache_dir)
+        return None
+
+    try:
+        store.save(temp_path)
+
+        with open(
+            os.path.join(temp_path, MANIFEST_FILE_NAME), "w", encoding="utf-8"
+        ) as manifest_file:
+            json.dump(
+                {
+                    "format_version": CACHE_FORMAT_VERSION,
+                    "model_version": model_version,
+                    "corpus_hash": corpus_hash,
+                    "dtype": dtype,
+                    "shape": list(store.embeddings.shape),
+                },
+                manifest_file,
+            )
+
+        os.rename(temp_path, cache_path)
+
+        return cache_path
+    except OSError:
+        shutil.rmtree(temp_path, ignore_errors=True)
+
+        if os.path.isdir(cache_path):
+            return cache_path
+
+        logging.warning("Failed to save corpus embedding cache: %s", cache_path)
+        return None
@@ -0,0 +1,321 @@
+"""
+피드백 문서를 메모리 대기열에 모았다가 백그라운드에서 한 번에 저장하는 모듈
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from bson import ObjectId, json_util
+from pymongo import MongoClient
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.core.mongodb_utils import get_mongodb_client, insert_documents
+from app.services.inference_pool import create_server_busy_exception
+from app.settings.constants import (
+    FEEDBACK_FLUSH_INTERVAL_MS,
+    FEEDBACK_FLUSH_SIZE,
+    FEEDBACK_MAX_RETRIES,
+    FEEDBACK_QUEUE_SIZE,
+    FEEDBACK_RETRY_BACKOFF_MS,
+    FEEDBACK_SHUTDOWN_TIMEOUT_SECONDS,
+    FEEDBACK_SPILL_PATH,
+)
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+class FeedbackWriter:
+    """
+    피드백 문서를 쓰기 지연(write-behind) 방식으로 저장하는 객체
+
+    submit은 문서에 _id를 붙여 대기열에 넣고 곧바로 반환한다.
+    백그라운드 작업은 flush_size개가 모이거나 flush_interval_ms가 지나면
+    insert_many(ordered=False)로 한 번에 저장하고, 실패하면 지수 백오프로 재시도한다.
+    _id를 미리 만들어 두므로 재시도 중 생긴 중복 키 오류는 이미 저장된 것으로 본다.
+    재시도를 모두 실패한 문서와 종료 시 제한 시간 안에 저장하지 못한 문서는
+    spill_path에 한 줄에 하나씩 Extended JSON으로 기록한다. (mongoimport로 다시 넣을 수 있다.)
+
+    Attributes:
+        collection_name (str): 문서를 저장할 컬렉션의 이름
+        max_queue_size (int): 대기열에 담을 수 있는 문서 수
+        flush_size (int): 한 번에 저장할 최대 문서 수
+        flush_interval_ms (float): 첫 문서가 들어온 뒤 저장하기까지 기다리는 최대 시간 (ms)
+        max_retries (int): 저장 실패 시 재시도 횟수
+        retry_backoff_ms (float): 첫 재시도 전 대기 시간 (ms), 재시도마다 두 배로 늘어남
+        shutdown_timeout_seconds (float): 종료 시 남은 문서를 저장하는 데 쓸 최대 시간 (초)
+        spill_path (str): 저장하지 못한 문서를 기록할 파일 경로
+    """
+
+    def __init__(
+        self,
+        get_client: Callable[[], MongoClient],
+        collection_name: str,
+        max_queue_size: int,
+        flush_size: int,
+        flush_interval_ms: float,
+        max_retries: int,
+        retry_backoff_ms: float,
+        shutdown_timeout_seconds: float,
+        spill_path: str,
+    ):
+        self.get_client = get_client
+        self.collection_name = collection_name
+        self.max_queue_size = max(1, max_queue_size)
+        self.flush_size = max(1, flush_size)
+        self.flush_interval_ms = flush_interval_ms
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_ms = retry_backoff_ms
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+        self.spill_path = spill_path
+        self.submitted = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.retries = 0
+        self.spilled = 0
+        self.flushes = 0
+        self.flush_ms_last = 0.0
+        self.flush_ms_sum = 0.0
+        self.flush_ms_max = 0.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight: List[Dict[str, Any]] = []
+        self._closing = False
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def submit(self, document: Dict[str, Any]) -> str:
+        """
+        문서를 대기열에 넣고 문서의 ID를 반환한다. 대기열이 가득 차면 503 CustomException을 발생시킨다.
+
+        Args:
+            document (Dict[str, Any]): 저장할 문서, _id가 없으면 새로 만들어 붙인다.
+
+        Returns:
+            str: 문서의 ID
+        """
+
+        self._start()
+
+        if self._queue.qsize() >= self.max_queue_size:
+            self.rejected += 1
+            raise create_server_busy_exception("feedback")
+
+        document.setdefault("_id", ObjectId())
+        self._queue.put_nowait(document)
+        self.submitted += 1
+
+        return str(document["_id"])
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+
+        # 백그라운드 작업이 멈췄거나 이벤트 루프가 바뀐 경우, 저장 중이던 문서와 대기열에 남은 문서를
+        # 새 루프의 대기열로 옮겨 다시 저장한다. 이미 저장된 문서는 중복 키 오류로 걸러진다.
+        queue = asyncio.Queue()
+
+        for document in self._in_flight:
+            queue.put_nowait(document)
+
+        while self._queue is not None and not self._queue.empty():
+            queue.put_nowait(self._queue.get_nowait())
+
+        self._loop = loop
+        self._closing = False
+        self._queue = queue
+        self._in_flight = []
+        self._worker = loop.create_task(self._run())
+
+    async def _collect_batch(self) -> None:
+        # 취소되더라도 대기열에서 꺼낸 문서를 잃지 않도록 _in_flight에 바로 담는다.
+        self._in_flight.append(await self._queue.get())
+        deadline = time.perf_counter() + self.flush_interval_ms / 1000
+
+        while len(self._in_flight) < self.flush_size:
+            timeout = deadline - time.perf_counter()
+
+            if timeout <= 0:
+                break
+
+            try:
+                self._in_flight.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self) -> None:
+        # wait_for가 취소를 삼키는 경우가 있어, 취소와 별도로 _closing 플래그로도 멈춘다.
+        while not self._closing:
+            try:
+                await self._collect_batch()
+                failed_documents = await self._flush(self._in_flight)
+            except Exception:
+                logging.exception("Failed to flush feedback documents")
+                failed_documents = self._in_flight
+
+            self._in_flight = []
+
+            if failed_documents:
+                self._spill(failed_documents)
+
+    async def _flush(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        문서를 저장하고, 재시도를 모두 실패해 저장하지 못한 문서를 반환한다.
+        """
+
+        started_at = time.perf_counter()
+        pending = documents
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self.retries += 1
+                backoff_ms = self.retry_backoff_ms * 2 ** (attempt - 1)
+                await asyncio.sleep(backoff_ms * random.uniform(0.5, 1.0) / 1000)
+
+            try:
+                self.inserted += await asyncio.to_thread(
+                    insert_documents, self.get_client(), self.collection_name, pending
+                )
+                pending = []
+            except BulkWriteError as exc:
+                pending = self._get_failed_documents(pending, exc)
+            except PyMongoError as exc:
+                logging.warning("Failed to flush feedback documents: %s", exc)
+
+            if not pending:
+                break
+
+        self._record_flush((time.perf_counter() - started_at) * 1000)
+
+        return pending
+
+    def _get_failed_documents(
+        self, documents: List[Dict[str, Any]], exc: BulkWriteError
+    ) -> List[Dict[str, Any]]:
+        write_errors = exc.details.get("writeErrors", [])
+        failed_indexes = [
+            write_error["index"]
+            for write_error in write_errors
+            if write_error.get("code") != DUPLICATE_KEY_ERROR_CODE
+        ]
+        duplicates = len(write_errors) - len(failed_indexes)
+
+        self.inserted += exc.details.get("nInserted", 0)
+        self.duplicates += duplicates
+
+        if failed_indexes:
+            logging.warning(
+                "Failed to insert %d feedback documents", len(failed_indexes)
+            )
+
+        return [documents[index] for index in failed_indexes]
+
+    def _record_flush(self, flush_ms: float) -> None:
+        self.flushes += 1
+        self.flush_ms_last = flush_ms
+        self.flush_ms_sum += flush_ms
+        self.flush_ms_max = max(self.flush_ms_max, flush_ms)
+
+    def _spill(self, documents: List[Dict[str, Any]]) -> None:
+        spill_dir = os.path.dirname(self.spill_path)
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+        with open(self.spill_path, "a", encoding="utf-8") as spill_file:
+            for document in documents:
+                spill_file.write(json_util.dumps(document) + "\n")
+
+        self.spilled += len(documents)
+        logging.error(
+            "Spilled %d feedback documents to %s", len(documents), self.spill_path
+        )
+
+    async def _drain(self, documents: List[Dict[str, Any]]) -> None:
+        while documents:
+            batch = documents[: self.flush_size]
+            failed_documents = await self._flush(batch)
+            del documents[: len(batch)]
+
+            if failed_documents:
+                self._spill(failed_documents)
+
+    async def close(self) -> None:
+        """
+        백그라운드 작업을 멈추고, 대기열에 남은 문서를 제한 시간 안에 저장한다.
+        저장하지 못한 문서는 spill_path에 기록한다.
+        """
+
+        if self._worker is None:
+            return
+
+        self._closing = True
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        self._worker = None
+
+        # 저장 도중 취소된 문서는 다시 저장한다. 이미 저장되었다면 중복 키 오류로 걸러진다.
+        documents = self._in_flight
+        self._in_flight = []
+
+        while not self._queue.empty():
+            documents.append(self._queue.get_nowait())
+
+        try:
+            await asyncio.wait_for(
+                self._drain(documents), self.shutdown_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        if documents:
+            self._spill(documents)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        대기열 길이와 저장 지연 시간 등 현재 상태를 반환한다.
+
+        Returns:
+            Dict[str, Any]: 대기열 길이, 문서 처리 수, 저장 지연 시간 통계
+        """
+
+        return {
+            "queue_size": self.queue_size,
+            "max_queue_size": self.max_queue_size,
+            "submitted": self.submitted,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected,
+            "retries": self.retries,
+            "spilled": self.spilled,
+            "flushes": self.flushes,
+            "flush_ms": {
+                "last": self.flush_ms_last,
+                "mean": self.flush_ms_sum / self.flushes if self.flushes else 0.0,
+                "max": self.flush_ms_max,
+            },
+        }
+
+
+feedback_writer = FeedbackWriter(
+    get_mongodb_client,
+    "feedback_data",
+    FEEDBACK_QUEUE_SIZE,
+    FEEDBACK_FLUSH_SIZE,
+    FEEDBACK_FLUSH_INTERVAL_MS,
+    FEEDBACK_MAX_RETRIES,
+    FEEDBACK_RETRY_BACKOFF_MS,
+    FEEDBACK_SHUTDOWN_TIMEOUT_SECONDS,
+    FEEDBACK_SPILL_PATH,
+)
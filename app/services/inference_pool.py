@@ -0,0 +1,116 @@
+"""
+모델 추론처럼 CPU를 오래 쓰는 작업을 이벤트 루프 밖에서 실행하는 작업 풀 모듈
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.core.exceptions import CustomException
+from app.settings.constants import HTTP_STATUS_CODE, HTTP_STATUS_MESSAGE
+
+
+def create_server_busy_exception(attribute: str = "model") -> CustomException:
+    """
+    대기열이 가득 차 요청을 받을 수 없을 때 반환할 예외를 만든다.
+
+    Args:
+        attribute (str): 예외의 원인이 된 속성
+
+    Returns:
+        CustomException: 503 상태 코드의 CustomException
+    """
+
+    return CustomException(
+        status_code=HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"],
+        message=HTTP_STATUS_MESSAGE["SERVICE_UNAVAILABLE"],
+        attribute=attribute,
+        reason="The server is busy processing other requests. Please try again later.",
+    )
+
+
+class InferencePool:
+    """
+    크기가 정해진 실행기(executor)와 대기열로 작업을 실행하는 풀
+
+    실행 중이거나 대기 중인 작업이 max_workers + max_queue_size개에 이르면
+    새 작업은 기다리지 않고 곧바로 503 CustomException으로 거절한다.
+
+    kind가 "process"인 경우 작업은 fork된 자식 프로세스에서 실행되므로,
+    자식 프로세스가 만들어진 뒤의 코퍼스 동기화 결과는 반영되지 않으며,
+    자식 프로세스가 채운 캐시도 부모 프로세스와 공유되지 않는다.
+    따라서 단어 추론 라우터는 "process"를 지원하지 않는다 (global_config.check_inference_pool_kind).
+
+    Attributes:
+        max_workers (int): 동시에 실행할 수 있는 작업 수
+        max_queue_size (int): 실행을 기다릴 수 있는 작업 수
+        pending (int): 실행 중이거나 대기 중인 작업 수
+        rejected (int): 대기열이 가득 차 거절한 작업 수
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int, kind: str = "thread"):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.pending = 0
+        self.rejected = 0
+        self._executor = self._create_executor(kind, self.max_workers)
+
+    @staticmethod
+    def _create_executor(kind: str, max_workers: int) -> Executor:
+        if kind == "thread":
+            return ThreadPoolExecutor(max_workers, thread_name_prefix="inference")
+        if kind == "process":
+            return ProcessPoolExecutor(max_workers)
+
+        raise ValueError(f"Unsupported inference pool kind: {kind}")
+
+    @property
+    def is_full(self) -> bool:
+        return self.pending >= self.max_workers + self.max_queue_size
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        작업을 실행기에서 실행하고 결과를 반환한다.
+
+        Args:
+            func (Callable[..., Any]): 실행할 함수
+            *args (Any): 함수에 전달할 인자
+
+        Returns:
+            Any: 함수의 반환 값
+        """
+
+        if self.is_full:
+            self.rejected += 1
+            raise create_server_busy_exception()
+
+        self.pending += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, func, *args
+            )
+        finally:
+            self.pending -= 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        현재 풀의 상태를 반환한다.
+
+        Returns:
+            Dict[str, int]: 작업 수, 대기열 크기, 실행 중이거나 대기 중인 작업 수, 거절한 작업 수
+        """
+
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "pending": self.pending,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """
+        실행기를 종료한다. 아직 시작하지 않은 작업은 취소한다.
+        """
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,545 @@
+"""
+모델 버전의 압축 파일(model.zip)을 저장소에서 받아 무결성을 확인하고 압축을 푸는 모듈
+
+저장소에는 모델 버전별로 다음 파일을 둔다.
+    - <접두사>/<버전>/model.zip: 문장 인코더 디렉터리를 압축한 파일
+    - <접두사>/<버전>/manifest.json: create_manifest로 만든 압축 파일의 크기, sha256, 파일 목록
+로컬에는 MODEL_ROOT/<버전>/ 아래에 압축을 풀고, 마지막에 받은 매니페스트를 .manifest.json으로 저장한다.
+.manifest.json이 저장소의 매니페스트와 같고 파일 크기가 모두 맞으면 받지도 풀지도 않는다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.settings.constants import (
+    AWS_ACCESS_KEY_ID,
+    AWS_S3_BUCKET_NAME,
+    AWS_SECRET_ACCESS_KEY,
+    MODEL_ARTIFACT_BACKEND,
+    MODEL_ARTIFACT_FS_ROOT,
+    MODEL_DOWNLOAD_CONCURRENCY,
+    MODEL_DOWNLOAD_MAX_RETRIES,
+    MODEL_DOWNLOAD_PART_BYTES,
+    MODEL_KEEP_ARCHIVE,
+    MODEL_ROOT,
+    MODEL_S3_PREFIX,
+)
+
+ARCHIVE_NAME = "model.zip"
+MANIFEST_NAME = "manifest.json"
+LOCAL_MANIFEST_NAME = ".manifest.json"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def get_file_sha256(path: str) -> str:
+    """
+    파일을 HASH_CHUNK_BYTES씩 읽어 sha256 해시 값을 구한다.
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        str: sha256 해시 값 (16진수)
+    """
+
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def create_manifest(archive_path: str) -> Dict[str, Any]:
+    """
+    압축 파일의 매니페스트를 만든다. 모델을 올릴 때 manifest.json으로 함께 올린다.
+
+    Args:
+        archive_path (str): 압축 파일 경로
+
+    Returns:
+        Dict[str, Any]: 압축 파일의 크기, sha256, 압축을 푼 파일별 크기
+    """
+
+    with zipfile.ZipFile(archive_path) as archive:
+        files = {
+            info.filename: info.file_size
+            for info in archive.infolist()
+            if not info.is_dir()
+        }
+
+    return {
+        "size": os.path.getsize(archive_path),
+        "sha256": get_file_sha256(archive_path),
+        "files": files,
+    }
+
+
+def read_local_manifest(model_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    로컬 모델 디렉터리에 저장한 매니페스트(.manifest.json)를 읽는다.
+
+    Args:
+        model_dir (str): 모델 디렉터리 경로
+
+    Returns:
+        Optional[Dict[str, Any]]: 매니페스트, 없거나 읽을 수 없으면 None
+    """
+
+    try:
+        with open(
+            os.path.join(model_dir, LOCAL_MANIFEST_NAME), encoding="utf-8"
+        ) as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+
+def get_model_revision(model_dir: str) -> str:
+    """
+    로컬 모델 디렉터리의 압축 파일 sha256 앞 12자리를 반환한다.
+
+    같은 버전을 다시 올려도 달라지므로, 모델 파일로 만든 파일과 캐시의 키에 붙여 쓴다.
+
+    Args:
+        model_dir (str): 모델 디렉터리 경로
+
+    Returns:
+        str: sha256 앞 12자리, 받은 적이 없는 디렉터리(.manifest.json이 없음)이면 빈 문자열
+    """
+
+    manifest = read_local_manifest(model_dir)
+
+    if not manifest:
+        return ""
+
+    return str(manifest.get("sha256", ""))[:12]
+
+
+def split_ranges(size: int, part_bytes: int) -> List[Tuple[int, int]]:
+    """
+    0부터 size까지를 part_bytes 크기의 범위로 나눈다.
+
+    Args:
+        size (int): 전체 크기 (bytes)
+        part_bytes (int): 범위 하나의 크기 (bytes)
+
+    Returns:
+        List[Tuple[int, int]]: (시작, 끝) 범위 목록, 끝은 포함하지 않음
+    """
+
+    return [
+        (start, min(start + part_bytes, size)) for start in range(0, size, part_bytes)
+    ]
+
+
+class FileSystemBackend:
+    """
+    S3 버킷과 같은 키 구조의 로컬 디렉터리를 저장소로 사용하는 객체 (공유 볼륨, 테스트)
+
+    Attributes:
+        root (str): 저장소의 최상위 디렉터리
+        requests (int): 받은 요청 수
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.requests = 0
+
+    def read(self, key: str) -> bytes:
+        self.requests += 1
+
+        with open(os.path.join(self.root, key), "rb") as file:
+            return file.read()
+
+    def read_range(self, key: str, start: int, end: int) -> bytes:
+        self.requests += 1
+
+        with open(os.path.join(self.root, key), "rb") as file:
+            file.seek(start)
+            return file.read(end - start)
+
+    def exists(self, key: str) -> bool:
+        return os.path.isfile(os.path.join(self.root, key))
+
+
+class S3Backend:
+    """
+    S3 버킷을 저장소로 사용하는 객체
+
+    boto3 클라이언트는 처음 요청할 때 한 번 만들며, 동시에 받는 범위 수만큼 연결을 재사용한다.
+
+    Attributes:
+        bucket (str): 버킷 이름
+        max_connections (int): 클라이언트의 최대 연결 수
+        requests (int): 받은 요청 수
+    """
+
+    def __init__(self, bucket: str, max_connections: int):
+        self.bucket = bucket
+        self.max_connections = max_connections
+        self.requests = 0
+        self._client = None
+        self._lock = threading.Lock()
+
+    def read(self, key: str) -> bytes:
+        self.requests += 1
+
+        return self._get_client().get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def read_range(self, key: str, start: int, end: int) -> bytes:
+        self.requests += 1
+        response = self._get_client().get_object(
+            Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end - 1}"
+        )
+
+        return response["Body"].read()
+
+    def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self._get_client().head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+
+        return True
+
+    def _get_client(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                import boto3
+                from botocore.config import Config
+
+                self._client = boto3.client(
+                    "s3",
+                    aws_access_key_id=AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+                    config=Config(max_pool_connections=self.max_connections),
+                )
+
+        return self._client
+
+
+def create_backend(kind: str) -> Optional[Any]:
+    """
+    설정한 종류의 저장소 객체를 만든다.
+
+    Args:
+        kind (str): "s3", "filesystem" 혹은 빈 문자열
+
+    Returns:
+        Optional[Any]: 저장소 객체, 빈 문자열이면 None
+    """
+
+    if not kind:
+        return None
+    if kind == "s3":
+        return S3Backend(AWS_S3_BUCKET_NAME, MODEL_DOWNLOAD_CONCURRENCY)
+    if kind == "filesystem":
+        return FileSystemBackend(MODEL_ARTIFACT_FS_ROOT)
+
+    raise ValueError(f"Unsupported model artifact backend: {kind}")
+
+
+class ModelArtifactManager:
+    """
+    모델 버전의 파일을 저장소에서 받아 로컬에 준비하는 객체
+
+    압축 파일은 part_bytes 크기의 범위 요청을 concurrency개씩 동시에 보내 받으며,
+    받은 범위는 메모리에 모으지 않고 임시 파일의 제자리에 바로 쓴다.
+    받은 파일의 크기와 sha256이 매니페스트와 다르면 버리고 ValueError를 발생시킨다.
+    압축은 임시 디렉터리에 파일 단위로 스트리밍하며 풀고 (zipfile이 CRC를 검사함),
+    모두 풀린 뒤에 모델 디렉터리로 옮긴다. 로컬 매니페스트는 마지막에 쓰므로,
+    중간에 실패한 디렉터리는 확인된 복사본으로 취급되지 않는다.
+
+    Attributes:
+        backend (Optional[Any]): 저장소 객체, None이면 로컬 파일만 사용
+        root (str): 모델 버전별 디렉터리를 두는 최상위 디렉터리
+        prefix (str): 저장소 키 접두사
+        part_bytes (int): 범위 요청 하나의 크기 (bytes)
+        concurrency (int): 동시에 보낼 범위 요청 수
+        max_retries (int): 범위 요청이 실패했을 때 재시도 횟수
+        keep_archive (bool): 압축을 푼 뒤에도 압축 파일을 남길지 여부
+        cache_hits (int): 받지 않고 로컬 복사본을 사용한 횟수
+        downloads (int): 압축 파일을 받은 횟수
+        downloaded_bytes (int): 받은 압축 파일의 전체 크기 (bytes)
+        last_fetch_seconds (Optional[float]): 마지막으로 받고 압축을 푸는 데 걸린 시간 (초)
+        remote_versions (Set[str]): 저장소에 있다고 확인한 모델 버전
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Any],
+        root: str = MODEL_ROOT,
+        prefix: str = MODEL_S3_PREFIX,
+        part_bytes: int = MODEL_DOWNLOAD_PART_BYTES,
+        concurrency: int = MODEL_DOWNLOAD_CONCURRENCY,
+        max_retries: int = MODEL_DOWNLOAD_MAX_RETRIES,
+        keep_archive: bool = MODEL_KEEP_ARCHIVE,
+    ):
+        self.backend = backend
+        self.root = root
+        self.prefix = prefix
+        self.part_bytes = max(1, part_bytes)
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max(0, max_retries)
+        self.keep_archive = keep_archive
+        self.cache_hits = 0
+        self.downloads = 0
+        self.downloaded_bytes = 0
+        self.last_fetch_seconds: Optional[float] = None
+        self.remote_versions: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get_key(self, version: str, name: str) -> str:
+        return f"{self.prefix}/{version}/{name}"
+
+    def get_model_dir(self, version: str) -> str:
+        return os.path.join(self.root, version)
+
+    def exists(self, version: str) -> bool:
+        """
+        저장소에 모델 버전의 매니페스트가 있는지 확인하고, 있으면 remote_versions에 기록한다.
+
+        Args:
+            version (str): 모델 버전
+
+        Returns:
+            bool: 매니페스트가 있으면 True
+        """
+
+        if not self.enabled:
+            return False
+
+        if self.backend.exists(self.get_key(version, MANIFEST_NAME)):
+            self.remote_versions.add(version)
+            return True
+
+        return False
+
+    def ensure(self, version: str) -> str:
+        """
+        모델 버전의 파일을 로컬에 준비하고 모델 디렉터리를 반환한다.
+
+        로컬 복사본이 저장소의 매니페스트와 맞으면 그대로 사용한다. 저장소에 연결하지 못했더라도
+        확인된 로컬 복사본이 있으면 경고를 남기고 그대로 사용한다. 저장소에 매니페스트가 없고
+        이미지에 미리 넣어 둔 모델 디렉터리처럼 매니페스트 없이 파일만 있는 경우에도 경고를 남기고
+        그대로 사용한다.
+
+        Args:
+            version (str): 모델 버전
+
+        Returns:
+            str: 모델 디렉터리 경로
+
+        Raises:
+            ValueError: 받은 압축 파일의 크기나 sha256이 매니페스트와 다른 경우
+        """
+
+        model_dir = self.get_model_dir(version)
+
+        if not self.enabled:
+            return model_dir
+
+        with self._lock:
+            started_at = time.perf_counter()
+            local_manifest = read_local_manifest(model_dir)
+
+            try:
+                manifest = json.loads(
+                    self.backend.read(self.get_key(version, MANIFEST_NAME))
+                )
+            except Exception:
+                if local_manifest is not None:
+                    logging.warning(
+                        "Failed to fetch the manifest of %s, using the local copy",
+                        version,
+                    )
+                    return model_dir
+
+                if not self._has_unmanaged_files(model_dir):
+                    raise
+
+                logging.warning(
+                    "No manifest of %s in the store, using the files in %s as is",
+                    version,
+                    model_dir,
+                )
+                return model_dir
+
+            if local_manifest == manifest and self._has_files(model_dir, manifest):
+                self.cache_hits += 1
+                return model_dir
+
+            archive_path = os.path.join(model_dir, ARCHIVE_NAME)
+            os.makedirs(model_dir, exist_ok=True)
+
+            if not self._is_archive_valid(archive_path, manifest):
+                self._download(
+                    self.get_key(version, ARCHIVE_NAME), archive_path, manifest
+                )
+
+            self._extract(archive_path, model_dir, manifest)
+
+            if not self.keep_archive:
+                os.remove(archive_path)
+
+            self.last_fetch_seconds = time.perf_counter() - started_at
+            logging.info(
+                "Prepared the model version %s in %.2fs",
+                version,
+                self.last_fetch_seconds,
+            )
+
+        return model_dir
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        받기 통계를 반환한다.
+
+        Returns:
+            Dict[str, Any]: 저장소 사용 여부, 로컬 복사본 사용 횟수, 받은 횟수와 크기, 마지막 준비 시간
+        """
+
+        return {
+            "enabled": self.enabled,
+            "remote_versions": sorted(self.remote_versions),
+            "cache_hits": self.cache_hits,
+            "downloads": self.downloads,
+            "downloaded_bytes": self.downloaded_bytes,
+            "last_fetch_seconds": self.last_fetch_seconds,
+        }
+
+    @staticmethod
+    def _has_unmanaged_files(model_dir: str) -> bool:
+        try:
+            return any(not name.startswith(".") for name in os.listdir(model_dir))
+        except OSError:
+            return False
+
+    @staticmethod
+    def _has_files(model_dir: str, manifest: Dict[str, Any]) -> bool:
+        for name, size in manifest.get("files", {}).items():
+            path = os.path.join(model_dir, name)
+
+            if not os.path.isfile(path) or os.path.getsize(path) != size:
+                return False
+
+        return True
+
+    @staticmethod
+    def _is_archive_valid(archive_path: str, manifest: Dict[str, Any]) -> bool:
+        try:
+            if os.path.getsize(archive_path) != manifest["size"]:
+                return False
+        except OSError:
+            return False
+
+        return get_file_sha256(archive_path) == manifest["sha256"]
+
+    def _download(self, key: str, archive_path: str, manifest: Dict[str, Any]) -> None:
+        size = manifest["size"]
+        ranges = split_ranges(size, self.part_bytes)
+
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(archive_path), suffix=".part", delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+
+        try:
+            with open(temp_path, "r+b") as temp_file:
+                temp_file.truncate(size)
+                fd = temp_file.fileno()
+
+                with ThreadPoolExecutor(
+                    self.concurrency, thread_name_prefix="model-download"
+                ) as executor:
+                    # 결과를 모두 소비해야 범위 요청의 예외가 전파된다.
+                    list(
+                        executor.map(
+                            lambda part: self._download_range(key, fd, *part), ranges
+                        )
+                    )
+
+            if get_file_sha256(temp_path) != manifest["sha256"]:
+                raise ValueError(f"The checksum of {key} does not match the manifest")
+
+            os.replace(temp_path, archive_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.downloads += 1
+        self.downloaded_bytes += size
+
+    def _download_range(self, key: str, fd: int, start: int, end: int) -> None:
+        attempt = 0
+
+        while True:
+            try:
+                data = self.backend.read_range(key, start, end)
+
+                if len(data) != end - start:
+                    raise ValueError(
+                        f"Received {len(data)} bytes for the range {start}-{end} of {key}"
+                    )
+
+                os.pwrite(fd, data, start)
+                return
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+
+            attempt += 1
+            time.sleep(0.1 * 2**attempt)
+
+    @staticmethod
+    def _extract(archive_path: str, model_dir: str, manifest: Dict[str, Any]) -> None:
+        local_manifest_path = os.path.join(model_dir, LOCAL_MANIFEST_NAME)
+
+        if os.path.exists(local_manifest_path):
+            os.remove(local_manifest_path)
+
+        staging_dir = tempfile.mkdtemp(dir=model_dir, prefix=".extract-")
+
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                archive.extractall(staging_dir)
+
+            for name in os.listdir(staging_dir):
+                target = os.path.join(model_dir, name)
+
+                if os.path.isdir(target) and not os.path.islink(target):
+                    shutil.rmtree(target)
+
+                os.replace(os.path.join(staging_dir, name), target)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w", dir=model_dir, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        os.replace(manifest_file.name, local_manifest_path)
+
+
+model_artifact_manager = ModelArtifactManager(create_backend(MODEL_ARTIFACT_BACKEND))
@@ -2,50 +2,240 @@
 단어 추론 모델에 관한 모듈
 """
 
-from typing import List, Dict, Union
+import functools
+from typing import Callable, List, Dict, Optional, Union
 
 import numpy as np
-from sentence_transformers import util
 
-from app.global_config import model_instance, corpus_embeddings, corpus_df
+from app.core.cache import LRUCache
+from app import global_config
+from app.services.inference_pool import InferencePool
+from app.services.model_registry import ModelBundle
+from app.services.prediction_cache import PredictionCache
+from app.services.query_batcher import QueryBatcher
+from app.services.ranking import get_top_k_labels_batch
+from app.settings.constants import (
+    INFERENCE_POOL_KIND,
+    INFERENCE_POOL_SIZE,
+    INFERENCE_QUEUE_SIZE,
+    PREDICTION_BATCH_MAX_SIZE,
+    PREDICTION_BATCH_MAX_WAIT_MS,
+    PREDICTION_CACHE_MAX_BYTES,
+    PREDICTION_CACHE_MAX_ENTRIES,
+    PREDICTION_CACHE_TTL_SECONDS,
+    QUERY_EMBEDDING_CACHE_MAX_BYTES,
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+)
 
 
-def get_predictions(query: str, top_k: int = 3) -> List[Dict[str, Union[str, int]]]:
+def create_model_bundle(model_version: str, model, corpus_holder) -> ModelBundle:
+    """
+    모델 버전의 문장 인코더와 코퍼스에 추론 결과 캐시와 배치 대기열을 붙여 묶음을 만든다.
+
+    Args:
+        model_version (str): 모델 버전
+        model (SentenceTransformer): 문장 인코더
+        corpus_holder (CorpusHolder): 이 모델로 인코딩한 코퍼스 스냅샷을 보관하는 객체
+
+    Returns:
+        ModelBundle: 모델 버전의 묶음
+    """
+
+    prediction_cache = PredictionCache(
+        model_version,
+        LRUCache(
+            PREDICTION_CACHE_MAX_ENTRIES,
+            PREDICTION_CACHE_MAX_BYTES,
+            PREDICTION_CACHE_TTL_SECONDS,
+        ),
+        LRUCache(
+            QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+            QUERY_EMBEDDING_CACHE_MAX_BYTES,
+            PREDICTION_CACHE_TTL_SECONDS,
+        ),
+    )
+    bundle = ModelBundle(model_version, model, corpus_holder, prediction_cache, None)
+    bundle.query_batcher = QueryBatcher(
+        get_bundle_predictor(bundle),
+        inference_pool,
+        PREDICTION_BATCH_MAX_SIZE,
+        PREDICTION_BATCH_MAX_WAIT_MS,
+        INFERENCE_QUEUE_SIZE,
+    )
+
+    return bundle
+
+
+def get_bundle_predictor(
+    bundle: ModelBundle,
+) -> Callable[[List[str], List[int]], List[List[Dict[str, Union[str, int]]]]]:
+    """
+    작업 풀에서 묶음의 모델로 추론하는 함수를 반환한다.
+
+    묶음을 직접 넘기므로 레지스트리에서 내려간 뒤에도 이미 받은 요청은 같은 묶음으로 처리된다.
+
+    Args:
+        bundle (ModelBundle): 추론에 사용할 모델 버전의 묶음
+
+    Returns:
+        Callable: 설명 목록과 단어 수 목록을 받아 단어 추론 결과를 반환하는 함수
+    """
+
+    return functools.partial(get_batch_predictions, bundle=bundle)
+
+
+def get_predictions(
+    query: str, top_k: int = 3, model_version: Optional[str] = None
+) -> List[Dict[str, Union[str, int]]]:
     """
     사용자가 설명한 내용에 가장 가까운 단어 목록을 반환해준다.
 
     Args:
         query (str): 사용자의 설명
         top_k (int): 목록에 넣을 단어의 수
+        model_version (Optional[str]): 추론에 사용할 모델 버전, None이면 기본 버전
 
     Returns:
         List[Dict[str, Union[str, int]]]: 설명에 가장 가까운 단어들이 담긴 목록
     """
 
-    if not query or top_k <= 0:
-        return []
+    return get_batch_predictions([query], [top_k], model_version)[0]
+
+
+def get_batch_predictions(
+    queries: List[str],
+    top_ks: List[int],
+    model_version: Optional[str] = None,
+    bundle: Optional[ModelBundle] = None,
+) -> List[List[Dict[str, Union[str, int]]]]:
+    """
+    여러 설명에 대해 가장 가까운 단어 목록을 한 번에 반환한다.
+
+    설명 전체를 한 번의 encode 호출로 인코딩하고, 코퍼스와의 유사도도 한 번에 계산한다.
+
+    Args:
+        queries (List[str]): 사용자의 설명 목록
+        top_ks (List[int]): 설명별로 목록에 넣을 단어의 수
+        model_version (Optional[str]): 추론에 사용할 모델 버전, None이면 기본 버전
+        bundle (Optional[ModelBundle]): 추론에 사용할 묶음, 주어지면 model_version 대신 사용
+
+    Returns:
+        List[List[Dict[str, Union[str, int]]]]: 설명별로 가장 가까운 단어들이 담긴 목록
+    """
+
+    if bundle is None:
+        bundle = global_config.get_model_bundle(model_version)
+
+    prediction_cache = bundle.prediction_cache
+    predictions = [[] for _ in queries]
+    corpus = bundle.corpus_holder.get()
+    positions = []
 
-    query_embedding = model_instance.encode(query)
+    for position, (query, top_k) in enumerate(zip(queries, top_ks)):
+        if not query or top_k <= 0:
+            continue
 
-    similarities = util.cos_sim(query_embedding, corpus_embeddings)[0]
+        cached_predictions = prediction_cache.get_predictions(
+            query, top_k, corpus.version
+        )
 
-    top_k_sentences = []
-    seen_labels = set()
+        if cached_predictions is None:
+            positions.append(position)
+        else:
+            predictions[position] = cached_predictions
 
-    for index in np.argsort(-similarities):
-        item_index = index.item()
-        label = corpus_df.iloc[item_index]["correct_word"]
+    if not positions:
+        return predictions
 
-        if label not in seen_labels:
-            seen_labels.add(label)
-            top_k_sentences.append(
-                {
-                    "text": label,
-                    "rank": len(top_k_sentences) + 1,
-                }
+    query_embeddings = get_query_embeddings(
+        [queries[position] for position in positions], bundle
+    )
+
+    top_k_label_codes = get_top_k_labels_batch(
+        corpus.index,
+        query_embeddings,
+        corpus.store.label_codes,
+        [top_ks[position] for position in positions],
+    )
+
+    for position, label_codes in zip(positions, top_k_label_codes):
+        predictions[position] = [
+            {"text": label, "rank": rank}
+            for rank, label in enumerate(corpus.store.get_labels(label_codes), start=1)
+        ]
+        prediction_cache.set_predictions(
+            queries[position], top_ks[position], corpus.version, predictions[position]
+        )
+
+    return predictions
+
+
+def get_query_embeddings(queries: List[str], bundle: ModelBundle) -> np.ndarray:
+    """
+    설명 목록의 임베딩을 반환한다. 캐시에 없는 설명만 한 번의 encode 호출로 인코딩한다.
+
+    Args:
+        queries (List[str]): 사용자의 설명 목록
+        bundle (ModelBundle): 인코딩에 사용할 모델 버전의 묶음
+
+    Returns:
+        np.ndarray: 설명 임베딩 (2차원)
+    """
+
+    prediction_cache = bundle.prediction_cache
+    query_embeddings = [prediction_cache.get_embedding(query) for query in queries]
+    missing_positions = [
+        position
+        for position, query_embedding in enumerate(query_embeddings)
+        if query_embedding is None
+    ]
+
+    if missing_positions:
+        encoded_embeddings = bundle.model.encode(
+            [queries[position] for position in missing_positions]
+        )
+
+        for position, query_embedding in zip(missing_positions, encoded_embeddings):
+            query_embeddings[position] = query_embedding.copy()
+            prediction_cache.set_embedding(
+                queries[position], query_embeddings[position]
             )
 
-        if len(top_k_sentences) >= top_k:
-            break
+    return np.stack(query_embeddings)
+
+
+async def predict(
+    query: str,
+    top_k: int = 3,
+    model_version: Optional[str] = None,
+    bundle: Optional[ModelBundle] = None,
+) -> List[Dict[str, Union[str, int]]]:
+    """
+    캐시된 단어 추론 결과가 있으면 바로 반환하고, 없으면 모델 버전의 배치 대기열을 거쳐 추론한다.
+
+    Args:
+        query (str): 사용자의 설명
+        top_k (int): 목록에 넣을 단어의 수
+        model_version (Optional[str]): 추론에 사용할 모델 버전, None이면 기본 버전
+        bundle (Optional[ModelBundle]): 추론에 사용할 묶음, 주어지면 model_version 대신 사용
+
+    Returns:
+        List[Dict[str, Union[str, int]]]: 설명에 가장 가까운 단어들이 담긴 목록
+    """
+
+    if bundle is None:
+        bundle = global_config.get_model_bundle(model_version)
+
+    cached_predictions = bundle.prediction_cache.get_predictions(
+        query, top_k, bundle.corpus_holder.get().version
+    )
+
+    if cached_predictions is not None:
+        return cached_predictions
+
+    return await bundle.query_batcher.predict(query, top_k)
+
 
-    return top_k_sentences
+inference_pool = InferencePool(
+    INFERENCE_POOL_SIZE, INFERENCE_QUEUE_SIZE, INFERENCE_POOL_KIND
+)
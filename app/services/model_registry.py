@@ -0,0 +1,418 @@
+"""
+여러 모델 버전을 불러와 보관하고, 요청을 버전별로 연결하는 모듈
+
+모델 버전마다 문장 인코더, 코퍼스, 추론 결과 캐시, 배치 대기열을 한 묶음(ModelBundle)으로 보관한다.
+새 버전은 백그라운드로 불러온 뒤 원자적으로 교체하므로, 불러오는 동안에도 기존 버전으로 요청을 처리한다.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.exceptions import CustomException
+from app.settings.constants import HTTP_STATUS_CODE, HTTP_STATUS_MESSAGE
+
+MODEL_VERSION_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$")
+
+
+class ModelBundle:
+    """
+    한 모델 버전으로 단어를 추론하는 데 필요한 객체 묶음
+
+    Attributes:
+        version (str): 모델 버전
+        model (Any): 문장 인코더 (SentenceTransformer)
+        corpus_holder (CorpusHolder): 이 모델로 인코딩한 코퍼스 스냅샷을 보관하는 객체
+        prediction_cache (PredictionCache): 이 모델의 단어 추론 결과와 질의 임베딩 캐시
+        query_batcher (QueryBatcher): 이 모델로 추론할 요청을 모으는 배치 대기열
+        loaded_at (float): 불러오기를 마친 시각 (time.time)
+    """
+
+    def __init__(
+        self,
+        version: str,
+        model: Any,
+        corpus_holder: Any,
+        prediction_cache: Any,
+        query_batcher: Any,
+    ):
+        self.version = version
+        self.model = model
+        self.corpus_holder = corpus_holder
+        self.prediction_cache = prediction_cache
+        self.query_batcher = query_batcher
+        self.loaded_at = time.time()
+
+    async def close(self, drain: bool = False) -> None:
+        """
+        배치 대기열을 닫는다.
+
+        Args:
+            drain (bool): True이면 대기 중이거나 처리 중인 요청이 모두 끝난 뒤 닫는다.
+        """
+
+        while drain and not self.query_batcher.is_idle:
+            await asyncio.sleep(0.05)
+
+        await self.query_batcher.close()
+
+
+def create_model_version_not_found_exception(version: str) -> CustomException:
+    return CustomException(
+        status_code=HTTP_STATUS_CODE["NOT_FOUND"],
+        message=HTTP_STATUS_MESSAGE["NOT_FOUND"],
+        attribute="model_version",
+        reason=f"The model version `{version}` does not exist.",
+    )
+
+
+class ModelRegistry:
+    """
+    모델 버전별 ModelBundle을 보관하는 LRU 레지스트리
+
+    메모리에는 최대 max_resident개의 버전만 올려 두며, 넘치면 기본 버전을 제외하고
+    가장 오래 사용되지 않은 버전부터 내린다. 이미 묶음을 가져간 요청은 내려간 뒤에도 끝까지 처리된다.
+    다른 버전을 불러오거나 기본 버전을 교체하는 동안에는 기본 버전과 새 버전을 함께 올려 두어야 하므로
+    max_resident는 최소 2이다. 교체한 뒤 한도를 넘으면 이전 기본 버전도 내릴 수 있다.
+    내린 묶음은 bind_loop로 지정한 이벤트 루프에서 닫으므로, 스레드에서 add를 호출해도 된다.
+    메모리에 없지만 사용할 수 있는 버전이 요청되면 백그라운드로 불러오기 시작하고 503으로 응답한다.
+    불러오기는 load_bundle을 스레드에서 실행하며, 같은 버전을 동시에 두 번 불러오지 않는다.
+    불러오기에 실패한 버전은 retry_seconds가 지나기 전까지 요청으로 다시 불러오지 않는다.
+
+    Attributes:
+        default_version (str): 버전을 지정하지 않은 요청에 사용할 모델 버전
+        max_resident (int): 메모리에 동시에 올려 둘 수 있는 버전 수 (최소 2)
+        retry_seconds (float): 불러오기에 실패한 버전을 요청으로 다시 불러오기 전까지 기다릴 시간 (초)
+        evictions (int): 한도를 넘어 내린 버전 수
+    """
+
+    def __init__(
+        self,
+        load_bundle: Callable[[str], ModelBundle],
+        default_version: str,
+        max_resident: int,
+        is_available: Callable[[str], bool],
+        retry_seconds: float = 60.0,
+    ):
+        self.load_bundle = load_bundle
+        self.default_version = default_version
+        self.max_resident = max(2, max_resident)
+        self.is_available = is_available
+        self.retry_seconds = retry_seconds
+        self.evictions = 0
+        self._bundles: OrderedDict = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._errors: Dict[str, Tuple[str, float]] = {}
+        self._closing: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        내린 묶음을 닫을 이벤트 루프를 지정한다. 어플리케이션의 lifespan에서 호출한다.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): 어플리케이션의 이벤트 루프
+        """
+
+        self._loop = loop
+
+    def find(self, version: Optional[str] = None) -> Optional[ModelBundle]:
+        """
+        메모리에 올라와 있는 버전의 묶음을 반환한다.
+
+        Args:
+            version (Optional[str]): 모델 버전, None이면 기본 버전
+
+        Returns:
+            Optional[ModelBundle]: 메모리에 있으면 그 묶음, 없으면 None
+        """
+
+        with self._lock:
+            bundle = self._bundles.get(version or self.default_version)
+
+            if bundle is not None:
+                self._bundles.move_to_end(bundle.version)
+
+            return bundle
+
+    def get(self, version: Optional[str] = None) -> ModelBundle:
+        """
+        요청한 버전의 묶음을 반환한다.
+
+        이벤트 루프에서 호출했고 버전이 메모리에 없지만 사용할 수 있다면 백그라운드로 불러오기 시작한다.
+        최근에 불러오기에 실패한 버전이면 다시 불러오지 않고 곧바로 503으로 응답한다.
+
+        Args:
+            version (Optional[str]): 모델 버전, None이면 기본 버전
+
+        Returns:
+            ModelBundle: 요청한 버전의 묶음
+
+        Raises:
+            CustomException: 없는 버전인 경우 (404), 아직 불러오지 않았거나 최근에 불러오기에
+                실패한 버전인 경우 (503)
+        """
+
+        version = version or self.default_version
+        bundle = self.find(version)
+
+        if bundle is not None:
+            return bundle
+
+        if not self.is_valid(version):
+            raise create_model_version_not_found_exception(version)
+
+        error = self._errors.get(version)
+
+        if error is not None and time.monotonic() - error[1] < self.retry_seconds:
+            raise CustomException(
+                status_code=HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"],
+                message=HTTP_STATUS_MESSAGE["SERVICE_UNAVAILABLE"],
+                attribute="model_version",
+                reason=f"The model version `{version}` failed to load. Please try again later.",
+            )
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self.start_loading(version)
+
+        raise CustomException(
+            status_code=HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"],
+            message=HTTP_STATUS_MESSAGE["SERVICE_UNAVAILABLE"],
+            attribute="model_version",
+            reason=f"The model version `{version}` is loading. Please try again in a moment.",
+        )
+
+    def list_bundles(self) -> List[ModelBundle]:
+        """
+        메모리에 있는 묶음을 최근 사용 순으로 반환한다.
+
+        Returns:
+            List[ModelBundle]: 메모리에 있는 묶음 목록
+        """
+
+        with self._lock:
+            return list(reversed(self._bundles.values()))
+
+    def is_valid(self, version: str) -> bool:
+        """
+        버전이 메모리에 있거나, 버전 이름이 올바르고 불러올 수 있는지 확인한다.
+
+        Args:
+            version (str): 모델 버전
+
+        Returns:
+            bool: 사용할 수 있는 버전이면 True
+        """
+
+        if version in self._bundles:
+            return True
+
+        return bool(MODEL_VERSION_PATTERN.match(version)) and self.is_available(version)
+
+    def add(self, bundle: ModelBundle) -> None:
+        """
+        불러온 묶음을 등록하고, 한도를 넘으면 가장 오래 사용되지 않은 버전을 내린다.
+
+        Args:
+            bundle (ModelBundle): 등록할 묶음
+        """
+
+        with self._lock:
+            previous = self._bundles.pop(bundle.version, None)
+            self._bundles[bundle.version] = bundle
+            self._errors.pop(bundle.version, None)
+            evicted = [previous] if previous is not None else []
+            evicted += self._evict_over_limit((self.default_version, bundle.version))
+
+        for evicted_bundle in evicted:
+            logging.info("Unloaded the model version %s", evicted_bundle.version)
+            self._close_later(evicted_bundle)
+
+    def start_loading(self, version: str) -> asyncio.Task:
+        """
+        버전을 백그라운드로 불러오는 작업을 시작한다. 이미 불러오는 중이면 그 작업을 반환한다.
+
+        Args:
+            version (str): 모델 버전
+
+        Returns:
+            asyncio.Task: 불러온 묶음을 반환하는 작업
+        """
+
+        task = self._loading.get(version)
+
+        if task is None:
+            task = asyncio.ensure_future(self._load(version))
+            self._loading[version] = task
+            task.add_done_callback(lambda _: self._forget_loading(version, task))
+
+        return task
+
+    async def load(self, version: str) -> ModelBundle:
+        """
+        버전을 불러와 등록한다. 이미 메모리에 있으면 그 묶음을 반환한다.
+
+        Args:
+            version (str): 모델 버전
+
+        Returns:
+            ModelBundle: 불러온 묶음
+
+        Raises:
+            CustomException: 없는 버전인 경우 (404)
+        """
+
+        bundle = self.find(version)
+
+        if bundle is not None:
+            return bundle
+
+        if not self.is_valid(version):
+            raise create_model_version_not_found_exception(version)
+
+        return await asyncio.shield(self.start_loading(version))
+
+    async def activate(self, version: str) -> ModelBundle:
+        """
+        버전을 불러온 뒤 기본 버전으로 교체한다.
+
+        교체는 기본 버전 이름을 바꾸는 한 번의 대입이므로, 교체 전후의 요청은 각각 이전 버전과
+        새 버전 중 하나로 온전히 처리된다. 교체한 뒤 한도를 넘으면 이전 기본 버전부터 내린다.
+
+        Args:
+            version (str): 기본 버전으로 사용할 모델 버전
+
+        Returns:
+            ModelBundle: 새 기본 버전의 묶음
+        """
+
+        bundle = await self.load(version)
+
+        with self._lock:
+            self._bundles.setdefault(version, bundle)
+            self._bundles.move_to_end(version)
+            previous_version, self.default_version = self.default_version, version
+            evicted = self._evict_over_limit((version,))
+
+        logging.info(
+            "Activated the model version %s (was %s)", version, previous_version
+        )
+
+        for evicted_bundle in evicted:
+            logging.info("Unloaded the model version %s", evicted_bundle.version)
+            self._close_later(evicted_bundle)
+
+        return bundle
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        레지스트리 상태를 반환한다.
+
+        Returns:
+            Dict[str, Any]: 기본 버전, 메모리에 있는 버전 (최근 사용 순), 불러오는 중인 버전,
+                불러오기에 실패한 버전과 에러 종류, 내린 버전 수
+        """
+
+        with self._lock:
+            resident: List[str] = list(reversed(self._bundles))
+
+        return {
+            "default_version": self.default_version,
+            "resident_versions": resident,
+            "loading_versions": sorted(self._loading),
+            "failed_versions": {
+                version: error[0] for version, error in self._errors.items()
+            },
+            "max_resident": self.max_resident,
+            "evictions": self.evictions,
+        }
+
+    async def close(self) -> None:
+        """
+        불러오는 작업을 취소하고, 내리는 중인 묶음과 모든 묶음의 배치 대기열을 닫는다.
+        """
+
+        for task in list(self._loading.values()):
+            task.cancel()
+
+        for task in list(self._closing):
+            task.cancel()
+
+        with self._lock:
+            bundles = list(self._bundles.values())
+
+        for bundle in bundles:
+            await bundle.close()
+
+    async def _load(self, version: str) -> ModelBundle:
+        started_at = time.perf_counter()
+        logging.info("Loading the model version %s", version)
+
+        try:
+            bundle = await asyncio.to_thread(self.load_bundle, version)
+        except Exception as exc:
+            logging.exception("Failed to load the model version %s", version)
+            self._errors[version] = (type(exc).__name__, time.monotonic())
+            raise
+
+        self.add(bundle)
+        logging.info(
+            "Loaded the model version %s in %.2fs",
+            version,
+            time.perf_counter() - started_at,
+        )
+
+        return bundle
+
+    def _forget_loading(self, version: str, task: asyncio.Task) -> None:
+        if self._loading.get(version) is task:
+            del self._loading[version]
+
+        # 요청이 기다리지 않는 백그라운드 불러오기가 실패해도 경고가 남지 않도록 한다.
+        if not task.cancelled():
+            task.exception()
+
+    def _evict_over_limit(self, keep: Tuple[str, ...]) -> List[ModelBundle]:
+        evicted = []
+
+        for version in list(self._bundles):
+            if len(self._bundles) <= self.max_resident:
+                break
+
+            if version not in keep:
+                evicted.append(self._bundles.pop(version))
+                self.evictions += 1
+
+        return evicted
+
+    def _close_later(self, bundle: ModelBundle) -> None:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not None:
+            self._start_closing(bundle)
+        elif self._loop is not None and not self._loop.is_closed():
+            # 스레드에서 내린 묶음은 어플리케이션의 이벤트 루프에서 닫는다.
+            self._loop.call_soon_threadsafe(self._start_closing, bundle)
+        else:
+            logging.warning(
+                "No event loop to close the model version %s", bundle.version
+            )
+
+    def _start_closing(self, bundle: ModelBundle) -> None:
+        task = asyncio.get_running_loop().create_task(bundle.close(drain=True))
+
+        # 이벤트 루프는 작업을 약하게 참조하므로, 닫기를 마칠 때까지 참조를 보관한다.
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
@@ -0,0 +1,369 @@
+"""
+SentenceTransformer 모델을 ONNX로 내보내고 ONNX Runtime으로 문장을 인코딩하는 모듈
+
+모델 디렉터리(MODEL_ROOT/<버전>)에 다음 파일을 만든다.
+    - model[.<리비전>].onnx: 트랜스포머의 마지막 은닉 상태를 출력하는 ONNX 모델
+    - model[.<리비전>].int8.onnx: 위 모델의 가중치를 int8로 동적 양자화한 모델
+리비전은 받은 모델 압축 파일의 sha256 앞부분(get_model_revision)으로, 같은 버전을 다시 올리면
+새로 내보내고 이전 리비전의 파일은 지운다.
+풀링과 정규화는 모델 디렉터리의 SentenceTransformer 설정(modules.json)을 읽어 numpy로 한다.
+onnxruntime, transformers는 사용할 때 import하고, 내보낼 때만 torch와 sentence_transformers가 필요하다.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from app.services.model_artifacts import get_model_revision
+from app.settings.constants import INFERENCE_POOL_SIZE, MODEL_ONNX_INTRA_OP_THREADS
+
+ONNX_FILE_NAME = "model.onnx"
+QUANTIZED_ONNX_FILE_NAME = "model.int8.onnx"
+ONNX_OPSET_VERSION = 14
+
+
+def get_onnx_file_name(quantize: bool, revision: str = "") -> str:
+    file_name = QUANTIZED_ONNX_FILE_NAME if quantize else ONNX_FILE_NAME
+
+    if not revision:
+        return file_name
+
+    return file_name.replace("model.", f"model.{revision}.", 1)
+
+
+def remove_stale_onnx_files(model_dir: str, revision: str) -> None:
+    """
+    모델 디렉터리에서 다른 리비전의 모델로 내보낸 ONNX 파일을 지운다.
+
+    Args:
+        model_dir (str): 모델 디렉터리
+        revision (str): 현재 모델의 리비전
+    """
+
+    current = {get_onnx_file_name(quantize, revision) for quantize in (False, True)}
+
+    for name in os.listdir(model_dir):
+        if name.endswith(".onnx") and name not in current:
+            os.remove(os.path.join(model_dir, name))
+            logging.info("Removed the stale ONNX model %s", name)
+
+
+def get_intra_op_threads(
+    configured: int = MODEL_ONNX_INTRA_OP_THREADS,
+    pool_size: int = INFERENCE_POOL_SIZE,
+) -> int:
+    """
+    ONNX Runtime 연산 하나가 사용할 스레드 수를 정한다.
+
+    추론 작업 풀의 작업들이 동시에 인코딩하므로, 작업마다 CPU를 나누어 써서 스레드가 서로 경쟁하지 않게 한다.
+
+    Args:
+        configured (int): 설정한 스레드 수, 0이면 자동으로 정함
+        pool_size (int): 추론 작업 풀의 크기
+
+    Returns:
+        int: 스레드 수
+    """
+
+    if configured > 0:
+        return configured
+
+    return max(1, (os.cpu_count() or 1) // max(1, pool_size))
+
+
+def pool_embeddings(
+    token_embeddings: np.ndarray, attention_mask: np.ndarray, mode: str
+) -> np.ndarray:
+    """
+    토큰 임베딩을 문장 임베딩으로 모은다. SentenceTransformer의 Pooling 모듈과 같은 계산을 한다.
+
+    Args:
+        token_embeddings (np.ndarray): 토큰 임베딩 (문장 수, 토큰 수, 차원)
+        attention_mask (np.ndarray): 패딩이 아닌 토큰은 1인 마스크 (문장 수, 토큰 수)
+        mode (str): "mean", "cls" 혹은 "max"
+
+    Returns:
+        np.ndarray: 문장 임베딩 (문장 수, 차원)
+    """
+
+    if mode == "cls":
+        return token_embeddings[:, 0]
+
+    mask = attention_mask[:, :, None].astype(token_embeddings.dtype)
+
+    if mode == "max":
+        return np.where(mask > 0, token_embeddings, -1e9).max(axis=1)
+    if mode == "mean":
+        return (token_embeddings * mask).sum(axis=1) / np.clip(
+            mask.sum(axis=1), 1e-9, None
+        )
+
+    raise ValueError(f"Unsupported pooling mode: {mode}")
+
+
+def read_sentence_transformer_config(model_dir: str) -> Dict[str, Any]:
+    """
+    모델 디렉터리의 SentenceTransformer 설정에서 트랜스포머 경로, 풀링 방식, 정규화 여부, 최대 토큰 수를 읽는다.
+
+    Args:
+        model_dir (str): SentenceTransformer 모델 디렉터리
+
+    Returns:
+        Dict[str, Any]: transformer_dir, pooling_mode, normalize, max_seq_length
+    """
+
+    with open(os.path.join(model_dir, "modules.json"), encoding="utf-8") as file:
+        modules = json.load(file)
+
+    config = {
+        "transformer_dir": model_dir,
+        "pooling_mode": "mean",
+        "normalize": False,
+        "max_seq_length": None,
+    }
+
+    for module in modules:
+        module_dir = os.path.join(model_dir, module.get("path", ""))
+        module_type = module["type"].rsplit(".", 1)[-1]
+
+        if module_type == "Transformer":
+            config["transformer_dir"] = module_dir
+            bert_config_path = os.path.join(module_dir, "sentence_bert_config.json")
+
+            if os.path.exists(bert_config_path):
+                with open(bert_config_path, encoding="utf-8") as file:
+                    config["max_seq_length"] = json.load(file).get("max_seq_length")
+        elif module_type == "Pooling":
+            with open(
+                os.path.join(module_dir, "config.json"), encoding="utf-8"
+            ) as file:
+                pooling = json.load(file)
+
+            if pooling.get("pooling_mode_cls_token"):
+                config["pooling_mode"] = "cls"
+            elif pooling.get("pooling_mode_max_tokens"):
+                config["pooling_mode"] = "max"
+        elif module_type == "Normalize":
+            config["normalize"] = True
+
+    return config
+
+
+class OnnxSentenceEncoder:
+    """
+    ONNX Runtime으로 문장을 인코딩하는 객체
+
+    SentenceTransformer.encode와 같은 방식으로 호출할 수 있어 단어 추론과 코퍼스 인코딩에 그대로 사용한다.
+    배치는 길이가 비슷한 문장끼리 묶어 패딩을 줄이며, 결과는 입력 순서로 돌려준다.
+    세션은 여러 스레드에서 동시에 실행할 수 있다.
+
+    Attributes:
+        session (onnxruntime.InferenceSession): ONNX Runtime 세션
+        tokenizer (PreTrainedTokenizerBase): 트랜스포머의 토크나이저
+        pooling_mode (str): 풀링 방식 ("mean", "cls", "max")
+        normalize (bool): 문장 임베딩을 L2 정규화할지 여부
+        max_seq_length (Optional[int]): 문장 하나의 최대 토큰 수
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        pooling_mode: str = "mean",
+        normalize: bool = False,
+        max_seq_length: Optional[int] = None,
+    ):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.pooling_mode = pooling_mode
+        self.normalize = normalize
+        self.max_seq_length = max_seq_length
+        self._input_names = {model_input.name for model_input in session.get_inputs()}
+
+    def encode(
+        self, sentences: Union[str, List[str]], batch_size: int = 32, **_: Any
+    ) -> np.ndarray:
+        """
+        문장 목록을 인코딩한다.
+
+        Args:
+            sentences (Union[str, List[str]]): 문장 혹은 문장 목록
+            batch_size (int): 한 번에 실행할 문장 수
+
+        Returns:
+            np.ndarray: 문장 임베딩 (float32), 문장 하나를 받은 경우 1차원
+        """
+
+        if isinstance(sentences, str):
+            return self.encode([sentences], batch_size)[0]
+
+        order = np.argsort([-len(sentence) for sentence in sentences], kind="stable")
+        batches = []
+
+        for start in range(0, len(sentences), batch_size):
+            batches.append(
+                self._encode_batch(
+                    [sentences[index] for index in order[start : start + batch_size]]
+                )
+            )
+
+        if not batches:
+            return np.empty((0, 0), dtype=np.float32)
+
+        sorted_embeddings = np.concatenate(batches)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+
+        return embeddings
+
+    def _encode_batch(self, sentences: List[str]) -> np.ndarray:
+        inputs = self.tokenizer(
+            sentences,
+            padding=True,
+            truncation=True,
+            max_length=self.max_seq_length,
+            return_tensors="np",
+        )
+        feeds = {
+            name: value.astype(np.int64)
+            for name, value in inputs.items()
+            if name in self._input_names
+        }
+        token_embeddings = self.session.run(None, feeds)[0]
+        embeddings = pool_embeddings(
+            token_embeddings, inputs["attention_mask"], self.pooling_mode
+        ).astype(np.float32)
+
+        if self.normalize:
+            embeddings /= np.clip(
+                np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None
+            )
+
+        return embeddings
+
+
+def export_onnx(model_dir: str, quantize: bool = False) -> str:
+    """
+    모델 디렉터리의 SentenceTransformer 모델을 ONNX로 내보내고, quantize이면 int8로 동적 양자화한다.
+
+    배치 크기와 토큰 수는 동적 축으로 내보낸다. 파일은 임시 이름으로 쓴 뒤 옮기므로,
+    여러 프로세스가 동시에 내보내도 중간 상태의 파일을 읽지 않는다.
+    파일 이름에는 모델의 리비전을 붙이며, 다른 리비전으로 내보낸 파일은 지운다.
+
+    Args:
+        model_dir (str): SentenceTransformer 모델 디렉터리
+        quantize (bool): int8로 동적 양자화할지 여부
+
+    Returns:
+        str: 내보낸 ONNX 모델 경로
+    """
+
+    revision = get_model_revision(model_dir)
+    onnx_path = os.path.join(model_dir, get_onnx_file_name(False, revision))
+
+    if not os.path.exists(onnx_path):
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_dir, device="cpu")
+        transformer = model[0].auto_model.eval()
+        sample = dict(model.tokenizer(["a sample sentence"], return_tensors="pt"))
+        input_names = list(sample)
+
+        class LastHiddenState(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.transformer = transformer
+
+            def forward(self, *args):
+                return self.transformer(**dict(zip(input_names, args)))[0]
+
+        temp_path = f"{onnx_path}.{os.getpid()}.tmp"
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+        with torch.no_grad():
+            torch.onnx.export(
+                LastHiddenState(),
+                tuple(sample[name] for name in input_names),
+                temp_path,
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=ONNX_OPSET_VERSION,
+            )
+
+        os.replace(temp_path, onnx_path)
+        logging.info("Exported the sentence encoder to %s", onnx_path)
+        remove_stale_onnx_files(model_dir, revision)
+
+    if not quantize:
+        return onnx_path
+
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized_path = os.path.join(model_dir, get_onnx_file_name(True, revision))
+
+    if not os.path.exists(quantized_path):
+        temp_path = f"{quantized_path}.{os.getpid()}.tmp"
+        quantize_dynamic(onnx_path, temp_path, weight_type=QuantType.QInt8)
+        os.replace(temp_path, quantized_path)
+        logging.info("Quantized the sentence encoder to %s", quantized_path)
+
+    return quantized_path
+
+
+def create_onnx_encoder(
+    model_dir: str,
+    quantize: bool = False,
+    intra_op_threads: Optional[int] = None,
+) -> OnnxSentenceEncoder:
+    """
+    모델 디렉터리의 ONNX 모델로 문장 인코더를 만든다. ONNX 모델이 없으면 먼저 내보낸다.
+
+    Args:
+        model_dir (str): SentenceTransformer 모델 디렉터리
+        quantize (bool): int8로 동적 양자화한 모델을 사용할지 여부
+        intra_op_threads (Optional[int]): 연산 하나가 사용할 스레드 수, None이면 get_intra_op_threads로 정함
+
+    Returns:
+        OnnxSentenceEncoder: 문장 인코더
+    """
+
+    import onnxruntime
+    from transformers import AutoTokenizer
+
+    onnx_path = os.path.join(
+        model_dir, get_onnx_file_name(quantize, get_model_revision(model_dir))
+    )
+
+    if not os.path.exists(onnx_path):
+        started_at = time.perf_counter()
+        onnx_path = export_onnx(model_dir, quantize)
+        logging.info(
+            "Prepared the ONNX model in %.2fs", time.perf_counter() - started_at
+        )
+
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = (
+        intra_op_threads if intra_op_threads is not None else get_intra_op_threads()
+    )
+    options.inter_op_num_threads = 1
+    options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    config = read_sentence_transformer_config(model_dir)
+
+    return OnnxSentenceEncoder(
+        onnxruntime.InferenceSession(
+            onnx_path, options, providers=["CPUExecutionProvider"]
+        ),
+        AutoTokenizer.from_pretrained(config["transformer_dir"]),
+        config["pooling_mode"],
+        config["normalize"],
+        config["max_seq_length"],
+    )
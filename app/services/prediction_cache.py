@@ -0,0 +1,154 @@
+"""
+단어 추론 결과와 질의 임베딩을 재사용하기 위한 캐시 모듈
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.cache import LRUCache
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    대소문자, 공백, 문장 부호만 다른 설명이 같은 키를 갖도록 정규화한다.
+
+    Args:
+        query (str): 사용자의 설명
+
+    Returns:
+        str: 정규화된 설명
+    """
+
+    query = unicodedata.normalize("NFKC", query).casefold()
+    query = "".join(
+        " " if unicodedata.category(character).startswith("P") else character
+        for character in query
+    )
+
+    return WHITESPACE_PATTERN.sub(" ", query).strip()
+
+
+class PredictionCache:
+    """
+    단어 추론 결과 캐시와 질의 임베딩 캐시
+
+    추론 결과는 (모델 버전, 정규화된 설명, top_k, 코퍼스 버전)으로,
+    질의 임베딩은 (모델 버전, 정규화된 설명)으로 저장한다.
+    따라서 top_k만 다른 요청은 인코딩을 건너뛰고 코퍼스 검색만 다시 한다.
+    코퍼스 버전이 바뀌면 이전 버전의 추론 결과를 모두 비운다.
+
+    Attributes:
+        model_version (str): 추론에 사용하는 모델 버전
+        results (LRUCache): 단어 추론 결과 캐시
+        embeddings (LRUCache): 질의 임베딩 캐시
+    """
+
+    def __init__(
+        self,
+        model_version: str,
+        results: LRUCache,
+        embeddings: LRUCache,
+    ):
+        self.model_version = model_version
+        self.results = results
+        self.embeddings = embeddings
+        self._corpus_version: Optional[int] = None
+
+    def _check_corpus_version(self, corpus_version: int) -> None:
+        if self._corpus_version != corpus_version:
+            self.results.clear()
+            self._corpus_version = corpus_version
+
+    def get_predictions(
+        self, query: str, top_k: int, corpus_version: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 단어 추론 결과를 반환한다.
+
+        Args:
+            query (str): 사용자의 설명
+            top_k (int): 목록에 넣을 단어의 수
+            corpus_version (int): 현재 코퍼스 버전
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 캐시된 결과가 있으면 그 결과, 없으면 None
+        """
+
+        self._check_corpus_version(corpus_version)
+
+        return self.results.get(
+            (self.model_version, normalize_query(query), top_k, corpus_version)
+        )
+
+    def set_predictions(
+        self,
+        query: str,
+        top_k: int,
+        corpus_version: int,
+        predictions: List[Dict[str, Any]],
+    ) -> None:
+        """
+        단어 추론 결과를 캐시에 저장한다.
+
+        Args:
+            query (str): 사용자의 설명
+            top_k (int): 목록에 넣을 단어의 수
+            corpus_version (int): 결과를 계산할 때 사용한 코퍼스 버전
+            predictions (List[Dict[str, Any]]): 단어 추론 결과
+        """
+
+        self._check_corpus_version(corpus_version)
+        self.results.set(
+            (self.model_version, normalize_query(query), top_k, corpus_version),
+            predictions,
+        )
+
+    def get_embedding(self, query: str) -> Optional[np.ndarray]:
+        """
+        캐시된 질의 임베딩을 반환한다.
+
+        Args:
+            query (str): 사용자의 설명
+
+        Returns:
+            Optional[np.ndarray]: 캐시된 임베딩이 있으면 그 임베딩, 없으면 None
+        """
+
+        return self.embeddings.get((self.model_version, normalize_query(query)))
+
+    def set_embedding(self, query: str, embedding: np.ndarray) -> None:
+        """
+        질의 임베딩을 캐시에 저장한다.
+
+        Args:
+            query (str): 사용자의 설명
+            embedding (np.ndarray): 질의 임베딩
+        """
+
+        self.embeddings.set((self.model_version, normalize_query(query)), embedding)
+
+    def clear(self) -> None:
+        """
+        모델이 바뀌었을 때처럼 캐시 전체를 비운다.
+        """
+
+        self.results.clear()
+        self.embeddings.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        두 캐시의 통계를 반환한다.
+
+        Returns:
+            Dict[str, Dict[str, int]]: 추론 결과 캐시와 질의 임베딩 캐시의 통계
+        """
+
+        return {
+            "results": self.results.snapshot(),
+            "embeddings": self.embeddings.snapshot(),
+        }
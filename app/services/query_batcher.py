@@ -0,0 +1,251 @@
+"""
+동시에 들어온 단어 추론 요청을 모아 한 번에 처리하는 마이크로 배치 모듈
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from app.services.inference_pool import InferencePool, create_server_busy_exception
+
+QUEUE_DELAY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500]
+
+
+class BatchMetrics:
+    """
+    배치 크기 분포와 요청의 대기 시간 통계
+
+    Attributes:
+        batch_size_counts (Dict[int, int]): 배치 크기별 배치 수
+        queue_delay_bucket_counts (List[int]): QUEUE_DELAY_BUCKETS_MS 구간별 요청 수 (마지막은 초과분)
+        batches (int): 처리한 배치 수
+        items (int): 처리한 요청 수
+        rejected (int): 대기열이 가득 차 거절한 요청 수
+        queue_delay_ms_sum (float): 요청 대기 시간의 합 (ms)
+        queue_delay_ms_max (float): 요청 대기 시간의 최댓값 (ms)
+    """
+
+    def __init__(self):
+        self.batch_size_counts = {}
+        self.queue_delay_bucket_counts = [0] * (len(QUEUE_DELAY_BUCKETS_MS) + 1)
+        self.batches = 0
+        self.items = 0
+        self.rejected = 0
+        self.queue_delay_ms_sum = 0.0
+        self.queue_delay_ms_max = 0.0
+
+    def record(self, queue_delays_ms: List[float]) -> None:
+        """
+        처리한 배치 하나의 통계를 기록한다.
+
+        Args:
+            queue_delays_ms (List[float]): 배치에 담긴 요청별 대기 시간 (ms)
+        """
+
+        batch_size = len(queue_delays_ms)
+        self.batch_size_counts[batch_size] = (
+            self.batch_size_counts.get(batch_size, 0) + 1
+        )
+        self.batches += 1
+        self.items += batch_size
+
+        for queue_delay_ms in queue_delays_ms:
+            bucket = next(
+                (
+                    position
+                    for position, upper_bound in enumerate(QUEUE_DELAY_BUCKETS_MS)
+                    if queue_delay_ms <= upper_bound
+                ),
+                len(QUEUE_DELAY_BUCKETS_MS),
+            )
+            self.queue_delay_bucket_counts[bucket] += 1
+            self.queue_delay_ms_sum += queue_delay_ms
+            self.queue_delay_ms_max = max(self.queue_delay_ms_max, queue_delay_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계를 JSON으로 직렬화할 수 있는 형태로 반환한다.
+
+        Returns:
+            Dict[str, Any]: 배치 크기 분포와 대기 시간 통계
+        """
+
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "rejected": self.rejected,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "batch_size_counts": {
+                str(batch_size): count
+                for batch_size, count in sorted(self.batch_size_counts.items())
+            },
+            "queue_delay_ms": {
+                "mean": self.queue_delay_ms_sum / self.items if self.items else 0.0,
+                "max": self.queue_delay_ms_max,
+                "buckets": {
+                    **{
+                        f"le_{upper_bound}": count
+                        for upper_bound, count in zip(
+                            QUEUE_DELAY_BUCKETS_MS, self.queue_delay_bucket_counts
+                        )
+                    },
+                    "inf": self.queue_delay_bucket_counts[-1],
+                },
+            },
+        }
+
+
+class QueryBatcher:
+    """
+    동시에 들어온 요청을 최대 max_wait_ms 동안 혹은 max_batch_size개까지 모아
+    predict_batch를 한 번 호출하고, 각 요청에 결과를 돌려주는 객체
+
+    predict_batch는 작업 풀에서 실행하며, 풀의 작업 수만큼만 배치를 동시에 처리한다.
+    처리 중인 배치가 끝나기를 기다리는 동안 들어온 요청은 다음 배치로 모인다.
+    대기 중인 요청이 max_queue_size개에 이르면 새 요청은 곧바로 503 CustomException으로 거절한다.
+
+    Attributes:
+        metrics (BatchMetrics): 배치 크기 분포와 대기 시간 통계
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[List[str], List[int]], List[Any]],
+        pool: InferencePool,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int,
+    ):
+        self.predict_batch = predict_batch
+        self.pool = pool
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max(1, max_queue_size)
+        self.metrics = BatchMetrics()
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def is_idle(self) -> bool:
+        return self.queue_size == 0 and not self._batch_tasks
+
+    async def predict(self, query: str, top_k: int = 3) -> Any:
+        """
+        요청을 배치 대기열에 넣고, 배치가 처리되면 해당 요청의 결과를 반환한다.
+
+        Args:
+            query (str): 사용자의 설명
+            top_k (int): 목록에 넣을 단어의 수
+
+        Returns:
+            Any: predict_batch가 반환한 결과 중 해당 요청의 결과
+        """
+
+        self._start()
+
+        if self._queue.qsize() >= self.max_queue_size:
+            self.metrics.rejected += 1
+            raise create_server_busy_exception()
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((query, top_k, future, time.perf_counter()))
+
+        return await future
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.pool.max_workers)
+        self._worker = loop.create_task(self._run())
+
+    async def _collect_batch(self) -> List[tuple]:
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            await self._slots.acquire()
+
+            try:
+                batch = await self._collect_batch()
+            except asyncio.CancelledError:
+                self._slots.release()
+                raise
+
+            batch = [item for item in batch if not item[2].done()]
+
+            if not batch:
+                self._slots.release()
+                continue
+
+            started_at = time.perf_counter()
+            self.metrics.record(
+                [(started_at - enqueued_at) * 1000 for *_, enqueued_at in batch]
+            )
+
+            task = asyncio.create_task(self._process(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _process(self, batch: List[tuple]) -> None:
+        queries = [query for query, *_ in batch]
+        top_ks = [top_k for _, top_k, *_ in batch]
+
+        try:
+            results = await self.pool.run(self.predict_batch, queries, top_ks)
+        except Exception as exc:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, _, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """
+        배치 작업을 멈추고, 처리되지 않은 요청은 취소한다.
+        """
+
+        if self._worker is None:
+            return
+
+        tasks = [self._worker, *self._batch_tasks]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+        while not self._queue.empty():
+            _, _, future, _ = self._queue.get_nowait()
+            future.cancel()
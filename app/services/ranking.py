@@ -0,0 +1,122 @@
+"""
+벡터 인덱스의 검색 결과를 바탕으로 추론 결과의 순위를 매기는 모듈
+"""
+
+from typing import List
+
+import numpy as np
+
+from app.services.vector_index import VectorIndex
+from app.settings.constants import PREDICTION_CANDIDATE_FACTOR
+
+
+def get_distinct_labels(
+    candidates: np.ndarray, label_codes: np.ndarray, top_k: int
+) -> np.ndarray:
+    """
+    정렬된 후보 문장에서 처음 등장하는 순서대로 중복되지 않는 레이블 코드를 최대 top_k개 반환한다.
+
+    Args:
+        candidates (np.ndarray): 유사도가 높은 순서로 정렬된 코퍼스 인덱스
+        label_codes (np.ndarray): 코퍼스 각 문장의 정수 레이블 코드 (1차원)
+        top_k (int): 반환할 레이블의 수
+
+    Returns:
+        np.ndarray: 유사도가 높은 순서로 정렬된 레이블 코드
+    """
+
+    candidate_codes = label_codes[candidates]
+    _, first_positions = np.unique(candidate_codes, return_index=True)
+    first_positions.sort()
+
+    return candidate_codes[first_positions[:top_k]]
+
+
+def get_top_k_labels(
+    index: VectorIndex,
+    query_embedding: np.ndarray,
+    label_codes: np.ndarray,
+    top_k: int,
+) -> np.ndarray:
+    """
+    질의와 유사도가 높은 순서대로 중복되지 않는 레이블 코드를 최대 top_k개 반환한다.
+
+    인덱스에서 top_k보다 넉넉한 수의 후보만 가져와 레이블 중복을 제거한다.
+    후보 안에서 서로 다른 레이블이 top_k개에 못 미치면 후보 수를 두 배씩 늘려 다시 찾는다.
+
+    Args:
+        index (VectorIndex): 코퍼스 임베딩의 벡터 인덱스
+        query_embedding (np.ndarray): 질의 임베딩 (1차원)
+        label_codes (np.ndarray): 코퍼스 각 문장의 정수 레이블 코드 (1차원)
+        top_k (int): 반환할 레이블의 수
+
+    Returns:
+        np.ndarray: 유사도가 높은 순서로 정렬된 레이블 코드
+    """
+
+    if index.size == 0 or top_k <= 0:
+        return np.empty(0, dtype=label_codes.dtype)
+
+    candidate_count = min(index.size, top_k * PREDICTION_CANDIDATE_FACTOR)
+
+    while True:
+        candidates = index.search(query_embedding, candidate_count)
+        distinct_labels = get_distinct_labels(candidates, label_codes, top_k)
+
+        if (
+            distinct_labels.size >= top_k
+            or candidates.size < candidate_count
+            or candidate_count >= index.size
+        ):
+            return distinct_labels
+
+        candidate_count = min(index.size, candidate_count * 2)
+
+
+def get_top_k_labels_batch(
+    index: VectorIndex,
+    query_embeddings: np.ndarray,
+    label_codes: np.ndarray,
+    top_ks: List[int],
+) -> List[np.ndarray]:
+    """
+    여러 질의에 대해 get_top_k_labels를 실행한 결과를 반환한다.
+
+    모든 질의의 후보를 search_batch 한 번으로 가져오고,
+    후보 안에서 레이블이 모자란 질의만 get_top_k_labels로 다시 찾는다.
+
+    Args:
+        index (VectorIndex): 코퍼스 임베딩의 벡터 인덱스
+        query_embeddings (np.ndarray): 질의 임베딩 (2차원)
+        label_codes (np.ndarray): 코퍼스 각 문장의 정수 레이블 코드 (1차원)
+        top_ks (List[int]): 질의별로 반환할 레이블의 수
+
+    Returns:
+        List[np.ndarray]: 질의별로 유사도가 높은 순서로 정렬된 레이블 코드
+    """
+
+    if index.size == 0 or not top_ks:
+        return [np.empty(0, dtype=label_codes.dtype) for _ in top_ks]
+
+    candidate_count = min(index.size, max(top_ks) * PREDICTION_CANDIDATE_FACTOR)
+    results = []
+
+    for query_embedding, candidates, top_k in zip(
+        query_embeddings,
+        index.search_batch(query_embeddings, candidate_count),
+        top_ks,
+    ):
+        distinct_labels = get_distinct_labels(candidates, label_codes, top_k)
+
+        if (
+            distinct_labels.size < top_k
+            and candidates.size == candidate_count
+            and candidate_count < index.size
+        ):
+            distinct_labels = get_top_k_labels(
+                index, query_embedding, label_codes, top_k
+            )
+
+        results.append(distinct_labels)
+
+    return results
@@ -0,0 +1,250 @@
+"""
+비동기 음성 인식 클라이언트로 음성을 텍스트로 바꾸는 모듈
+"""
+
+import asyncio
+import random
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from google.api_core.exceptions import (
+    DeadlineExceeded,
+    InternalServerError,
+    ServiceUnavailable,
+    TooManyRequests,
+)
+from google.cloud import speech_v2
+
+from app.core.config import (
+    get_speech_client,
+    raw_audio_recognition_config,
+    speech_recognition_config,
+)
+from app.services.audio_preprocessor import has_wav_header
+from app.services.inference_pool import create_server_busy_exception
+from app.settings.constants import (
+    GCP_PROJECT_ID,
+    STT_MAX_CONCURRENCY,
+    STT_MAX_RETRIES,
+    STT_RETRY_BACKOFF_MS,
+    STT_STREAM_CHUNK_BYTES,
+    STT_STREAM_MAX_CONCURRENCY,
+    STT_STREAM_TIMEOUT_SECONDS,
+    STT_TIMEOUT_SECONDS,
+)
+
+RETRYABLE_ERRORS = (
+    DeadlineExceeded,
+    InternalServerError,
+    ServiceUnavailable,
+    TooManyRequests,
+)
+
+
+class SpeechRecognizer:
+    """
+    이벤트 루프를 막지 않고 음성 인식 API를 호출하는 객체
+
+    동시에 진행하는 호출은 max_concurrency개로 제한하며, 호출마다 timeout_seconds의 기한을 둔다.
+    기한에는 동시 실행 자리를 기다리는 시간과 재시도가 모두 포함되며,
+    자리를 기한 안에 얻지 못하면 503 CustomException으로 거절한다.
+    일시적인 오류(RETRYABLE_ERRORS)는 남은 기한 안에서 지터를 준 지수 백오프로 재시도한다.
+    클라이언트의 자체 재시도는 끄고, 남은 기한을 gRPC 기한으로 넘긴다.
+    스트리밍 인식은 세션이 길게 이어질 수 있어 동기 호출과 따로 stream_max_concurrency개로 제한하며,
+    재시도 없이 stream_timeout_seconds를 기한으로 둔다.
+    스트림의 앞부분이 WAV 헤더가 아니면 raw_config로 인식한다.
+
+    Attributes:
+        recognizer (str): 음성 인식기 리소스 이름
+        config (speech_v2.RecognitionConfig): 음성 인식 설정
+        raw_config (speech_v2.RecognitionConfig): 헤더 없이 스트리밍되는 음성의 인식 설정
+        max_concurrency (int): 동시에 진행할 수 있는 호출 수
+        timeout_seconds (float): 호출 하나에 주어지는 전체 시간 (초)
+        max_retries (int): 일시적인 오류 발생 시 재시도 횟수
+        retry_backoff_ms (float): 첫 재시도 전 대기 시간 (ms), 재시도마다 두 배로 늘어남
+        stream_timeout_seconds (float): 스트리밍 인식 한 세션에 주어지는 최대 시간 (초)
+        stream_chunk_bytes (int): 스트리밍 요청 하나에 담을 음성 데이터의 최대 크기 (bytes)
+        stream_max_concurrency (int): 동시에 진행할 수 있는 스트리밍 인식 세션 수
+        in_flight (int): 진행 중인 호출 수
+        streams_in_flight (int): 진행 중인 스트리밍 인식 세션 수
+    """
+
+    def __init__(
+        self,
+        get_client: Callable[[], Any],
+        recognizer: str,
+        config: speech_v2.RecognitionConfig,
+        max_concurrency: int,
+        timeout_seconds: float,
+        max_retries: int,
+        retry_backoff_ms: float,
+        stream_timeout_seconds: float = STT_STREAM_TIMEOUT_SECONDS,
+        stream_chunk_bytes: int = STT_STREAM_CHUNK_BYTES,
+        stream_max_concurrency: int = STT_STREAM_MAX_CONCURRENCY,
+        raw_config: Optional[speech_v2.RecognitionConfig] = None,
+    ):
+        self.get_client = get_client
+        self.recognizer = recognizer
+        self.config = config
+        self.raw_config = raw_config or config
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_ms = retry_backoff_ms
+        self.stream_timeout_seconds = stream_timeout_seconds
+        self.stream_chunk_bytes = max(1, stream_chunk_bytes)
+        self.stream_max_concurrency = max(1, stream_max_concurrency)
+        self.in_flight = 0
+        self.streams_in_flight = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._stream_semaphore = asyncio.Semaphore(self.stream_max_concurrency)
+
+    async def recognize(self, content: bytes) -> speech_v2.RecognizeResponse:
+        """
+        음성 데이터를 인식한 결과를 반환한다.
+
+        Args:
+            content (bytes): 음성 데이터
+
+        Returns:
+            speech_v2.RecognizeResponse: 음성 인식 결과
+
+        Raises:
+            CustomException: 기한 안에 동시 실행 자리를 얻지 못한 경우 (503)
+            asyncio.TimeoutError: 기한 안에 응답을 받지 못한 경우
+        """
+
+        deadline = asyncio.get_running_loop().time() + self.timeout_seconds
+
+        await self._acquire_slot(self._semaphore)
+        self.in_flight += 1
+
+        try:
+            request = speech_v2.RecognizeRequest(
+                recognizer=self.recognizer, content=content, config=self.config
+            )
+
+            return await self._recognize_with_retries(request, deadline)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    async def streaming_recognize(
+        self, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[speech_v2.StreamingRecognizeResponse]:
+        """
+        음성 청크를 받는 대로 음성 인식 서버로 보내고, 중간 결과와 최종 결과를 도착하는 대로 내보낸다.
+
+        음성은 WAV 혹은 헤더 없는 raw LINEAR16이며, 앞부분에 WAV 헤더가 있는지로 인식 설정을 고른다.
+        chunks가 끝나면 서버로 보내는 스트림을 닫으며, 서버가 남은 결과를 보낸 뒤 끝난다.
+
+        Args:
+            chunks (AsyncIterator[bytes]): 음성 데이터 청크
+
+        Yields:
+            speech_v2.StreamingRecognizeResponse: 음성 인식 중간 결과 혹은 최종 결과
+
+        Raises:
+            CustomException: 기한 안에 스트리밍 세션 자리를 얻지 못한 경우 (503)
+        """
+
+        await self._acquire_slot(self._stream_semaphore)
+        self.streams_in_flight += 1
+
+        try:
+            responses = await self.get_client().streaming_recognize(
+                requests=self._create_streaming_requests(chunks),
+                retry=None,
+                timeout=self.stream_timeout_seconds,
+            )
+
+            async for response in responses:
+                yield response
+        finally:
+            self.streams_in_flight -= 1
+            self._stream_semaphore.release()
+
+    async def _create_streaming_requests(
+        self, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[speech_v2.StreamingRecognizeRequest]:
+        # WAV 헤더인지 판단할 수 있을 만큼 앞부분을 모은 뒤 인식 설정을 보낸다.
+        head_chunks = []
+
+        async for chunk in chunks:
+            head_chunks.append(chunk)
+
+            if sum(len(head_chunk) for head_chunk in head_chunks) >= 12:
+                break
+
+        head = b"".join(head_chunks)[:12]
+
+        yield speech_v2.StreamingRecognizeRequest(
+            recognizer=self.recognizer,
+            streaming_config=speech_v2.StreamingRecognitionConfig(
+                config=self.config if has_wav_header(head) else self.raw_config,
+                streaming_features=speech_v2.StreamingRecognitionFeatures(
+                    interim_results=True
+                ),
+            ),
+        )
+
+        for chunk in head_chunks:
+            for request in self._create_audio_requests(chunk):
+                yield request
+
+        async for chunk in chunks:
+            for request in self._create_audio_requests(chunk):
+                yield request
+
+    def _create_audio_requests(
+        self, chunk: bytes
+    ) -> Iterator[speech_v2.StreamingRecognizeRequest]:
+        for start in range(0, len(chunk), self.stream_chunk_bytes):
+            yield speech_v2.StreamingRecognizeRequest(
+                audio=chunk[start : start + self.stream_chunk_bytes]
+            )
+
+    async def _acquire_slot(self, semaphore: asyncio.Semaphore) -> None:
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.timeout_seconds)
+        except asyncio.TimeoutError as exc:
+            raise create_server_busy_exception("audio") from exc
+
+    async def _recognize_with_retries(
+        self, request: speech_v2.RecognizeRequest, deadline: float
+    ) -> speech_v2.RecognizeResponse:
+        loop = asyncio.get_running_loop()
+        client = self.get_client()
+        attempt = 0
+
+        while True:
+            remaining = deadline - loop.time()
+
+            try:
+                return await asyncio.wait_for(
+                    client.recognize(request=request, retry=None, timeout=remaining),
+                    remaining,
+                )
+            except RETRYABLE_ERRORS:
+                backoff_ms = self.retry_backoff_ms * 2**attempt
+                backoff_seconds = backoff_ms * random.uniform(0.5, 1.0) / 1000
+
+                if (
+                    attempt >= self.max_retries
+                    or loop.time() + backoff_seconds >= deadline
+                ):
+                    raise
+
+            attempt += 1
+            await asyncio.sleep(backoff_seconds)
+
+
+speech_recognizer = SpeechRecognizer(
+    get_speech_client,
+    f"projects/{GCP_PROJECT_ID}/locations/global/recognizers/_",
+    speech_recognition_config,
+    STT_MAX_CONCURRENCY,
+    STT_TIMEOUT_SECONDS,
+    STT_MAX_RETRIES,
+    STT_RETRY_BACKOFF_MS,
+    raw_config=raw_audio_recognition_config,
+)
@@ -0,0 +1,330 @@
+"""
+같은 음성 데이터에 대한 음성 인식 결과를 재사용하기 위한 캐시 모듈
+
+캐시 키는 음성 데이터와 음성 인식기, 음성 인식 설정, 음성 전처리 설정의 해시 값이며,
+결과는 직렬화된 speech_v2.RecognizeResponse로 메모리(LRUCache)와 선택적으로 디스크에 저장한다.
+디스크에는 키별로 다음 파일을 저장한다.
+    - <키 끝 두 글자>/<키>.bin: 직렬화된 음성 인식 결과
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from google.cloud import speech_v2
+
+from app.core.cache import LRUCache
+from app.core.config import speech_recognition_config
+from app.services.audio_preprocessor import audio_preprocessor
+from app.settings.constants import (
+    GCP_PROJECT_ID,
+    STT_API_CONFIDENCE_THRESHOLD,
+    STT_CACHE_DIR,
+    STT_CACHE_DISK_MAX_BYTES,
+    STT_CACHE_MAX_BYTES,
+    STT_CACHE_MAX_ENTRIES,
+    STT_CACHE_TTL_SECONDS,
+)
+
+# 디스크 사용량이 한도를 넘으면 한도의 이 비율 아래가 될 때까지 오래된 파일부터 지운다.
+DISK_PRUNE_RATIO = 0.9
+
+
+def is_cacheable(response: speech_v2.RecognizeResponse, min_confidence: float) -> bool:
+    """
+    음성 인식 결과가 캐시에 저장할 만한지 확인한다.
+
+    결과가 없거나, 첫 번째 결과의 텍스트가 비어 있거나, 신뢰도가 min_confidence보다 낮으면 저장하지 않는다.
+
+    Args:
+        response (speech_v2.RecognizeResponse): 음성 인식 결과
+        min_confidence (float): 저장할 결과의 최소 신뢰도
+
+    Returns:
+        bool: 저장할 수 있는 경우 True
+    """
+
+    if not response.results or not response.results[0].alternatives:
+        return False
+
+    alternative = response.results[0].alternatives[0]
+
+    return bool(alternative.transcript.strip()) and (
+        alternative.confidence >= min_confidence
+    )
+
+
+class TranscriptionCache:
+    """
+    음성 인식 결과 캐시
+
+    같은 키로 동시에 들어온 요청은 하나의 음성 인식 호출을 함께 기다린다.
+    먼저 요청한 쪽이 취소되어도 호출은 계속되어 나머지 요청이 결과를 받는다.
+    오류, 빈 결과와 신뢰도가 낮은 결과는 저장하지 않는다.
+
+    Attributes:
+        memory (LRUCache): 직렬화된 음성 인식 결과를 저장하는 메모리 캐시
+        disk_dir (str): 디스크 캐시 디렉터리, 빈 문자열이면 디스크에 저장하지 않음
+        disk_max_bytes (int): 디스크 캐시의 최대 전체 크기 (bytes)
+        min_confidence (float): 저장할 결과의 최소 신뢰도
+        disk_hits (int): 디스크 캐시 적중 수
+        coalesced (int): 진행 중인 호출을 함께 기다린 요청 수
+    """
+
+    def __init__(
+        self,
+        recognizer: str,
+        config: speech_v2.RecognitionConfig,
+        memory: LRUCache,
+        disk_dir: str = "",
+        disk_max_bytes: int = 0,
+        min_confidence: float = STT_API_CONFIDENCE_THRESHOLD,
+        preprocess_settings: str = "",
+    ):
+        self.memory = memory
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.min_confidence = min_confidence
+        self.disk_hits = 0
+        self.coalesced = 0
+        self._config_hash = hashlib.blake2b(
+            recognizer.encode("utf-8")
+            + b"\0"
+            + speech_v2.RecognitionConfig.serialize(config)
+            + b"\0"
+            + preprocess_settings.encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._disk_bytes: Optional[int] = None
+        # 디스크 쓰기는 여러 스레드에서 실행되므로 사용량 계산과 정리를 한 번에 하나씩만 한다.
+        self._disk_lock = threading.Lock()
+
+    def create_key(self, audio: bytes) -> str:
+        """
+        음성 데이터와 음성 인식 설정, 음성 전처리 설정에 해당하는 캐시 키를 만든다.
+
+        Args:
+            audio (bytes): 음성 데이터
+
+        Returns:
+            str: 캐시 키
+        """
+
+        audio_hash = hashlib.blake2b(audio, digest_size=16).hexdigest()
+
+        return f"{self._config_hash}-{audio_hash}"
+
+    async def recognize(
+        self,
+        audio: bytes,
+        recognize: Callable[[bytes], Awaitable[speech_v2.RecognizeResponse]],
+    ) -> speech_v2.RecognizeResponse:
+        """
+        캐시된 음성 인식 결과가 있으면 반환하고, 없으면 recognize로 인식한 뒤 저장한다.
+
+        Args:
+            audio (bytes): 음성 데이터
+            recognize (Callable[[bytes], Awaitable[speech_v2.RecognizeResponse]]): 음성 인식 함수
+
+        Returns:
+            speech_v2.RecognizeResponse: 음성 인식 결과
+        """
+
+        key = self.create_key(audio)
+        response = await self.get(key)
+
+        if response is not None:
+            return response
+
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(
+                self._recognize_and_store(key, audio, recognize)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def get(self, key: str) -> Optional[speech_v2.RecognizeResponse]:
+        """
+        캐시된 음성 인식 결과를 메모리, 디스크 순서로 찾는다. 디스크에서 찾은 결과는 메모리에도 저장한다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[speech_v2.RecognizeResponse]: 캐시된 결과가 있으면 그 결과, 없으면 None
+        """
+
+        serialized = self.memory.get(key)
+
+        if serialized is None and self.disk_dir:
+            serialized = await asyncio.to_thread(self._read_disk, key)
+
+            if serialized is not None:
+                self.disk_hits += 1
+                self.memory.set(key, serialized)
+
+        if serialized is None:
+            return None
+
+        return speech_v2.RecognizeResponse.deserialize(serialized)
+
+    async def set(self, key: str, response: speech_v2.RecognizeResponse) -> None:
+        """
+        음성 인식 결과를 메모리와 디스크에 저장한다.
+
+        Args:
+            key (str): 캐시 키
+            response (speech_v2.RecognizeResponse): 음성 인식 결과
+        """
+
+        serialized = speech_v2.RecognizeResponse.serialize(response)
+        self.memory.set(key, serialized)
+
+        if self.disk_dir:
+            await asyncio.to_thread(self._write_disk, key, serialized)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        캐시의 통계를 반환한다.
+
+        Returns:
+            Dict[str, int]: 메모리 캐시 통계, 디스크 적중 수, 디스크 사용량, 함께 기다린 요청 수,
+                진행 중인 호출 수
+        """
+
+        return {
+            **self.memory.snapshot(),
+            "disk_hits": self.disk_hits,
+            "disk_bytes": self._disk_bytes or 0,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def _recognize_and_store(
+        self,
+        key: str,
+        audio: bytes,
+        recognize: Callable[[bytes], Awaitable[speech_v2.RecognizeResponse]],
+    ) -> speech_v2.RecognizeResponse:
+        response = await recognize(audio)
+
+        if is_cacheable(response, self.min_confidence):
+            await self.set(key, response)
+
+        return response
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고가 남지 않도록 한다.
+        if not task.cancelled():
+            task.exception()
+
+    def _get_disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[-2:], f"{key}.bin")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._get_disk_path(key)
+
+        try:
+            ttl_seconds = self.memory.ttl_seconds
+
+            if ttl_seconds > 0 and os.path.getmtime(path) + ttl_seconds <= time.time():
+                os.remove(path)
+                return None
+
+            with open(path, "rb") as cache_file:
+                return cache_file.read()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            logging.warning("Failed to read the transcription cache: %s", path)
+            return None
+
+    def _write_disk(self, key: str, serialized: bytes) -> None:
+        path = self._get_disk_path(key)
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(path), suffix=".tmp", delete=False
+            ) as temp_file:
+                temp_file.write(serialized)
+        except OSError:
+            logging.warning("Failed to write the transcription cache: %s", path)
+            return
+
+        with self._disk_lock:
+            try:
+                previous_size = os.path.getsize(path)
+            except OSError:
+                previous_size = 0
+
+            try:
+                os.replace(temp_file.name, path)
+            except OSError:
+                logging.warning("Failed to write the transcription cache: %s", path)
+                return
+
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._list_disk_files())
+            else:
+                # 같은 키를 다시 쓴 경우에는 이전 파일 크기를 빼서 두 번 세지 않는다.
+                self._disk_bytes += len(serialized) - previous_size
+
+            if 0 < self.disk_max_bytes < self._disk_bytes:
+                self._prune_disk()
+
+    def _list_disk_files(self) -> Iterator[Tuple[str, int, float]]:
+        for root, _, file_names in os.walk(self.disk_dir):
+            for file_name in file_names:
+                if file_name.endswith(".bin"):
+                    path = os.path.join(root, file_name)
+
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _prune_disk(self) -> None:
+        files = sorted(self._list_disk_files(), key=lambda file: file[2])
+        disk_bytes = sum(size for _, size, _ in files)
+
+        for path, size, _ in files:
+            if disk_bytes <= self.disk_max_bytes * DISK_PRUNE_RATIO:
+                break
+
+            try:
+                os.remove(path)
+                disk_bytes -= size
+            except FileNotFoundError:
+                disk_bytes -= size
+
+        self._disk_bytes = disk_bytes
+
+
+transcription_cache = TranscriptionCache(
+    f"projects/{GCP_PROJECT_ID}/locations/global/recognizers/_",
+    speech_recognition_config,
+    LRUCache(STT_CACHE_MAX_ENTRIES, STT_CACHE_MAX_BYTES, STT_CACHE_TTL_SECONDS),
+    STT_CACHE_DIR,
+    STT_CACHE_DISK_MAX_BYTES,
+    STT_API_CONFIDENCE_THRESHOLD,
+    audio_preprocessor.settings_key,
+)
@@ -0,0 +1,382 @@
+"""
+코퍼스 임베딩에서 질의와 가까운 문장을 찾는 벡터 인덱스 모듈
+"""
+
+import abc
+from typing import List, Optional
+
+import numpy as np
+
+from app.settings.constants import (
+    INDEX_BACKEND,
+    INDEX_IVF_N_LISTS,
+    INDEX_IVF_N_PROBE,
+    INDEX_RERANK_FACTOR,
+)
+
+KMEANS_TRAINING_POINTS_PER_LIST = 256
+KMEANS_ASSIGN_CHUNK_SIZE = 65_536
+EXACT_SEARCH_CHUNK_SIZE = 65_536
+
+
+def get_top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수가 높은 순서대로 상위 k개의 인덱스를 반환한다.
+
+    Args:
+        scores (np.ndarray): 점수 배열 (1차원)
+        k (int): 반환할 인덱스의 수
+
+    Returns:
+        np.ndarray: 점수가 높은 순서로 정렬된 인덱스
+    """
+
+    k = min(k, scores.shape[0])
+
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    if k < scores.shape[0]:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.shape[0])
+
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """
+    임베딩을 L2 norm이 1이 되도록 정규화한 float32 배열을 반환한다.
+
+    Args:
+        embeddings (np.ndarray): 정규화할 임베딩 (2차원)
+
+    Returns:
+        np.ndarray: 정규화된 임베딩
+    """
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def is_normalized(embeddings: np.ndarray, tolerance: float = 1e-2) -> bool:
+    """
+    임베딩의 모든 행의 L2 norm이 1(혹은 0 벡터)인지 확인한다.
+
+    Args:
+        embeddings (np.ndarray): 확인할 임베딩 (2차원)
+        tolerance (float): norm이 1과 다를 수 있는 허용 오차 (float16 반올림 포함)
+
+    Returns:
+        bool: 모든 행이 정규화되어 있으면 True
+    """
+
+    for start in range(0, embeddings.shape[0], EXACT_SEARCH_CHUNK_SIZE):
+        chunk = embeddings[start : start + EXACT_SEARCH_CHUNK_SIZE]
+        norms = np.linalg.norm(chunk.astype(np.float32, copy=False), axis=1)
+
+        if not np.all((np.abs(norms - 1) <= tolerance) | (norms == 0)):
+            return False
+
+    return True
+
+
+def get_normalized_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """
+    정규화된 임베딩을 반환한다. 이미 정규화되어 있으면 복사하지 않고 그대로 반환한다.
+
+    정규화되어 있지 않으면 EXACT_SEARCH_CHUNK_SIZE행씩 정규화해 같은 자료형의 배열을 만든다.
+
+    Args:
+        embeddings (np.ndarray): 코퍼스 임베딩 (2차원)
+
+    Returns:
+        np.ndarray: 행마다 L2 norm이 1인 C 연속 배열
+    """
+
+    if is_normalized(embeddings):
+        return np.ascontiguousarray(embeddings)
+
+    normalized = np.empty(embeddings.shape, dtype=embeddings.dtype)
+
+    for start in range(0, embeddings.shape[0], EXACT_SEARCH_CHUNK_SIZE):
+        end = start + EXACT_SEARCH_CHUNK_SIZE
+        normalized[start:end] = normalize_embeddings(embeddings[start:end])
+
+    return normalized
+
+
+class VectorIndex(abc.ABC):
+    """
+    벡터 인덱스의 공통 인터페이스 (하위 클래스는 search를 구현해야 한다)
+
+    Attributes:
+        size (int): 인덱스에 담긴 벡터의 수
+    """
+
+    def __init__(self, embeddings: np.ndarray):
+        self.size = embeddings.shape[0]
+
+    @abc.abstractmethod
+    def search(self, query_embedding: np.ndarray, k: int) -> np.ndarray:
+        """
+        질의와 코사인 유사도가 높은 순서대로 최대 k개의 코퍼스 인덱스를 반환한다.
+
+        Args:
+            query_embedding (np.ndarray): 질의 임베딩 (1차원)
+            k (int): 반환할 인덱스의 수
+
+        Returns:
+            np.ndarray: 유사도가 높은 순서로 정렬된 코퍼스 인덱스
+        """
+
+    def search_batch(self, query_embeddings: np.ndarray, k: int) -> List[np.ndarray]:
+        """
+        여러 질의에 대해 search를 실행한 결과를 반환한다.
+
+        Args:
+            query_embeddings (np.ndarray): 질의 임베딩 (2차원)
+            k (int): 질의마다 반환할 인덱스의 수
+
+        Returns:
+            List[np.ndarray]: 질의별로 유사도가 높은 순서로 정렬된 코퍼스 인덱스
+        """
+
+        return [self.search(query_embedding, k) for query_embedding in query_embeddings]
+
+
+class ExactIndex(VectorIndex):
+    """
+    질의를 코퍼스 전체와 비교하는 인덱스 (재현율 100%)
+
+    코퍼스 임베딩은 인덱스를 만들 때 한 번만 정규화하고(이미 정규화되어 있으면 그대로 사용),
+    검색할 때는 질의만 정규화해 행렬 곱 한 번으로 코사인 유사도를 계산한다.
+    float16 임베딩은 EXACT_SEARCH_CHUNK_SIZE행씩 float32로 바꿔 가며 비교하므로,
+    코퍼스 전체의 float32 사본을 만들지 않는다.
+
+    Attributes:
+        embeddings (np.ndarray): 정규화된 코퍼스 임베딩
+    """
+
+    def __init__(self, embeddings: np.ndarray):
+        super().__init__(embeddings)
+        self.embeddings = get_normalized_embeddings(embeddings)
+
+    def get_similarities(self, query_embeddings: np.ndarray) -> np.ndarray:
+        queries = normalize_embeddings(
+            np.reshape(query_embeddings, (-1, self.embeddings.shape[1]))
+        )
+
+        if self.embeddings.dtype == np.float32:
+            return queries @ self.embeddings.T
+
+        similarities = np.empty((queries.shape[0], self.size), dtype=np.float32)
+
+        for start in range(0, self.size, EXACT_SEARCH_CHUNK_SIZE):
+            end = start + EXACT_SEARCH_CHUNK_SIZE
+            similarities[:, start:end] = (
+                queries @ self.embeddings[start:end].astype(np.float32).T
+            )
+
+        return similarities
+
+    def search(self, query_embedding: np.ndarray, k: int) -> np.ndarray:
+        similarities = self.get_similarities(query_embedding)[0]
+
+        return get_top_k_indices(similarities, k)
+
+    def search_batch(self, query_embeddings: np.ndarray, k: int) -> List[np.ndarray]:
+        similarities = self.get_similarities(query_embeddings)
+
+        return [get_top_k_indices(row, k) for row in similarities]
+
+
+class IVFIndex(VectorIndex):
+    """
+    k-means로 코퍼스를 n_lists개의 군집으로 나누고,
+    질의와 가까운 n_probe개 군집 안에서만 비교하는 근사 인덱스
+
+    n_probe가 클수록 재현율이 높아지지만 비교할 벡터가 늘어나 지연 시간도 늘어난다.
+
+    Attributes:
+        centroids (np.ndarray): 군집 중심 벡터 (정규화됨)
+        list_offsets (np.ndarray): 군집별 벡터가 list_vectors에서 시작하는 위치
+        list_ids (np.ndarray): list_vectors의 각 행에 해당하는 코퍼스 인덱스
+        list_vectors (np.ndarray): 군집 순서로 정렬된 정규화 임베딩
+        n_probe (int): 검색 시 살펴볼 군집의 수
+    """
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        n_lists: int = INDEX_IVF_N_LISTS,
+        n_probe: int = INDEX_IVF_N_PROBE,
+        n_iterations: int = 10,
+    ):
+        super().__init__(embeddings)
+
+        vectors = normalize_embeddings(embeddings)
+
+        if n_lists <= 0:
+            n_lists = int(np.sqrt(self.size))
+        n_lists = max(1, min(n_lists, self.size))
+
+        self.centroids = self._train_centroids(vectors, n_lists, n_iterations)
+        assignments = self._assign(vectors, self.centroids)
+
+        order = np.argsort(assignments, kind="stable")
+        list_sizes = np.bincount(assignments, minlength=n_lists)
+
+        self.list_offsets = np.concatenate(([0], np.cumsum(list_sizes)))
+        self.list_ids = order
+        self.list_vectors = np.ascontiguousarray(vectors[order])
+        self.n_probe = n_probe
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        assignments = np.empty(vectors.shape[0], dtype=np.int64)
+
+        for start in range(0, vectors.shape[0], KMEANS_ASSIGN_CHUNK_SIZE):
+            chunk = vectors[start : start + KMEANS_ASSIGN_CHUNK_SIZE]
+            assignments[start : start + chunk.shape[0]] = np.argmax(
+                chunk @ centroids.T, axis=1
+            )
+
+        return assignments
+
+    @classmethod
+    def _train_centroids(
+        cls, vectors: np.ndarray, n_lists: int, n_iterations: int
+    ) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        training_size = min(vectors.shape[0], n_lists * KMEANS_TRAINING_POINTS_PER_LIST)
+        training_vectors = vectors[
+            rng.choice(vectors.shape[0], size=training_size, replace=False)
+        ]
+        centroids = training_vectors[:n_lists].copy()
+
+        for _ in range(n_iterations):
+            assignments = cls._assign(training_vectors, centroids)
+            order = np.argsort(assignments, kind="stable")
+            non_empty, starts = np.unique(assignments[order], return_index=True)
+            sums = np.add.reduceat(training_vectors[order], starts, axis=0)
+            centroids[non_empty] = normalize_embeddings(sums)
+
+        return centroids
+
+    def search(
+        self, query_embedding: np.ndarray, k: int, n_probe: Optional[int] = None
+    ) -> np.ndarray:
+        query = normalize_embeddings(np.reshape(query_embedding, (1, -1)))[0]
+        n_probe = min(n_probe or self.n_probe, self.centroids.shape[0])
+
+        probed_lists = get_top_k_indices(self.centroids @ query, n_probe)
+        starts = self.list_offsets[probed_lists]
+        ends = self.list_offsets[probed_lists + 1]
+
+        scores = np.concatenate(
+            [self.list_vectors[start:end] @ query for start, end in zip(starts, ends)]
+        )
+        positions = np.concatenate(
+            [np.arange(start, end) for start, end in zip(starts, ends)]
+        )
+
+        return self.list_ids[positions[get_top_k_indices(scores, k)]]
+
+
+class QuantizedIndex(VectorIndex):
+    """
+    정규화한 임베딩을 int8(벡터별 scale) 혹은 float16으로 압축해 두고,
+    압축된 행렬로 대략적인 점수를 매긴 뒤 상위 k * rerank_factor개의 후보만
+    원래 임베딩으로 정확한 코사인 유사도를 다시 계산해 순위를 정하는 인덱스
+
+    압축된 행렬은 int8이면 float32의 1/4, float16이면 1/2 크기이다.
+    원래 임베딩은 후보 행만 읽으므로, 메모리 맵으로 연 경우 대부분 디스크에 남아 있다.
+
+    Attributes:
+        kind (str): 압축 방식 ("int8" 혹은 "float16")
+        codes (np.ndarray): 압축된 정규화 임베딩
+        scales (Optional[np.ndarray]): int8인 경우 벡터별 scale (codes * scale ≈ 정규화 임베딩)
+        embeddings (np.ndarray): 재정렬에 사용하는 원래 임베딩
+        rerank_factor (int): 재정렬할 후보 수의 배수
+    """
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        kind: str = "int8",
+        rerank_factor: int = INDEX_RERANK_FACTOR,
+    ):
+        super().__init__(embeddings)
+
+        if kind not in ("int8", "float16"):
+            raise ValueError(f"Unsupported quantization kind: {kind}")
+
+        self.kind = kind
+        self.embeddings = embeddings
+        self.rerank_factor = max(1, rerank_factor)
+        self.codes = np.empty(embeddings.shape, dtype=kind)
+        self.scales = np.empty(self.size, dtype=np.float32) if kind == "int8" else None
+
+        for start in range(0, self.size, EXACT_SEARCH_CHUNK_SIZE):
+            end = start + EXACT_SEARCH_CHUNK_SIZE
+            vectors = normalize_embeddings(embeddings[start:end])
+
+            if self.scales is None:
+                self.codes[start:end] = vectors
+                continue
+
+            scales = np.maximum(np.abs(vectors).max(axis=1) / 127, 1e-12)
+            self.codes[start:end] = np.rint(vectors / scales[:, None])
+            self.scales[start:end] = scales
+
+    def get_coarse_scores(self, queries: np.ndarray) -> np.ndarray:
+        scores = np.empty((queries.shape[0], self.size), dtype=np.float32)
+
+        for start in range(0, self.size, EXACT_SEARCH_CHUNK_SIZE):
+            end = start + EXACT_SEARCH_CHUNK_SIZE
+            scores[:, start:end] = queries @ self.codes[start:end].astype(np.float32).T
+
+            if self.scales is not None:
+                scores[:, start:end] *= self.scales[start:end]
+
+        return scores
+
+    def search(self, query_embedding: np.ndarray, k: int) -> np.ndarray:
+        return self.search_batch(np.reshape(query_embedding, (1, -1)), k)[0]
+
+    def search_batch(self, query_embeddings: np.ndarray, k: int) -> List[np.ndarray]:
+        queries = normalize_embeddings(query_embeddings)
+        results = []
+
+        for query, scores in zip(queries, self.get_coarse_scores(queries)):
+            # 메모리 맵에서 순서대로 읽도록 후보를 corpus 순서로 정렬한다.
+            candidates = np.sort(get_top_k_indices(scores, k * self.rerank_factor))
+            exact_scores = normalize_embeddings(self.embeddings[candidates]) @ query
+            results.append(candidates[get_top_k_indices(exact_scores, k)])
+
+        return results
+
+
+def build_index(embeddings: np.ndarray, backend: str = INDEX_BACKEND) -> VectorIndex:
+    """
+    설정된 백엔드로 코퍼스 임베딩의 벡터 인덱스를 만든다.
+
+    Args:
+        embeddings (np.ndarray): 코퍼스 임베딩 (2차원)
+        backend (str): 인덱스 종류 ("exact", "ivf", "int8", "float16")
+
+    Returns:
+        VectorIndex: 생성된 벡터 인덱스
+    """
+
+    if backend == "exact":
+        return ExactIndex(embeddings)
+    if backend == "ivf":
+        return IVFIndex(embeddings)
+    if backend in ("int8", "float16"):
+        return QuantizedIndex(embeddings, backend)
+
+    raise ValueError(f"Unsupported index backend: {backend}")
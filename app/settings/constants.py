@@ -11,12 +11,30 @@ load_dotenv()
 # Origins 관련
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS").split(",")
 
+# 서버 구성 관련
+# 워커가 제공할 라우터 (쉼표로 구분, "transcriptions", "predictions", "admin", "voice_predictions")
+# /healthz, /readyz는 항상 제공하며, 목록에 없는 라우터의 의존성은 import하지 않는다.
+ENABLED_ROUTERS = os.getenv(
+    "ENABLED_ROUTERS", "transcriptions,predictions,admin,voice_predictions"
+).split(",")
+
 # Google Cloud Platform 관련
 GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID")
 
 # MongoDB 관련
 MONGODB_URI = os.getenv("MONGODB_URI")
 MONGODB_DB_NAME = os.getenv("MONGODB_DB_NAME")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "5000"))
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(
+    os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000")
+)
+MONGODB_SOCKET_TIMEOUT_MS = int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "30000"))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "1000"))
+
+# 관리자 API 관련
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY")
 
 # AWS S3 관련
 AWS_S3_BUCKET_NAME = os.getenv("WCC_AWS_S3_BUCKET_NAME")
@@ -25,26 +43,148 @@ AWS_SECRET_ACCESS_KEY = os.getenv("WCC_AWS_SECRET_ACCESS_KEY")
 
 # 모델 관련
 MODEL_API_VERSION_LATEST = "v1"
-MODEL_S3_PATH = f"models/{MODEL_API_VERSION_LATEST}/model.zip"
-MODEL_LOCAL = f"app/settings/model/{MODEL_API_VERSION_LATEST}"
-MODEL_LOCAL_PATH = f"app/settings/model/{MODEL_API_VERSION_LATEST}/model.zip"
+# 모델 버전별 압축 파일과 매니페스트(<접두사>/<버전>/model.zip, manifest.json)를 두는 S3 키 접두사
+MODEL_S3_PREFIX = os.getenv("MODEL_S3_PREFIX", "models")
+MODEL_S3_PATH = f"{MODEL_S3_PREFIX}/{MODEL_API_VERSION_LATEST}/model.zip"
+# 모델 버전별 디렉터리(app/settings/model/<버전>)를 두는 최상위 디렉터리
+MODEL_ROOT = "app/settings/model"
+MODEL_LOCAL = f"{MODEL_ROOT}/{MODEL_API_VERSION_LATEST}"
+MODEL_LOCAL_PATH = f"{MODEL_ROOT}/{MODEL_API_VERSION_LATEST}/model.zip"
+# 버전을 지정하지 않은 요청에 사용할 모델 버전
+MODEL_VERSION_DEFAULT = os.getenv("MODEL_VERSION_DEFAULT", MODEL_API_VERSION_LATEST)
+# 메모리에 동시에 올려 둘 수 있는 모델 버전 수 (기본 버전 포함, 최소 2)
+MODEL_MAX_RESIDENT_VERSIONS = int(os.getenv("MODEL_MAX_RESIDENT_VERSIONS", "2"))
+# 불러오기에 실패한 모델 버전을 요청으로 다시 불러오기 전까지 기다릴 시간 (초)
+MODEL_LOAD_RETRY_SECONDS = float(os.getenv("MODEL_LOAD_RETRY_SECONDS", "60"))
+# 모델 파일을 받아 올 저장소 ("s3", "filesystem", 빈 문자열이면 받아 오지 않고 로컬 파일만 사용)
+MODEL_ARTIFACT_BACKEND = os.getenv("MODEL_ARTIFACT_BACKEND", "")
+# filesystem 저장소의 최상위 디렉터리 (S3 버킷과 같은 키 구조)
+MODEL_ARTIFACT_FS_ROOT = os.getenv("MODEL_ARTIFACT_FS_ROOT", "")
+# 압축 파일을 나누어 받을 범위 요청 하나의 크기 (bytes)
+MODEL_DOWNLOAD_PART_BYTES = int(os.getenv("MODEL_DOWNLOAD_PART_BYTES", "8388608"))
+MODEL_DOWNLOAD_CONCURRENCY = int(os.getenv("MODEL_DOWNLOAD_CONCURRENCY", "8"))
+MODEL_DOWNLOAD_MAX_RETRIES = int(os.getenv("MODEL_DOWNLOAD_MAX_RETRIES", "3"))
+# 압축을 푼 뒤에도 압축 파일을 남겨, 다음에 다시 풀 때 받지 않고 재사용할지 여부
+MODEL_KEEP_ARCHIVE = os.getenv("MODEL_KEEP_ARCHIVE", "true").lower() == "true"
+# 문장 인코더 실행 방식 ("torch": SentenceTransformer, "onnx": ONNX Runtime)
+MODEL_ENCODER_BACKEND = os.getenv("MODEL_ENCODER_BACKEND", "torch")
+# onnx 실행 방식에서 가중치를 int8로 동적 양자화한 모델을 사용할지 여부
+MODEL_ONNX_QUANTIZE = os.getenv("MODEL_ONNX_QUANTIZE", "false").lower() == "true"
+# ONNX Runtime 연산 하나가 사용할 스레드 수, 0이면 CPU 수를 추론 작업 풀 크기로 나눈 값
+MODEL_ONNX_INTRA_OP_THREADS = int(os.getenv("MODEL_ONNX_INTRA_OP_THREADS", "0"))
+CORPUS_CACHE_DIR = os.getenv("CORPUS_CACHE_DIR", f"{MODEL_LOCAL}/corpus_cache")
+CORPUS_SYNC_BATCH_SIZE = int(os.getenv("CORPUS_SYNC_BATCH_SIZE", "64"))
+# "float32" 혹은 "float16" (메모리와 디스크 사용량이 절반)
+CORPUS_EMBEDDING_DTYPE = os.getenv("CORPUS_EMBEDDING_DTYPE", "float32")
+CORPUS_LOAD_CHUNK_SIZE = int(os.getenv("CORPUS_LOAD_CHUNK_SIZE", "1024"))
+# 0이면 주기적인 동기화를 하지 않음
+CORPUS_SYNC_INTERVAL_SECONDS = float(os.getenv("CORPUS_SYNC_INTERVAL_SECONDS", "0"))
+
+# 단어 추론 관련
+PREDICTION_CANDIDATE_FACTOR = 4  # 중복 레이블 제거 전 top_k 대비 후보 문장 수의 배수
+PREDICTION_BATCH_MAX_SIZE = int(os.getenv("PREDICTION_BATCH_MAX_SIZE", "32"))
+PREDICTION_BATCH_MAX_WAIT_MS = float(os.getenv("PREDICTION_BATCH_MAX_WAIT_MS", "5"))
+PREDICTION_MAX_TOP_K = int(os.getenv("PREDICTION_MAX_TOP_K", "20"))
+PREDICTION_BATCH_MAX_ITEMS = int(os.getenv("PREDICTION_BATCH_MAX_ITEMS", "512"))
+
+# 단어 추론 캐시 관련
+PREDICTION_CACHE_MAX_ENTRIES = int(os.getenv("PREDICTION_CACHE_MAX_ENTRIES", "10000"))
+PREDICTION_CACHE_MAX_BYTES = int(os.getenv("PREDICTION_CACHE_MAX_BYTES", "16777216"))
+PREDICTION_CACHE_TTL_SECONDS = float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "600"))
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = int(
+    os.getenv("QUERY_EMBEDDING_CACHE_MAX_ENTRIES", "10000")
+)
+QUERY_EMBEDDING_CACHE_MAX_BYTES = int(
+    os.getenv("QUERY_EMBEDDING_CACHE_MAX_BYTES", "33554432")
+)
+
+# 추론 작업 풀 관련
+# 단어 추론 라우터는 "thread"만 지원한다. fork된 작업자는 나중에 불러온 모델 버전과 코퍼스 동기화를 보지 못한다.
+INFERENCE_POOL_KIND = os.getenv("INFERENCE_POOL_KIND", "thread")  # "thread", "process"
+INFERENCE_POOL_SIZE = int(os.getenv("INFERENCE_POOL_SIZE", "2"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "64"))
+
+# 피드백 저장 관련
+FEEDBACK_QUEUE_SIZE = int(os.getenv("FEEDBACK_QUEUE_SIZE", "10000"))
+FEEDBACK_FLUSH_SIZE = int(os.getenv("FEEDBACK_FLUSH_SIZE", "100"))
+FEEDBACK_FLUSH_INTERVAL_MS = float(os.getenv("FEEDBACK_FLUSH_INTERVAL_MS", "500"))
+FEEDBACK_MAX_RETRIES = int(os.getenv("FEEDBACK_MAX_RETRIES", "5"))
+FEEDBACK_RETRY_BACKOFF_MS = float(os.getenv("FEEDBACK_RETRY_BACKOFF_MS", "200"))
+FEEDBACK_SHUTDOWN_TIMEOUT_SECONDS = float(
+    os.getenv("FEEDBACK_SHUTDOWN_TIMEOUT_SECONDS", "10")
+)
+FEEDBACK_SPILL_PATH = os.getenv("FEEDBACK_SPILL_PATH", "feedback_spill.jsonl")
+
+# 벡터 인덱스 관련
+# "exact", "ivf", "int8", "float16" (int8, float16은 압축 점수 후 정확히 재정렬)
+INDEX_BACKEND = os.getenv("INDEX_BACKEND", "exact")
+INDEX_IVF_N_LISTS = int(os.getenv("INDEX_IVF_N_LISTS", "0"))  # 0이면 코퍼스 크기의 제곱근
+INDEX_IVF_N_PROBE = int(os.getenv("INDEX_IVF_N_PROBE", "8"))  # 클수록 재현율과 지연 시간이 증가
+# 압축 인덱스에서 정확히 재정렬할 후보 수의 배수 (k * INDEX_RERANK_FACTOR)
+INDEX_RERANK_FACTOR = int(os.getenv("INDEX_RERANK_FACTOR", "4"))
 
 # 음성인식 / STT(Speech-to-Text) 관련
 STT_API_VERSION_LATEST = "v1"
 STT_API_CONFIDENCE_THRESHOLD = 0.5
+STT_SERVICE_ACCOUNT_FILE = os.getenv(
+    "STT_SERVICE_ACCOUNT_FILE", "app/settings/key.json"
+)
+STT_MAX_CONCURRENCY = int(os.getenv("STT_MAX_CONCURRENCY", "8"))
+# 음성 인식 요청 하나에 주어지는 전체 시간 (동시 실행 대기와 재시도 포함)
+STT_TIMEOUT_SECONDS = float(os.getenv("STT_TIMEOUT_SECONDS", "10"))
+STT_MAX_RETRIES = int(os.getenv("STT_MAX_RETRIES", "2"))
+STT_RETRY_BACKOFF_MS = float(os.getenv("STT_RETRY_BACKOFF_MS", "200"))
+# 한 번에 받을 수 있는 음성 데이터의 최대 크기 (동기 음성 인식 API의 제한은 10MB)
+STT_MAX_AUDIO_BYTES = int(os.getenv("STT_MAX_AUDIO_BYTES", str(10 * 1024 * 1024)))
+# 스트리밍 음성 인식 한 세션에 주어지는 최대 시간 (초)
+STT_STREAM_TIMEOUT_SECONDS = float(os.getenv("STT_STREAM_TIMEOUT_SECONDS", "300"))
+# 동시에 진행할 수 있는 스트리밍 인식 세션 수 (STT_MAX_CONCURRENCY와 따로 센다)
+STT_STREAM_MAX_CONCURRENCY = int(os.getenv("STT_STREAM_MAX_CONCURRENCY", "8"))
+# 음성 인식 서버로 한 번에 보낼 음성 데이터의 최대 크기 (StreamingRecognizeRequest의 제한은 15KB)
+STT_STREAM_CHUNK_BYTES = int(os.getenv("STT_STREAM_CHUNK_BYTES", "15360"))
+# 클라이언트에서 받았지만 아직 보내지 못한 음성 청크 수, 가득 차면 클라이언트에서 읽기를 멈춘다.
+STT_STREAM_QUEUE_SIZE = int(os.getenv("STT_STREAM_QUEUE_SIZE", "32"))
+STT_CACHE_MAX_ENTRIES = int(os.getenv("STT_CACHE_MAX_ENTRIES", "1000"))
+STT_CACHE_MAX_BYTES = int(os.getenv("STT_CACHE_MAX_BYTES", "4194304"))
+STT_CACHE_TTL_SECONDS = float(os.getenv("STT_CACHE_TTL_SECONDS", "86400"))
+# 음성 인식 결과를 디스크에도 저장할 디렉터리 (빈 문자열이면 메모리에만 저장)
+STT_CACHE_DIR = os.getenv("STT_CACHE_DIR", "")
+STT_CACHE_DISK_MAX_BYTES = int(os.getenv("STT_CACHE_DISK_MAX_BYTES", "268435456"))
+# 음성 인식 전에 모노 변환, 리샘플링, 앞뒤 무음 제거를 할지 여부
+STT_PREPROCESS_ENABLED = os.getenv("STT_PREPROCESS_ENABLED", "true").lower() == "true"
+STT_SAMPLE_RATE = int(os.getenv("STT_SAMPLE_RATE", "16000"))
+STT_VAD_FRAME_MS = float(os.getenv("STT_VAD_FRAME_MS", "20"))
+# 이 에너지(dBFS)보다 작은 프레임을 무음으로 본다.
+STT_VAD_THRESHOLD_DB = float(os.getenv("STT_VAD_THRESHOLD_DB", "-45"))
+# 무음을 잘라낸 범위 앞뒤에 남길 길이 (ms)
+STT_VAD_PADDING_MS = float(os.getenv("STT_VAD_PADDING_MS", "200"))
 
 # HTTP 상태 코드
 HTTP_STATUS_CODE = {
     "OK": status.HTTP_200_OK,
     "CREATED": status.HTTP_201_CREATED,
+    "ACCEPTED": status.HTTP_202_ACCEPTED,
     "BAD_REQUEST": status.HTTP_400_BAD_REQUEST,
+    "FORBIDDEN": status.HTTP_403_FORBIDDEN,
+    "NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "PAYLOAD_TOO_LARGE": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    "UNSUPPORTED_MEDIA_TYPE": status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
     "INTERNAL_SERVER_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
+    "SERVICE_UNAVAILABLE": status.HTTP_503_SERVICE_UNAVAILABLE,
+    "GATEWAY_TIMEOUT": status.HTTP_504_GATEWAY_TIMEOUT,
 }
 
 # HTTP 상태 메시지
 HTTP_STATUS_MESSAGE = {
     "OK": "OK",
     "CREATED": "CREATED",
+    "ACCEPTED": "ACCEPTED",
     "BAD_REQUEST": "Bad Request",
+    "FORBIDDEN": "Forbidden",
+    "NOT_FOUND": "Not Found",
+    "PAYLOAD_TOO_LARGE": "Payload Too Large",
+    "UNSUPPORTED_MEDIA_TYPE": "Unsupported Media Type",
     "INTERNAL_SERVER_ERROR": "Internal Server Error",
+    "SERVICE_UNAVAILABLE": "Service Unavailable",
+    "GATEWAY_TIMEOUT": "Gateway Timeout",
 }
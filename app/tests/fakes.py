@@ -0,0 +1,118 @@
+"""
+여러 테스트 모듈이 함께 사용하는 테스트용 객체와 데이터
+"""
+
+import asyncio
+
+import numpy as np
+from google.cloud import speech_v2
+from app.services.model_registry import ModelBundle, ModelRegistry
+
+WAV_HEADER = b"RIFF\x24\x00\x00\x00WAVEfmt "
+
+
+class FakeEncoder:
+    """문장의 길이와 "a"의 개수로 임베딩을 만들고, encode에 넘긴 문장 목록을 기록하는 테스트용 인코더"""
+
+    def __init__(self, *args):
+        self.args = args
+        self.calls = []
+
+    def encode(self, sentences, batch_size=32, **_):
+        self.calls.append(list(sentences))
+
+        return np.array(
+            [[len(sentence), sentence.count("a") + 1.0] for sentence in sentences],
+            dtype=np.float32,
+        )
+
+
+class FakeSpeechClient:
+    """처음 errors의 오류를 차례로 발생시킨 뒤 delay초 후 응답하는 비동기 음성 인식 클라이언트"""
+
+    def __init__(self, errors=(), delay=0.0):
+        self.errors = list(errors)
+        self.delay = delay
+        self.requests = []
+        self.timeouts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def recognize(self, request, retry, timeout):
+        self.requests.append(request)
+        self.timeouts.append(timeout)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.delay)
+
+            if self.errors:
+                raise self.errors.pop(0)
+
+            return speech_v2.RecognizeResponse(
+                results=[
+                    {"alternatives": [{"transcript": "big ben", "confidence": 0.9}]}
+                ]
+            )
+        finally:
+            self.in_flight -= 1
+
+
+class FakeStreamingSpeechClient:
+    """보낸 요청을 모두 읽은 뒤 responses를 차례로 내보내고, error가 있으면 발생시키는 음성 인식 클라이언트"""
+
+    def __init__(self, responses=(), error=None):
+        self.responses = list(responses)
+        self.error = error
+        self.requests = []
+        self.timeout = None
+
+    async def streaming_recognize(self, requests, retry, timeout):
+        self.timeout = timeout
+
+        async def stream():
+            async for request in requests:
+                self.requests.append(request)
+
+            for response in self.responses:
+                yield speech_v2.StreamingRecognizeResponse(response)
+
+            if self.error:
+                raise self.error
+
+        return stream()
+
+
+class FakeBatcher:
+    """닫혔는지와 처리 중인 요청이 있는지만 기록하는 테스트용 배치 대기열"""
+
+    def __init__(self):
+        self.is_idle = True
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def create_bundle(version):
+    """테스트용 묶음을 만드는 함수"""
+
+    return ModelBundle(version, f"model-{version}", None, None, FakeBatcher())
+
+
+def create_registry(versions, available=("v1", "v2", "v3"), max_resident=2, **kwargs):
+    """versions를 미리 등록한 테스트용 레지스트리를 만드는 함수"""
+
+    registry = ModelRegistry(
+        kwargs.get("load_bundle", create_bundle),
+        versions[0] if versions else "v1",
+        max_resident,
+        lambda version: version in available,
+        kwargs.get("retry_seconds", 60.0),
+    )
+
+    for version in versions:
+        registry.add(create_bundle(version))
+
+    return registry
@@ -0,0 +1,199 @@
+"""
+app.services.audio_preprocessor 모듈의 함수와 클래스에 대한 테스트
+"""
+
+import numpy as np
+import pytest
+from app.services import audio_preprocessor
+from app.services.audio_preprocessor import (
+    AudioPreprocessor,
+    encode_wav,
+    find_voiced_range,
+    parse_wav,
+    resample,
+)
+
+
+def create_wav(samples, sample_rate, bits_per_sample=16):
+    """(샘플 수, 채널 수) 배열로 PCM WAV를 만드는 함수"""
+
+    channels = samples.shape[1]
+    dtype = {8: "u1", 16: "<i2"}[bits_per_sample]
+
+    if bits_per_sample == 8:
+        pcm = (samples * 127 + 128).astype(dtype).tobytes()
+    else:
+        pcm = (samples * 32767).astype(dtype).tobytes()
+
+    block_align = channels * bits_per_sample // 8
+    header = b"".join(
+        [
+            b"RIFF",
+            (36 + len(pcm)).to_bytes(4, "little"),
+            b"WAVE",
+            b"fmt ",
+            (16).to_bytes(4, "little"),
+            (1).to_bytes(2, "little"),
+            channels.to_bytes(2, "little"),
+            sample_rate.to_bytes(4, "little"),
+            (sample_rate * block_align).to_bytes(4, "little"),
+            block_align.to_bytes(2, "little"),
+            bits_per_sample.to_bytes(2, "little"),
+            b"data",
+            len(pcm).to_bytes(4, "little"),
+        ]
+    )
+
+    return header + pcm
+
+
+def create_speech_like_clip(sample_rate, channels=2):
+    """1초 무음, 1초 440Hz 소리, 1초 무음으로 이루어진 음성을 만드는 함수"""
+
+    silence = np.zeros(sample_rate, dtype=np.float32)
+    tone = 0.5 * np.sin(2 * np.pi * 440 * np.arange(sample_rate) / sample_rate)
+    mono = np.concatenate([silence, tone.astype(np.float32), silence])
+
+    return np.repeat(mono[:, None], channels, axis=1)
+
+
+def test_parse_wav_views_samples_without_copying():
+    """parse_wav 함수에 대한 테스트: 샘플을 복사하지 않고 읽는 경우"""
+
+    # Arrange
+    data = create_wav(create_speech_like_clip(8000), 8000)
+
+    # Act
+    audio = parse_wav(data)
+
+    # Assert
+    assert audio.sample_rate == 8000
+    assert audio.channels == 2
+    assert audio.samples.shape == (24000, 2)
+    assert not audio.samples.flags.owndata
+    assert audio.duration_seconds == pytest.approx(3.0)
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"RIFF\x24\x00\x00\x00WAVEfmt audio",
+        b"not a wav file",
+        b"",
+        create_wav(np.zeros((10, 2), dtype=np.float32), 0),
+        create_wav(np.zeros((10, 2), dtype=np.float32), 1_000_000_000),
+    ],
+)
+def test_parse_wav_unsupported(data):
+    """parse_wav 함수에 대한 테스트: 읽을 수 없는 형식인 경우"""
+
+    # Act
+    audio = parse_wav(data)
+
+    # Assert
+    assert audio is None
+
+
+def test_resample():
+    """resample 함수에 대한 테스트: 샘플링 레이트를 낮추는 경우"""
+
+    # Arrange
+    samples = np.sin(np.linspace(0, 2 * np.pi, 44100)).astype(np.float32)
+
+    # Act
+    resampled = resample(samples, 44100, 16000)
+
+    # Assert
+    assert len(resampled) == 16000
+    assert resampled.dtype == np.float32
+    assert np.abs(resampled[4000] - 1.0) < 0.01
+
+
+def test_find_voiced_range():
+    """find_voiced_range 함수에 대한 테스트: 앞뒤에 무음이 있는 경우"""
+
+    # Arrange
+    samples = create_speech_like_clip(16000, channels=1)[:, 0]
+
+    # Act
+    voiced_range = find_voiced_range(samples, 16000, 20, -45, 100)
+
+    # Assert
+    assert voiced_range.start == 16000 - 1600
+    assert voiced_range.stop == 32000 + 1600
+
+
+def test_audio_preprocessor_reduces_audio():
+    """AudioPreprocessor 클래스에 대한 테스트: 스테레오 44.1kHz 음성을 줄이는 경우"""
+
+    # Arrange
+    data = create_wav(create_speech_like_clip(44100), 44100)
+    preprocessor = AudioPreprocessor(True, 16000, 20, -45, 100)
+
+    # Act
+    result = preprocessor.process(data)
+
+    # Assert
+    audio = parse_wav(result.content)
+    assert audio.sample_rate == 16000
+    assert audio.channels == 1
+    assert result.original_seconds == pytest.approx(3.0)
+    assert result.processed_seconds == pytest.approx(1.2, abs=0.02)
+    assert result.processed_bytes < result.original_bytes / 10
+    assert preprocessor.snapshot()["processed"] == 1
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "enabled, data",
+    [
+        (True, b"RIFF\x24\x00\x00\x00WAVEfmt audio"),
+        (False, create_wav(create_speech_like_clip(44100), 44100)),
+        (True, encode_wav(np.zeros(16000, dtype=np.float32), 16000)),
+    ],
+)
+def test_audio_preprocessor_keeps_original(enabled, data):
+    """AudioPreprocessor 클래스에 대한 테스트: 읽을 수 없거나, 꺼져 있거나, 줄일 수 없는 경우"""
+
+    preprocessor = AudioPreprocessor(enabled, 16000, 20, -45, 100)
+
+    # Act
+    result = preprocessor.process(data)
+
+    # Assert
+    assert result.content is data
+    assert result.original_bytes == result.processed_bytes
+
+
+def test_audio_preprocessor_keeps_original_when_preprocessing_fails(monkeypatch):
+    """AudioPreprocessor 클래스에 대한 테스트: 전처리 중에 예외가 발생한 경우"""
+
+    # Arrange
+    def resample(samples, source_rate, target_rate):
+        raise ZeroDivisionError("division by zero")
+
+    monkeypatch.setattr(audio_preprocessor, "resample", resample)
+    preprocessor = AudioPreprocessor(True, 16000, 20, -45, 100)
+    data = create_wav(create_speech_like_clip(44100), 44100)
+
+    # Act
+    result = preprocessor.process(data)
+
+    # Assert
+    assert result.content is data
+    assert preprocessor.snapshot()["skipped"] == 1
+
+
+def test_audio_preprocessor_reads_unsigned_8_bit_audio():
+    """AudioPreprocessor 클래스에 대한 테스트: 부호 없는 8비트 PCM 음성인 경우"""
+
+    # Arrange
+    data = create_wav(create_speech_like_clip(16000, channels=1), 16000, 8)
+    preprocessor = AudioPreprocessor(True, 16000, 20, -45, 100)
+
+    # Act
+    result = preprocessor.process(data)
+
+    # Assert
+    assert result.processed_seconds == pytest.approx(1.2, abs=0.02)
@@ -0,0 +1,81 @@
+"""
+app.core.cache 모듈의 클래스에 대한 테스트
+"""
+
+import numpy as np
+from app.core.cache import LRUCache
+
+
+class FakeClock:
+    """테스트에서 시간을 직접 움직일 수 있는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """LRUCache 클래스에 대한 테스트: 항목 수가 한도를 넘는 경우"""
+
+    # Arrange
+    cache = LRUCache(max_entries=2, max_bytes=1_000)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.snapshot()["evictions"] == 1
+
+
+def test_lru_cache_limits_bytes():
+    """LRUCache 클래스에 대한 테스트: 전체 크기가 한도를 넘는 경우"""
+
+    # Arrange
+    cache = LRUCache(max_entries=10, max_bytes=1_000)
+    embedding = np.zeros(100, dtype=np.float32)
+
+    # Act
+    cache.set("a", embedding)
+    cache.set("b", embedding)
+    cache.set("too_big", np.zeros(1_000, dtype=np.float32))
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.get("b") is embedding
+    assert cache.get("too_big") is None
+    assert cache.snapshot()["bytes"] <= 1_000
+
+
+def test_lru_cache_expires_entries():
+    """LRUCache 클래스에 대한 테스트: 유효 시간이 지난 경우"""
+
+    # Arrange
+    clock = FakeClock()
+    cache = LRUCache(max_entries=10, max_bytes=1_000, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+
+    # Act
+    clock.now = 5
+    before_expiry = cache.get("a")
+    clock.now = 10
+    after_expiry = cache.get("a")
+
+    # Assert
+    assert before_expiry == 1
+    assert after_expiry is None
+    assert cache.snapshot() == {
+        "entries": 0,
+        "bytes": 0,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 1,
+    }
@@ -0,0 +1,143 @@
+"""
+app.services.corpus_loader 모듈의 함수에 대한 테스트
+"""
+
+from datetime import datetime
+
+import mongomock
+import numpy as np
+import pandas as pd
+import pytest
+from app.core import mongodb_utils
+from app.services.corpus_loader import encode_corpus, load_corpus_snapshot, scan_corpus
+from app.services.embedding_cache import compute_corpus_hash
+from app.tests.fakes import FakeEncoder
+
+
+@pytest.fixture(name="mongodb_client")
+def fixture_mongodb_client(monkeypatch):
+    """training_data 문서가 담긴 mongomock 클라이언트를 반환하는 fixture"""
+
+    monkeypatch.setattr(mongodb_utils, "MONGODB_DB_NAME", "test")
+    client = mongomock.MongoClient()
+    client["test"]["training_data"].insert_many(
+        [
+            {
+                "description": "a crowded square",
+                "correct_word": "Times Square",
+                "source": "unused field",
+            },
+            {"description": "an old arena", "correct_word": "Colosseum"},
+            {
+                "description": "bright lights at night",
+                "correct_word": "Times Square",
+                "updated_date": datetime(2023, 8, 1),
+            },
+            {
+                "description": "a clock tower",
+                "correct_word": "Big Ben",
+                "updated_date": datetime(2023, 9, 1),
+            },
+            {"description": "a holy wall", "correct_word": "Western Wall"},
+        ]
+    )
+
+    return client
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_scan_corpus(mongodb_client, chunk_size):
+    """scan_corpus 함수에 대한 테스트: 한 번에 읽은 결과와 같은지 확인"""
+
+    # Arrange
+    corpus_df = pd.DataFrame(list(mongodb_client["test"]["training_data"].find()))
+    expected_codes, expected_labels = pd.factorize(corpus_df.correct_word)
+
+    # Act
+    scan = scan_corpus(mongodb_client, chunk_size)
+
+    # Assert
+    assert scan.corpus_hash == compute_corpus_hash(
+        corpus_df.description, corpus_df.correct_word
+    )
+    assert scan.ids.tolist() == [str(document_id) for document_id in corpus_df["_id"]]
+    assert scan.label_codes.dtype == np.int32
+    assert scan.label_codes.tolist() == expected_codes.tolist()
+    assert scan.labels == expected_labels.tolist()
+    assert scan.last_updated_date == datetime(2023, 9, 1)
+
+
+def test_encode_corpus_encodes_chunk_by_chunk(mongodb_client):
+    """encode_corpus 함수에 대한 테스트: 문서를 나누어 인코딩하는 경우"""
+
+    # Arrange
+    encoder = FakeEncoder()
+    scan = scan_corpus(mongodb_client, 2)
+
+    # Act
+    embeddings = encode_corpus(mongodb_client, encoder, scan, 2)
+
+    # Assert
+    assert [len(call) for call in encoder.calls] == [2, 2, 1]
+    assert embeddings.dtype == np.float32
+    expected = FakeEncoder().encode(
+        [
+            document["description"]
+            for document in mongodb_client["test"]["training_data"].find()
+        ]
+    )
+    np.testing.assert_allclose(
+        embeddings, expected / np.linalg.norm(expected, axis=1, keepdims=True)
+    )
+
+
+def test_encode_corpus_skips_documents_added_after_scan(mongodb_client):
+    """encode_corpus 함수에 대한 테스트: 훑은 뒤에 문서가 추가된 경우"""
+
+    # Arrange
+    scan = scan_corpus(mongodb_client, 2)
+    mongodb_client["test"]["training_data"].insert_one(
+        {"description": "a new landmark", "correct_word": "Eiffel Tower"}
+    )
+
+    # Act
+    embeddings = encode_corpus(mongodb_client, FakeEncoder(), scan, 2)
+
+    # Assert
+    assert embeddings.shape == (5, 2)
+
+
+def test_encode_corpus_raises_when_documents_are_deleted(mongodb_client):
+    """encode_corpus 함수에 대한 테스트: 훑은 뒤에 문서가 삭제된 경우"""
+
+    # Arrange
+    scan = scan_corpus(mongodb_client, 2)
+    mongodb_client["test"]["training_data"].delete_one({"correct_word": "Colosseum"})
+
+    # Act, Assert
+    with pytest.raises(RuntimeError):
+        encode_corpus(mongodb_client, FakeEncoder(), scan, 2)
+
+
+def test_load_corpus_snapshot_uses_embedding_cache(mongodb_client, tmp_path):
+    """load_corpus_snapshot 함수에 대한 테스트: 두 번째 로드는 캐시를 사용하는 경우"""
+
+    # Arrange
+    encoder = FakeEncoder()
+
+    # Act
+    first_snapshot = load_corpus_snapshot(
+        mongodb_client, encoder, str(tmp_path), "v1", 2
+    )
+    second_snapshot = load_corpus_snapshot(
+        mongodb_client, encoder, str(tmp_path), "v1", 2
+    )
+
+    # Assert
+    assert len(encoder.calls) == 3
+    assert np.array_equal(
+        first_snapshot.store.embeddings, second_snapshot.store.embeddings
+    )
+    assert second_snapshot.store.labels == first_snapshot.store.labels
+    assert second_snapshot.ids.tolist() == first_snapshot.ids.tolist()
+    assert second_snapshot.last_updated_date == datetime(2023, 9, 1)
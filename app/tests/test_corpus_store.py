@@ -0,0 +1,71 @@
+"""
+app.services.corpus_store 모듈의 클래스에 대한 테스트
+"""
+
+import numpy as np
+import pytest
+from app.services.corpus_store import CorpusStore
+
+
+def create_store(dtype=None):
+    """테스트에 사용할 코퍼스 저장소를 만드는 함수"""
+
+    return CorpusStore(
+        np.arange(12, dtype=np.float32).reshape(3, 4),
+        np.array([0, 1, 0]),
+        ["Times" + " Square", "Colosseum"],
+        dtype,
+    )
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_corpus_store_save_and_load(tmp_path, dtype):
+    """CorpusStore 클래스에 대한 테스트: 저장한 뒤 다시 불러오는 경우"""
+
+    # Arrange
+    store = create_store(dtype)
+
+    # Act
+    store.save(str(tmp_path))
+    loaded_store = CorpusStore.load(str(tmp_path))
+
+    # Assert
+    assert loaded_store.embeddings.dtype == dtype
+    assert loaded_store.label_codes.dtype == np.int32
+    np.testing.assert_array_equal(loaded_store.embeddings, store.embeddings)
+    assert loaded_store.get_labels([1, 0]) == ["Colosseum", "Times Square"]
+
+
+def test_corpus_store_interns_labels():
+    """CorpusStore 클래스에 대한 테스트: 레이블 문자열을 공유하는지 확인"""
+
+    # Act
+    first_store = create_store()
+    second_store = create_store()
+
+    # Assert
+    assert first_store.labels[0] is second_store.labels[0]
+    assert not hasattr(first_store, "__dict__")
+
+
+def test_corpus_store_memory_usage():
+    """CorpusStore 클래스에 대한 테스트: float16 임베딩은 메모리를 절반만 쓰는지 확인"""
+
+    # Act
+    float32_usage = create_store("float32").memory_usage()
+    float16_usage = create_store("float16").memory_usage()
+
+    # Assert
+    assert float32_usage["embeddings"] == 48
+    assert float16_usage["embeddings"] == 24
+    assert float32_usage["total"] == sum(
+        value for key, value in float32_usage.items() if key != "total"
+    )
+
+
+def test_corpus_store_rejects_unsupported_dtype():
+    """CorpusStore 클래스에 대한 테스트: 지원하지 않는 자료형인 경우"""
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        create_store("int8")
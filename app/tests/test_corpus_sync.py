@@ -0,0 +1,125 @@
+"""
+app.services.corpus_sync 모듈의 함수에 대한 테스트
+"""
+
+from datetime import datetime
+
+import mongomock
+import numpy as np
+import pytest
+from bson import ObjectId
+from app.core import mongodb_utils
+from app.services.corpus_loader import load_corpus_snapshot
+from app.services.corpus_store import CorpusStore
+from app.services.corpus_sync import CorpusHolder, CorpusSnapshot, sync_corpus
+from app.tests.fakes import FakeEncoder
+
+
+@pytest.fixture(name="mongodb_client")
+def fixture_mongodb_client(monkeypatch):
+    """mongomock 클라이언트를 반환하는 fixture"""
+
+    monkeypatch.setattr(mongodb_utils, "MONGODB_DB_NAME", "test")
+
+    return mongomock.MongoClient()
+
+
+def create_holder(mongodb_client, encoder):
+    """training_data 컬렉션 전체로 만든 스냅샷을 담은 CorpusHolder를 반환하는 함수"""
+
+    documents = list(mongodb_client["test"]["training_data"].find())
+
+    return CorpusHolder(
+        CorpusSnapshot(
+            np.array([str(document["_id"]) for document in documents]),
+            CorpusStore(
+                encoder.encode([document["description"] for document in documents]),
+                np.arange(len(documents), dtype=np.int32),
+                [document["correct_word"] for document in documents],
+            ),
+        )
+    )
+
+
+def test_sync_corpus(mongodb_client):
+    """sync_corpus 함수에 대한 테스트: 문서가 추가되고 변경된 경우"""
+
+    # Arrange
+    collection = mongodb_client["test"]["training_data"]
+    updated_id = ObjectId()
+    collection.insert_many(
+        [
+            {"_id": updated_id, "description": "old", "correct_word": "Colosseum"},
+            {"description": "a big clock", "correct_word": "Big Ben"},
+        ]
+    )
+    encoder = FakeEncoder()
+    holder = create_holder(mongodb_client, encoder)
+    holder.get().last_updated_date = datetime(2023, 1, 1)
+
+    collection.insert_one({"description": "a crowd", "correct_word": "Times Square"})
+    collection.update_one(
+        {"_id": updated_id},
+        {"$set": {"description": "an arena", "updated_date": datetime(2023, 1, 2)}},
+    )
+    encoder.calls.clear()
+
+    # Act
+    result = sync_corpus(holder, mongodb_client, encoder, chunk_size=1)
+
+    # Assert
+    snapshot = holder.get()
+    assert result == {"added": 1, "updated": 1, "corpus_size": 3}
+    assert sorted(sum(encoder.calls, [])) == ["a crowd", "an arena"]
+    assert snapshot.store.labels == ("Colosseum", "Big Ben", "Times Square")
+    assert snapshot.store.label_codes.tolist() == [0, 1, 2]
+    np.testing.assert_allclose(
+        snapshot.store.embeddings[0], np.array([8.0, 4.0]) / np.sqrt(80)
+    )
+    assert snapshot.last_updated_date == datetime(2023, 1, 2)
+
+
+def test_sync_corpus_from_empty_corpus(mongodb_client, tmp_path):
+    """sync_corpus 함수에 대한 테스트: 빈 컬렉션으로 시작한 코퍼스에 문서가 추가된 경우"""
+
+    # Arrange
+    collection = mongodb_client["test"]["training_data"]
+    encoder = FakeEncoder()
+    holder = CorpusHolder(
+        load_corpus_snapshot(mongodb_client, encoder, str(tmp_path), "v1")
+    )
+    collection.insert_many(
+        [
+            {"description": "a big clock", "correct_word": "Big Ben"},
+            {"description": "a crowd", "correct_word": "Times Square"},
+        ]
+    )
+
+    # Act
+    result = sync_corpus(holder, mongodb_client, encoder)
+
+    # Assert
+    snapshot = holder.get()
+    assert result == {"added": 2, "updated": 0, "corpus_size": 2}
+    assert snapshot.store.embeddings.shape == (2, 2)
+    assert snapshot.store.labels == ("Big Ben", "Times Square")
+    assert snapshot.last_id == collection.find_one(sort=[("_id", -1)])["_id"]
+
+
+def test_sync_corpus_no_changes(mongodb_client):
+    """sync_corpus 함수에 대한 테스트: 변경 사항이 없는 경우"""
+
+    # Arrange
+    mongodb_client["test"]["training_data"].insert_one(
+        {"description": "a big clock", "correct_word": "Big Ben"}
+    )
+    encoder = FakeEncoder()
+    holder = create_holder(mongodb_client, encoder)
+    snapshot = holder.get()
+
+    # Act
+    result = sync_corpus(holder, mongodb_client, encoder)
+
+    # Assert
+    assert result == {"added": 0, "updated": 0, "corpus_size": 1}
+    assert holder.get() is snapshot
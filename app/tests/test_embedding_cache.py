@@ -0,0 +1,81 @@
+"""
+app.services.embedding_cache 모듈의 함수에 대한 테스트
+"""
+
+import numpy as np
+from app.services.corpus_store import CorpusStore
+from app.services.embedding_cache import (
+    compute_corpus_hash,
+    load_corpus_embeddings,
+    save_corpus_embeddings,
+)
+
+
+def create_corpus(dtype="float32"):
+    """테스트에 사용할 코퍼스 저장소를 만드는 함수"""
+
+    embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)
+    label_codes = np.array([0, 1, 0], dtype=np.int32)
+
+    return CorpusStore(embeddings, label_codes, ["Times Square", "Colosseum"], dtype)
+
+
+def test_compute_corpus_hash():
+    """compute_corpus_hash 함수에 대한 테스트"""
+
+    # Arrange
+    descriptions = ["a crowded place", "an old arena"]
+    labels = ["Times Square", "Colosseum"]
+
+    # Act
+    corpus_hash = compute_corpus_hash(descriptions, labels)
+
+    # Assert
+    assert corpus_hash == compute_corpus_hash(descriptions, labels)
+    assert corpus_hash != compute_corpus_hash(descriptions[::-1], labels[::-1])
+    assert corpus_hash != compute_corpus_hash(descriptions, labels[::-1])
+
+
+def test_save_and_load_corpus_embeddings(tmp_path):
+    """save_corpus_embeddings, load_corpus_embeddings 함수에 대한 테스트"""
+
+    # Arrange
+    store = create_corpus()
+
+    # Act
+    save_corpus_embeddings(str(tmp_path), "v1", "abc", store)
+    cached_store = load_corpus_embeddings(str(tmp_path), "v1", "abc")
+
+    # Assert
+    assert isinstance(cached_store.embeddings, np.memmap)
+    assert not cached_store.embeddings.flags.writeable
+    np.testing.assert_array_equal(cached_store.embeddings, store.embeddings)
+    np.testing.assert_array_equal(cached_store.label_codes, store.label_codes)
+    assert cached_store.labels == store.labels
+
+
+def test_load_corpus_embeddings_mismatch(tmp_path):
+    """load_corpus_embeddings 함수에 대한 테스트: 모델 버전이나 코퍼스 해시가 다른 경우"""
+
+    # Arrange
+    save_corpus_embeddings(str(tmp_path), "v1", "abc", create_corpus())
+
+    # Act, Assert
+    assert load_corpus_embeddings(str(tmp_path), "v2", "abc") is None
+    assert load_corpus_embeddings(str(tmp_path), "v1", "def") is None
+    assert load_corpus_embeddings(str(tmp_path), "v1", "abc", "float16") is None
+
+
+def test_save_and_load_float16_corpus_embeddings(tmp_path):
+    """save_corpus_embeddings, load_corpus_embeddings 함수에 대한 테스트: float16 임베딩"""
+
+    # Arrange
+    store = create_corpus("float16")
+
+    # Act
+    save_corpus_embeddings(str(tmp_path), "v1", "abc", store)
+    cached_store = load_corpus_embeddings(str(tmp_path), "v1", "abc", "float16")
+
+    # Assert
+    assert cached_store.embeddings.dtype == np.float16
+    np.testing.assert_array_equal(cached_store.embeddings, store.embeddings)
@@ -0,0 +1,250 @@
+"""
+app.services.feedback_writer 모듈의 클래스에 대한 테스트
+"""
+
+import asyncio
+
+import mongomock
+import pytest
+from bson import ObjectId, json_util
+from pymongo.errors import AutoReconnect
+from app.core import mongodb_utils
+from app.core.exceptions import CustomException
+from app.services.feedback_writer import FeedbackWriter
+from app.settings.constants import HTTP_STATUS_CODE
+
+
+class FlakyClientGetter:
+    """처음 failures번은 연결 오류를 발생시키고, 그 뒤로는 mongomock 클라이언트를 반환하는 함수"""
+
+    def __init__(self, client, failures=0):
+        self.client = client
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+
+        if self.calls <= self.failures:
+            raise AutoReconnect("connection reset")
+
+        return self.client
+
+
+@pytest.fixture(name="mongodb_client")
+def fixture_mongodb_client(monkeypatch):
+    """mongomock 클라이언트를 반환하는 fixture"""
+
+    monkeypatch.setattr(mongodb_utils, "MONGODB_DB_NAME", "test")
+
+    return mongomock.MongoClient()
+
+
+def create_writer(get_client, spill_path, **kwargs):
+    """테스트용 설정으로 FeedbackWriter를 만드는 함수"""
+
+    options = {
+        "max_queue_size": 100,
+        "flush_size": 10,
+        "flush_interval_ms": 10,
+        "max_retries": 3,
+        "retry_backoff_ms": 1,
+        "shutdown_timeout_seconds": 1,
+        **kwargs,
+    }
+
+    return FeedbackWriter(
+        get_client, "feedback_data", spill_path=str(spill_path), **options
+    )
+
+
+async def wait_until(condition, timeout=1.0):
+    """condition이 참이 될 때까지 기다리는 함수"""
+
+    deadline = asyncio.get_running_loop().time() + timeout
+
+    while not condition() and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.005)
+
+
+def test_feedback_writer_flushes_documents_in_one_bulk_insert(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 대기열의 문서를 한 번에 저장하는 경우"""
+
+    # Arrange
+    writer = create_writer(FlakyClientGetter(mongodb_client), tmp_path / "spill.jsonl")
+
+    async def run():
+        ids = [writer.submit({"description": f"feedback{i}"}) for i in range(5)]
+        await wait_until(lambda: writer.inserted == 5)
+        await writer.close()
+        return ids
+
+    # Act
+    ids = asyncio.run(run())
+
+    # Assert
+    documents = list(mongodb_client["test"]["feedback_data"].find())
+    assert sorted(str(document["_id"]) for document in documents) == sorted(ids)
+    assert writer.snapshot()["flushes"] == 1
+    assert not (tmp_path / "spill.jsonl").exists()
+
+
+def test_feedback_writer_retries_after_connection_error(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 연결 오류 후 재시도로 저장하는 경우"""
+
+    # Arrange
+    writer = create_writer(
+        FlakyClientGetter(mongodb_client, failures=2), tmp_path / "spill.jsonl"
+    )
+
+    async def run():
+        writer.submit({"description": "feedback"})
+        await wait_until(lambda: writer.inserted == 1)
+        await writer.close()
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert mongodb_client["test"]["feedback_data"].count_documents({}) == 1
+    assert writer.retries == 2
+    assert writer.spilled == 0
+
+
+def test_feedback_writer_treats_duplicate_ids_as_inserted(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 이미 저장된 문서를 다시 저장하는 경우"""
+
+    # Arrange
+    document_id = ObjectId()
+    mongodb_client["test"]["feedback_data"].insert_one({"_id": document_id})
+    writer = create_writer(FlakyClientGetter(mongodb_client), tmp_path / "spill.jsonl")
+
+    async def run():
+        writer.submit({"_id": document_id, "description": "feedback"})
+        writer.submit({"description": "feedback"})
+        await wait_until(lambda: writer.inserted + writer.duplicates == 2)
+        await writer.close()
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert mongodb_client["test"]["feedback_data"].count_documents({}) == 2
+    assert writer.duplicates == 1
+    assert writer.spilled == 0
+
+
+def test_feedback_writer_spills_unsaved_documents_on_close(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 종료 시 저장하지 못한 문서를 파일에 기록하는 경우"""
+
+    # Arrange
+    spill_path = tmp_path / "spill.jsonl"
+    writer = create_writer(
+        FlakyClientGetter(mongodb_client, failures=1000),
+        spill_path,
+        flush_interval_ms=1000,
+        max_retries=0,
+    )
+
+    async def run():
+        ids = [writer.submit({"description": f"feedback{i}"}) for i in range(3)]
+        await asyncio.sleep(0)
+        await writer.close()
+        return ids
+
+    # Act
+    ids = asyncio.run(run())
+
+    # Assert
+    spilled_documents = [
+        json_util.loads(line) for line in spill_path.read_text().splitlines()
+    ]
+    assert sorted(str(document["_id"]) for document in spilled_documents) == sorted(ids)
+    assert writer.spilled == 3
+
+
+def test_feedback_writer_rejects_when_queue_is_full(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 대기열이 가득 찬 경우"""
+
+    # Arrange
+    writer = create_writer(
+        FlakyClientGetter(mongodb_client), tmp_path / "spill.jsonl", max_queue_size=2
+    )
+
+    async def run():
+        for i in range(2):
+            writer.submit({"description": f"feedback{i}"})
+
+        try:
+            writer.submit({"description": "feedback2"})
+        finally:
+            await writer.close()
+
+    # Act
+    with pytest.raises(CustomException) as exc_info:
+        asyncio.run(run())
+
+    # Assert
+    assert exc_info.value.status_code == HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"]
+    assert exc_info.value.attribute == "feedback"
+    assert writer.rejected == 1
+
+
+def test_feedback_writer_keeps_documents_when_restarted(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 백그라운드 작업이 멈춘 뒤 새 이벤트 루프에서 다시 시작하는 경우"""
+
+    # Arrange
+    writer = create_writer(
+        FlakyClientGetter(mongodb_client),
+        tmp_path / "spill.jsonl",
+        flush_interval_ms=1000,
+    )
+
+    async def submit_and_stop():
+        for i in range(2):
+            writer.submit({"description": f"feedback{i}"})
+
+    async def run():
+        writer.submit({"description": "feedback2"})
+        await wait_until(lambda: writer.inserted == 3)
+        await writer.close()
+
+    # Act
+    asyncio.run(submit_and_stop())
+    asyncio.run(run())
+
+    # Assert
+    assert mongodb_client["test"]["feedback_data"].count_documents({}) == 3
+    assert writer.spilled == 0
+
+
+def test_feedback_writer_survives_unexpected_error(mongodb_client, tmp_path):
+    """FeedbackWriter 클래스에 대한 테스트: 저장 중에 예상하지 못한 예외가 발생한 경우"""
+
+    # Arrange
+    spill_path = tmp_path / "spill.jsonl"
+    get_client = FlakyClientGetter(mongodb_client)
+
+    def get_client_or_fail():
+        if get_client.calls == 0:
+            get_client.calls += 1
+            raise TypeError("The client is not configured.")
+
+        return get_client()
+
+    writer = create_writer(get_client_or_fail, spill_path)
+
+    async def run():
+        writer.submit({"description": "feedback0"})
+        await wait_until(lambda: writer.spilled == 1)
+        writer.submit({"description": "feedback1"})
+        await wait_until(lambda: writer.inserted == 1)
+        await writer.close()
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert writer.spilled == 1
+    assert writer.inserted == 1
+    assert len(spill_path.read_text().splitlines()) == 1
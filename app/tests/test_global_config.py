@@ -0,0 +1,110 @@
+"""
+app.global_config 모듈의 함수에 대한 테스트
+"""
+
+import pytest
+from app import global_config
+from app.core.exceptions import CustomException
+from app.services import corpus_loader
+from app.tests.fakes import FakeEncoder
+
+
+@pytest.fixture(autouse=True)
+def fixture_reset_global_config(monkeypatch):
+    """전역 상태를 불러오기 전으로 되돌리는 fixture"""
+
+    monkeypatch.setattr(
+        global_config, "startup_state", global_config.STARTUP_STATE_PENDING
+    )
+    monkeypatch.setattr(global_config, "startup_error", None)
+    monkeypatch.setattr(global_config, "startup_seconds", None)
+    monkeypatch.setattr(
+        global_config, "model_registry", global_config.create_model_registry()
+    )
+    monkeypatch.setattr(global_config, "create_model_instance", FakeEncoder)
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "getter, attribute",
+    [
+        (global_config.get_model_instance, "model"),
+        (global_config.get_corpus_holder, "corpus"),
+        (global_config.ensure_ready, "model"),
+    ],
+)
+def test_getters_raise_service_unavailable_before_loading(getter, attribute):
+    """get_model_instance, get_corpus_holder, ensure_ready 함수에 대한 테스트: 불러오기 전인 경우"""
+
+    # Act
+    with pytest.raises(CustomException) as exc_info:
+        getter()
+
+    # Assert
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.attribute == attribute
+    assert not global_config.is_ready()
+
+
+def test_load_resources(monkeypatch):
+    """load_resources 함수에 대한 테스트: 모델과 코퍼스를 모두 불러온 경우"""
+
+    # Arrange
+    states = []
+
+    def load_corpus_snapshot(client, model, cache_dir, model_version):
+        states.append(global_config.startup_state)
+        return object()
+
+    monkeypatch.setattr(corpus_loader, "load_corpus_snapshot", load_corpus_snapshot)
+
+    # Act
+    loaded = global_config.load_resources(object())
+
+    # Assert
+    assert loaded
+    assert states == [global_config.STARTUP_STATE_LOADING_CORPUS]
+    assert global_config.is_ready()
+    assert isinstance(global_config.get_model_instance(), FakeEncoder)
+    assert global_config.model_registry.snapshot()["resident_versions"] == [
+        global_config.MODEL_VERSION_DEFAULT
+    ]
+    assert global_config.get_startup_status()["startup_seconds"] is not None
+    global_config.ensure_ready()
+
+
+def test_load_resources_failure(monkeypatch):
+    """load_resources 함수에 대한 테스트: 코퍼스를 불러오지 못한 경우"""
+
+    # Arrange
+    def load_corpus_snapshot(*args):
+        raise RuntimeError("MongoDB is unreachable")
+
+    monkeypatch.setattr(corpus_loader, "load_corpus_snapshot", load_corpus_snapshot)
+
+    # Act
+    loaded = global_config.load_resources(object())
+
+    # Assert
+    assert not loaded
+    assert global_config.get_startup_status() == {
+        "state": global_config.STARTUP_STATE_FAILED,
+        "error": "RuntimeError",
+        "startup_seconds": None,
+    }
+
+    with pytest.raises(CustomException) as exc_info:
+        global_config.get_corpus_holder()
+
+    assert exc_info.value.status_code == 503
+    assert "failed" in exc_info.value.reason
+
+
+def test_check_inference_pool_kind():
+    """check_inference_pool_kind 함수에 대한 테스트: 작업 풀 종류를 확인하는 경우"""
+
+    # Act, Assert
+    global_config.check_inference_pool_kind("thread")
+
+    with pytest.raises(ValueError):
+        global_config.check_inference_pool_kind("process")
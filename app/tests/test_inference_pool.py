@@ -0,0 +1,61 @@
+"""
+app.services.inference_pool 모듈의 클래스에 대한 테스트
+"""
+
+import asyncio
+import threading
+
+import pytest
+from app.core.exceptions import CustomException
+from app.services.inference_pool import InferencePool
+from app.settings.constants import HTTP_STATUS_CODE
+
+
+def test_inference_pool_run():
+    """InferencePool 클래스에 대한 테스트: 작업 결과를 반환하는 경우"""
+
+    # Arrange
+    pool = InferencePool(max_workers=2, max_queue_size=2)
+
+    # Act
+    result = asyncio.run(pool.run(sum, [1, 2, 3]))
+    pool.shutdown()
+
+    # Assert
+    assert result == 6
+    assert pool.pending == 0
+
+
+def test_inference_pool_rejects_when_full():
+    """InferencePool 클래스에 대한 테스트: 실행 중인 작업과 대기열이 가득 찬 경우"""
+
+    # Arrange
+    pool = InferencePool(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+
+    async def run():
+        blocked = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        try:
+            await pool.run(release.wait)
+        finally:
+            release.set()
+            await asyncio.gather(*blocked)
+
+    # Act
+    with pytest.raises(CustomException) as exc_info:
+        asyncio.run(run())
+    pool.shutdown()
+
+    # Assert
+    assert exc_info.value.status_code == HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"]
+    assert pool.rejected == 1
+
+
+def test_inference_pool_unsupported_kind():
+    """InferencePool 클래스에 대한 테스트: 지원하지 않는 풀 종류인 경우"""
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        InferencePool(max_workers=1, max_queue_size=1, kind="unknown")
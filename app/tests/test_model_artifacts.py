@@ -0,0 +1,234 @@
+"""
+app.services.model_artifacts 모듈의 함수와 클래스에 대한 테스트
+"""
+
+import json
+import os
+import zipfile
+
+import pytest
+from app.services.model_artifacts import (
+    FileSystemBackend,
+    ModelArtifactManager,
+    create_manifest,
+    get_model_revision,
+    split_ranges,
+)
+
+MODEL_FILES = {
+    "modules.json": b'[{"idx": 0}]',
+    "0_Transformer/pytorch_model.bin": os.urandom(5000),
+}
+
+
+class FlakyBackend(FileSystemBackend):
+    """범위 요청이 처음 failures번 실패하는 테스트용 저장소"""
+
+    def __init__(self, root, failures):
+        super().__init__(root)
+        self.failures = failures
+
+    def read_range(self, key, start, end):
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("The connection was reset.")
+
+        return super().read_range(key, start, end)
+
+
+def publish_model(store_dir, version="v1", files=None):
+    """모델 파일을 압축하고 매니페스트와 함께 저장소 디렉터리에 올리는 함수"""
+
+    version_dir = store_dir / "models" / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+    archive_path = version_dir / "model.zip"
+
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for name, content in (files or MODEL_FILES).items():
+            archive.writestr(name, content)
+
+    manifest = create_manifest(str(archive_path))
+    (version_dir / "manifest.json").write_text(json.dumps(manifest))
+
+    return manifest
+
+
+def create_manager(tmp_path, backend=None, **options):
+    """테스트용 저장소와 작은 범위 크기로 ModelArtifactManager를 만드는 함수"""
+
+    return ModelArtifactManager(
+        backend or FileSystemBackend(str(tmp_path / "store")),
+        root=str(tmp_path / "model"),
+        prefix="models",
+        part_bytes=1024,
+        concurrency=4,
+        **options,
+    )
+
+
+def test_split_ranges():
+    """split_ranges 함수에 대한 테스트"""
+
+    # Act, Assert
+    assert split_ranges(2500, 1024) == [(0, 1024), (1024, 2048), (2048, 2500)]
+    assert split_ranges(0, 1024) == []
+
+
+def test_model_artifact_manager_downloads_and_extracts(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 로컬에 복사본이 없는 경우"""
+
+    # Arrange
+    manifest = publish_model(tmp_path / "store")
+    manager = create_manager(tmp_path)
+
+    # Act
+    model_dir = manager.ensure("v1")
+
+    # Assert
+    for name, content in MODEL_FILES.items():
+        with open(os.path.join(model_dir, name), "rb") as model_file:
+            assert model_file.read() == content
+
+    assert manager.downloads == 1
+    assert manager.downloaded_bytes == manifest["size"]
+    assert manager.backend.requests == 1 + len(split_ranges(manifest["size"], 1024))
+    assert not [name for name in os.listdir(model_dir) if name.endswith(".part")]
+
+
+def test_model_artifact_manager_skips_verified_copy(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 확인된 로컬 복사본이 있는 경우"""
+
+    # Arrange
+    publish_model(tmp_path / "store")
+    create_manager(tmp_path).ensure("v1")
+    manager = create_manager(tmp_path)
+
+    # Act
+    manager.ensure("v1")
+
+    # Assert
+    assert manager.cache_hits == 1
+    assert manager.downloads == 0
+    assert manager.backend.requests == 1
+
+
+def test_model_artifact_manager_reuses_verified_archive(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 압축을 푼 파일이 손상되었지만 압축 파일은 온전한 경우"""
+
+    # Arrange
+    publish_model(tmp_path / "store")
+    model_dir = create_manager(tmp_path).ensure("v1")
+    os.remove(os.path.join(model_dir, "modules.json"))
+    manager = create_manager(tmp_path)
+
+    # Act
+    manager.ensure("v1")
+
+    # Assert
+    assert manager.downloads == 0
+    assert os.path.exists(os.path.join(model_dir, "modules.json"))
+
+
+def test_model_artifact_manager_downloads_new_version_of_archive(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 저장소의 압축 파일이 바뀐 경우"""
+
+    # Arrange
+    publish_model(tmp_path / "store")
+    previous_revision = get_model_revision(create_manager(tmp_path).ensure("v1"))
+    manifest = publish_model(tmp_path / "store", files={"modules.json": b"[]"})
+    manager = create_manager(tmp_path)
+
+    # Act
+    model_dir = manager.ensure("v1")
+
+    # Assert
+    assert manager.downloads == 1
+    assert open(os.path.join(model_dir, "modules.json"), "rb").read() == b"[]"
+    assert get_model_revision(model_dir) == manifest["sha256"][:12]
+    assert get_model_revision(model_dir) != previous_revision
+
+
+def test_model_artifact_manager_rejects_checksum_mismatch(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 받은 압축 파일이 매니페스트와 다른 경우"""
+
+    # Arrange
+    manifest = publish_model(tmp_path / "store")
+    manifest["sha256"] = "0" * 64
+    (tmp_path / "store" / "models" / "v1" / "manifest.json").write_text(
+        json.dumps(manifest)
+    )
+    manager = create_manager(tmp_path)
+
+    # Act
+    with pytest.raises(ValueError):
+        manager.ensure("v1")
+
+    # Assert
+    assert os.listdir(tmp_path / "model" / "v1") == []
+
+
+def test_model_artifact_manager_retries_failed_ranges(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 범위 요청이 일시적으로 실패한 경우"""
+
+    # Arrange
+    publish_model(tmp_path / "store")
+    backend = FlakyBackend(str(tmp_path / "store"), failures=2)
+    manager = create_manager(tmp_path, backend, max_retries=2)
+
+    # Act
+    model_dir = manager.ensure("v1")
+
+    # Assert
+    assert manager.downloads == 1
+    assert os.path.exists(os.path.join(model_dir, "modules.json"))
+
+
+def test_model_artifact_manager_uses_local_copy_when_store_is_unreachable(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 저장소에 연결하지 못한 경우"""
+
+    # Arrange
+    publish_model(tmp_path / "store")
+    create_manager(tmp_path).ensure("v1")
+    manager = create_manager(tmp_path, FileSystemBackend(str(tmp_path / "missing")))
+
+    # Act
+    model_dir = manager.ensure("v1")
+
+    # Assert
+    assert os.path.exists(os.path.join(model_dir, "modules.json"))
+
+    with pytest.raises(OSError):
+        manager.ensure("v2")
+
+
+def test_model_artifact_manager_exists(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 저장소에 버전이 있는지 확인하는 경우"""
+
+    # Arrange
+    publish_model(tmp_path / "store", version="v2")
+    manager = create_manager(tmp_path)
+
+    # Act, Assert
+    assert manager.exists("v2")
+    assert not manager.exists("v3")
+    assert manager.remote_versions == {"v2"}
+    assert not ModelArtifactManager(None).exists("v2")
+
+
+def test_model_artifact_manager_uses_baked_model_without_manifest(tmp_path):
+    """ModelArtifactManager 클래스에 대한 테스트: 저장소에 매니페스트가 없고 미리 넣어 둔 모델 디렉터리가 있는 경우"""
+
+    # Arrange
+    baked_dir = tmp_path / "model" / "v1"
+    baked_dir.mkdir(parents=True)
+    (baked_dir / "modules.json").write_bytes(MODEL_FILES["modules.json"])
+    (tmp_path / "store").mkdir()
+    manager = create_manager(tmp_path)
+
+    # Act
+    model_dir = manager.ensure("v1")
+
+    # Assert
+    assert model_dir == str(baked_dir)
+    assert manager.downloads == 0
+    assert os.listdir(baked_dir) == ["modules.json"]
@@ -3,9 +3,19 @@ app.services.model_inference 모듈의 함수에 대한 테스트
 """
 
 import pytest
+from app import global_config
+from app.core.mongodb_utils import get_mongodb_client
 from app.services.model_inference import get_predictions
 
 
+@pytest.fixture(autouse=True, scope="module")
+def fixture_load_resources():
+    """모델과 코퍼스를 불러오는 fixture"""
+
+    if not global_config.is_ready():
+        assert global_config.load_resources(get_mongodb_client())
+
+
 # Arrange
 @pytest.mark.parametrize(
     "query, expected",
@@ -0,0 +1,268 @@
+"""
+app.services.model_registry 모듈의 클래스에 대한 테스트
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from app.core.exceptions import CustomException
+from app.services.corpus_store import CorpusStore
+from app.services.corpus_sync import CorpusHolder, CorpusSnapshot
+from app.services.model_inference import create_model_bundle
+from app.services.model_registry import ModelRegistry
+from app.tests.fakes import FakeEncoder, create_bundle, create_registry
+
+
+def test_model_registry_get():
+    """ModelRegistry 클래스에 대한 테스트: 메모리에 있는 버전을 요청한 경우"""
+
+    # Arrange
+    registry = create_registry(["v1", "v2"])
+
+    # Act
+    default_bundle = registry.get()
+    bundle = registry.get("v2")
+
+    # Assert
+    assert default_bundle.version == "v1"
+    assert bundle.model == "model-v2"
+    assert registry.snapshot()["resident_versions"] == ["v2", "v1"]
+
+
+# Arrange
+@pytest.mark.parametrize("version", ["v9", "../v1", ".hidden"])
+def test_model_registry_get_unknown_version(version):
+    """ModelRegistry 클래스에 대한 테스트: 없거나 이름이 올바르지 않은 버전을 요청한 경우"""
+
+    registry = create_registry(["v1"])
+
+    # Act
+    with pytest.raises(CustomException) as exc_info:
+        registry.get(version)
+
+    # Assert
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.attribute == "model_version"
+
+
+def test_model_registry_loads_missing_version_in_background():
+    """ModelRegistry 클래스에 대한 테스트: 메모리에 없는 버전을 요청한 경우"""
+
+    # Arrange
+    registry = create_registry(["v1"])
+
+    async def run():
+        with pytest.raises(CustomException) as exc_info:
+            registry.get("v2")
+
+        loading_versions = registry.snapshot()["loading_versions"]
+        await asyncio.sleep(0.1)
+
+        return exc_info.value, loading_versions
+
+    # Act
+    exc, loading_versions = asyncio.run(run())
+
+    # Assert
+    assert exc.status_code == 503
+    assert loading_versions == ["v2"]
+    assert registry.get("v2").version == "v2"
+    assert registry.snapshot()["loading_versions"] == []
+
+
+def test_model_registry_loads_each_version_once():
+    """ModelRegistry 클래스에 대한 테스트: 같은 버전을 동시에 여러 번 불러오는 경우"""
+
+    # Arrange
+    loaded_versions = []
+    release = threading.Event()
+
+    def load_bundle(version):
+        loaded_versions.append(version)
+        release.wait(1)
+        return create_bundle(version)
+
+    registry = create_registry(["v1"], load_bundle=load_bundle)
+
+    async def run():
+        loads = [asyncio.ensure_future(registry.load("v2")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*loads)
+
+    # Act
+    bundles = asyncio.run(run())
+
+    # Assert
+    assert loaded_versions == ["v2"]
+    assert bundles[0] is bundles[1] is bundles[2]
+
+
+def test_model_registry_evicts_least_recently_used_version():
+    """ModelRegistry 클래스에 대한 테스트: 메모리에 올려 둘 수 있는 버전 수를 넘은 경우"""
+
+    # Arrange
+    registry = create_registry(["v1", "v2"])
+    evicted_bundle = registry.find("v2")
+
+    async def run():
+        registry.find("v2")
+        registry.add(create_bundle("v3"))
+        await asyncio.sleep(0.01)
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert registry.snapshot()["resident_versions"] == ["v3", "v1"]
+    assert registry.snapshot()["evictions"] == 1
+    assert evicted_bundle.query_batcher.closed
+
+
+def test_model_registry_closes_version_evicted_from_thread():
+    """ModelRegistry 클래스에 대한 테스트: 스레드에서 등록한 묶음 때문에 버전을 내린 경우"""
+
+    # Arrange
+    registry = create_registry(["v1", "v2"])
+    evicted_bundle = registry.find("v2")
+
+    async def run():
+        registry.bind_loop(asyncio.get_running_loop())
+        await asyncio.to_thread(registry.add, create_bundle("v3"))
+        await asyncio.sleep(0.01)
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert registry.snapshot()["resident_versions"] == ["v3", "v1"]
+    assert evicted_bundle.query_batcher.closed
+
+
+def test_model_registry_keeps_at_least_two_versions():
+    """ModelRegistry 클래스에 대한 테스트: max_resident를 1로 지정한 경우"""
+
+    # Arrange
+    registry = create_registry(["v1"], max_resident=1)
+
+    # Act
+    bundle = asyncio.run(registry.activate("v2"))
+
+    # Assert
+    assert registry.max_resident == 2
+    assert registry.get() is bundle
+    assert registry.snapshot()["resident_versions"] == ["v2", "v1"]
+
+
+def test_model_registry_activate():
+    """ModelRegistry 클래스에 대한 테스트: 기본 버전을 교체하는 경우"""
+
+    # Arrange
+    registry = create_registry(["v1"])
+    previous_bundle = registry.get()
+
+    # Act
+    bundle = asyncio.run(registry.activate("v2"))
+
+    # Assert
+    assert registry.default_version == "v2"
+    assert registry.get() is bundle
+    assert registry.get("v1") is previous_bundle
+
+
+def test_model_registry_records_load_failure():
+    """ModelRegistry 클래스에 대한 테스트: 버전을 불러오지 못한 경우"""
+
+    # Arrange
+    def load_bundle(version):
+        raise OSError("The model files are corrupted.")
+
+    registry = create_registry(["v1"], load_bundle=load_bundle)
+
+    # Act
+    with pytest.raises(OSError):
+        asyncio.run(registry.activate("v2"))
+
+    # Assert
+    assert registry.default_version == "v1"
+    assert registry.snapshot()["failed_versions"] == {"v2": "OSError"}
+
+
+# Arrange
+@pytest.mark.parametrize("retry_seconds, expected", [(60.0, 1), (0.0, 2)])
+def test_model_registry_backs_off_after_load_failure(retry_seconds, expected):
+    """ModelRegistry 클래스에 대한 테스트: 불러오기에 실패한 버전을 다시 요청한 경우"""
+
+    loaded_versions = []
+
+    def load_bundle(version):
+        loaded_versions.append(version)
+        raise OSError("The model files are corrupted.")
+
+    registry = create_registry(
+        ["v1"], load_bundle=load_bundle, retry_seconds=retry_seconds
+    )
+
+    async def run():
+        statuses = []
+
+        for _ in range(2):
+            with pytest.raises(CustomException) as exc_info:
+                registry.get("v2")
+
+            statuses.append(exc_info.value.status_code)
+            await asyncio.sleep(0.05)
+
+        return statuses
+
+    # Act
+    statuses = asyncio.run(run())
+
+    # Assert
+    assert statuses == [503, 503]
+    assert loaded_versions == ["v2"] * expected
+
+
+def test_model_registry_drains_evicted_version():
+    """ModelRegistry 클래스에 대한 테스트: 대기 중인 요청이 있는 버전을 내리는 경우"""
+
+    # Arrange
+    def load_bundle(version):
+        store = CorpusStore(
+            np.array([[1.0, 1.0], [9.0, 1.0]], dtype=np.float32),
+            np.arange(2, dtype=np.int32),
+            ["Big Ben", "Times Square"],
+        )
+        holder = CorpusHolder(CorpusSnapshot(np.array([], dtype=str), store))
+
+        return create_model_bundle(version, FakeEncoder(), holder)
+
+    registry = ModelRegistry(load_bundle, "v1", 1, lambda version: True)
+    registry.add(load_bundle("v1"))
+    registry.add(load_bundle("v2"))
+
+    async def run():
+        bundle = registry.get("v2")
+        requests = [
+            asyncio.ensure_future(bundle.query_batcher.predict(query, 1))
+            for query in ("a", "a crowd in a square")
+        ]
+        await asyncio.sleep(0)
+        registry.add(load_bundle("v3"))
+        predictions = await asyncio.gather(*requests)
+        await asyncio.sleep(0.1)
+
+        return bundle, predictions
+
+    # Act
+    bundle, predictions = asyncio.run(run())
+
+    # Assert
+    assert predictions == [
+        [{"text": "Big Ben", "rank": 1}],
+        [{"text": "Times Square", "rank": 1}],
+    ]
+    assert registry.find("v2") is None
+    assert bundle.query_batcher.is_idle
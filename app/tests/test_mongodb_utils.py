@@ -0,0 +1,57 @@
+"""
+app.core.mongodb_utils 모듈의 함수에 대한 테스트
+"""
+
+import pytest
+from app.core import mongodb_utils
+from app.core.mongodb_utils import close_mongodb_client, get_mongodb_client
+
+
+class FakeMongoClient:
+    """생성 인자와 close 호출 여부를 기록하는 테스트용 클라이언트"""
+
+    def __init__(self, uri, **kwargs):
+        self.uri = uri
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fixture_fake_mongodb_client(monkeypatch):
+    """공유 클라이언트를 비우고 MongoClient를 테스트용 클라이언트로 바꾸는 fixture"""
+
+    monkeypatch.setattr(mongodb_utils, "MongoClient", FakeMongoClient)
+    monkeypatch.setattr(mongodb_utils, "mongodb_client", None)
+
+
+def test_get_mongodb_client_returns_shared_pooled_client():
+    """get_mongodb_client 함수에 대한 테스트: 여러 번 호출해 공유 클라이언트를 받는 경우"""
+
+    # Act
+    first_client = get_mongodb_client()
+    second_client = get_mongodb_client()
+
+    # Assert
+    assert first_client is second_client
+    assert first_client.kwargs["maxPoolSize"] == mongodb_utils.MONGODB_MAX_POOL_SIZE
+    assert (
+        first_client.kwargs["serverSelectionTimeoutMS"]
+        == mongodb_utils.MONGODB_SERVER_SELECTION_TIMEOUT_MS
+    )
+
+
+def test_close_mongodb_client_closes_and_resets_shared_client():
+    """close_mongodb_client 함수에 대한 테스트: 공유 클라이언트를 닫고 비우는 경우"""
+
+    # Arrange
+    client = get_mongodb_client()
+
+    # Act
+    close_mongodb_client()
+
+    # Assert
+    assert client.closed
+    assert get_mongodb_client() is not client
@@ -0,0 +1,153 @@
+"""
+app.services.onnx_encoder 모듈의 함수와 클래스에 대한 테스트
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+from app.services.onnx_encoder import (
+    OnnxSentenceEncoder,
+    create_onnx_encoder,
+    get_intra_op_threads,
+    get_onnx_file_name,
+    pool_embeddings,
+    remove_stale_onnx_files,
+)
+from app.settings.constants import MODEL_LOCAL
+
+
+class FakeInput:
+    """테스트용 ONNX 모델 입력 정보"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeSession:
+    """토큰 ID를 그대로 임베딩으로 돌려주는 테스트용 ONNX Runtime 세션"""
+
+    def __init__(self):
+        self.batches = []
+
+    def get_inputs(self):
+        return [FakeInput("input_ids"), FakeInput("attention_mask")]
+
+    def run(self, _, feeds):
+        self.batches.append(feeds["input_ids"].shape)
+        return [feeds["input_ids"][:, :, None].astype(np.float32).repeat(2, axis=2)]
+
+
+def fake_tokenizer(sentences, max_length=None, **_):
+    """단어 수를 토큰 수로, 단어 길이를 토큰 ID로 하는 테스트용 토크나이저"""
+
+    lengths = [len(sentence.split()) for sentence in sentences]
+    input_ids = np.zeros((len(sentences), max(lengths)), dtype=np.int32)
+
+    for row, sentence in enumerate(sentences):
+        input_ids[row, : lengths[row]] = [len(word) for word in sentence.split()]
+
+    return {"input_ids": input_ids, "attention_mask": (input_ids > 0).astype(np.int32)}
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "mode, expected",
+    [("mean", [[2.0, 3.0]]), ("cls", [[1.0, 2.0]]), ("max", [[3.0, 4.0]])],
+)
+def test_pool_embeddings(mode, expected):
+    """pool_embeddings 함수에 대한 테스트"""
+
+    token_embeddings = np.array([[[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]]])
+    attention_mask = np.array([[1, 1, 0]])
+
+    # Act
+    embeddings = pool_embeddings(token_embeddings, attention_mask, mode)
+
+    # Assert
+    assert np.allclose(embeddings, expected)
+
+
+def test_get_intra_op_threads():
+    """get_intra_op_threads 함수에 대한 테스트"""
+
+    # Act, Assert
+    assert get_intra_op_threads(3, 2) == 3
+    assert get_intra_op_threads(0, 10_000) == 1
+    assert get_intra_op_threads(0, 1) == (os.cpu_count() or 1)
+
+
+def test_remove_stale_onnx_files(tmp_path):
+    """remove_stale_onnx_files 함수에 대한 테스트: 다시 올린 모델로 새로 내보낸 경우"""
+
+    # Arrange
+    names = [
+        "model.onnx",
+        "model.0123456789ab.onnx",
+        get_onnx_file_name(False, "ba9876543210"),
+        get_onnx_file_name(True, "ba9876543210"),
+        "modules.json",
+    ]
+
+    for name in names:
+        (tmp_path / name).write_bytes(b"")
+
+    # Act
+    remove_stale_onnx_files(str(tmp_path), "ba9876543210")
+
+    # Assert
+    assert sorted(os.listdir(tmp_path)) == [
+        "model.ba9876543210.int8.onnx",
+        "model.ba9876543210.onnx",
+        "modules.json",
+    ]
+
+
+def test_onnx_sentence_encoder_encode():
+    """OnnxSentenceEncoder 클래스에 대한 테스트: 길이가 다른 문장을 나누어 인코딩하는 경우"""
+
+    # Arrange
+    session = FakeSession()
+    encoder = OnnxSentenceEncoder(session, fake_tokenizer, normalize=True)
+    sentences = ["a", "bbb cc dddd", "ee"]
+
+    # Act
+    embeddings = encoder.encode(sentences, batch_size=2)
+    single_embedding = encoder.encode("ee")
+
+    # Assert
+    assert embeddings.dtype == np.float32
+    assert np.allclose(embeddings, np.full((3, 2), 1 / np.sqrt(2)))
+    assert session.batches[:2] == [(2, 3), (1, 1)]
+    assert single_embedding.shape == (2,)
+
+
+def test_onnx_encoder_parity(tmp_path):
+    """create_onnx_encoder 함수에 대한 테스트: PyTorch 모델과 임베딩을 비교하는 경우"""
+
+    # Arrange
+    pytest.importorskip("onnxruntime")
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+
+    if not os.path.isdir(MODEL_LOCAL):
+        pytest.skip(f"{MODEL_LOCAL} does not exist")
+
+    model_dir = tmp_path / "model"
+    shutil.copytree(MODEL_LOCAL, model_dir, ignore=shutil.ignore_patterns("*.onnx"))
+    sentences = [
+        "A place in New York where a lot of people are gathering.",
+        "An ancient amphitheatre in Rome.",
+        "tower",
+    ]
+    expected = sentence_transformers.SentenceTransformer(MODEL_LOCAL).encode(sentences)
+
+    for quantize in (False, True):
+        # Act
+        embeddings = create_onnx_encoder(str(model_dir), quantize).encode(sentences)
+
+        # Assert
+        cosines = (embeddings * expected).sum(axis=1) / (
+            np.linalg.norm(embeddings, axis=1) * np.linalg.norm(expected, axis=1)
+        )
+        assert cosines.min() >= 0.99
@@ -0,0 +1,63 @@
+"""
+app.services.prediction_cache 모듈의 함수와 클래스에 대한 테스트
+"""
+
+import numpy as np
+import pytest
+from app.core.cache import LRUCache
+from app.services.prediction_cache import PredictionCache, normalize_query
+
+
+def create_prediction_cache():
+    """테스트에 사용할 PredictionCache를 만드는 함수"""
+
+    return PredictionCache("v1", LRUCache(100, 100_000, 60), LRUCache(100, 100_000, 60))
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("Times Square", "times square"),
+        ("  A place   in New York!! ", "a place in new york"),
+        ("a place, in new-york...", "a place in new york"),
+        ("ＡＢＣ", "abc"),
+    ],
+)
+def test_normalize_query(query, expected):
+    """normalize_query 함수에 대한 테스트"""
+
+    # Act, Assert
+    assert normalize_query(query) == expected
+
+
+def test_prediction_cache_predictions():
+    """PredictionCache 클래스에 대한 테스트: 정규화된 설명이 같은 경우"""
+
+    # Arrange
+    prediction_cache = create_prediction_cache()
+    predictions = [{"text": "Times Square", "rank": 1}]
+
+    # Act
+    prediction_cache.set_predictions("A crowded place.", 1, 1, predictions)
+
+    # Assert
+    assert prediction_cache.get_predictions("a crowded place", 1, 1) == predictions
+    assert prediction_cache.get_predictions("a crowded place", 3, 1) is None
+
+
+def test_prediction_cache_invalidates_on_corpus_change():
+    """PredictionCache 클래스에 대한 테스트: 코퍼스 버전이 바뀐 경우"""
+
+    # Arrange
+    prediction_cache = create_prediction_cache()
+    prediction_cache.set_predictions("query", 1, 1, [{"text": "a", "rank": 1}])
+    prediction_cache.set_embedding("query", np.ones(4, dtype=np.float32))
+
+    # Act
+    result = prediction_cache.get_predictions("query", 1, 2)
+
+    # Assert
+    assert result is None
+    assert prediction_cache.results.snapshot()["entries"] == 0
+    assert prediction_cache.get_embedding("Query!") is not None
@@ -0,0 +1,152 @@
+"""
+app.services.query_batcher 모듈의 클래스에 대한 테스트
+"""
+
+import asyncio
+
+import pytest
+from app.core.exceptions import CustomException
+from app.services.inference_pool import InferencePool
+from app.services.query_batcher import BatchMetrics, QueryBatcher
+from app.settings.constants import HTTP_STATUS_CODE
+
+
+class FakePredictor:
+    """호출될 때마다 받은 배치를 기록하는 테스트용 배치 추론 함수"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, queries, top_ks):
+        self.batches.append(list(queries))
+
+        return [f"{query}:{top_k}" for query, top_k in zip(queries, top_ks)]
+
+
+def test_query_batcher_batches_concurrent_queries():
+    """QueryBatcher 클래스에 대한 테스트: 동시에 들어온 요청을 한 배치로 처리하는 경우"""
+
+    # Arrange
+    predictor = FakePredictor()
+    batcher = QueryBatcher(
+        predictor,
+        InferencePool(1, 8),
+        max_batch_size=8,
+        max_wait_ms=50,
+        max_queue_size=64,
+    )
+
+    async def run():
+        results = await asyncio.gather(
+            *(batcher.predict(f"query{i}", top_k=i) for i in range(5))
+        )
+        await batcher.close()
+        return results
+
+    # Act
+    results = asyncio.run(run())
+
+    # Assert
+    assert results == [f"query{i}:{i}" for i in range(5)]
+    assert predictor.batches == [[f"query{i}" for i in range(5)]]
+    assert batcher.metrics.snapshot()["batch_size_counts"] == {"5": 1}
+
+
+def test_query_batcher_respects_max_batch_size():
+    """QueryBatcher 클래스에 대한 테스트: 요청 수가 max_batch_size보다 많은 경우"""
+
+    # Arrange
+    predictor = FakePredictor()
+    batcher = QueryBatcher(
+        predictor,
+        InferencePool(1, 8),
+        max_batch_size=2,
+        max_wait_ms=50,
+        max_queue_size=64,
+    )
+
+    async def run():
+        await asyncio.gather(*(batcher.predict(f"query{i}") for i in range(5)))
+        await batcher.close()
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert [len(batch) for batch in predictor.batches] == [2, 2, 1]
+
+
+def test_query_batcher_propagates_errors():
+    """QueryBatcher 클래스에 대한 테스트: 배치 추론 중 에러가 발생한 경우"""
+
+    # Arrange
+    def failing_predictor(queries, top_ks):
+        raise RuntimeError("model error")
+
+    batcher = QueryBatcher(
+        failing_predictor,
+        InferencePool(1, 8),
+        max_batch_size=8,
+        max_wait_ms=1,
+        max_queue_size=64,
+    )
+
+    async def run():
+        try:
+            await batcher.predict("query")
+        finally:
+            await batcher.close()
+
+    # Act, Assert
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_query_batcher_rejects_when_queue_is_full():
+    """QueryBatcher 클래스에 대한 테스트: 대기열이 가득 찬 경우"""
+
+    # Arrange
+    batcher = QueryBatcher(
+        FakePredictor(),
+        InferencePool(1, 8),
+        max_batch_size=8,
+        max_wait_ms=1,
+        max_queue_size=1,
+    )
+
+    async def run():
+        results = await asyncio.gather(
+            batcher.predict("first"), batcher.predict("second"), return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    # Act
+    results = asyncio.run(run())
+
+    # Assert
+    assert results[0] == "first:3"
+    assert isinstance(results[1], CustomException)
+    assert results[1].status_code == HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"]
+    assert batcher.metrics.rejected == 1
+
+
+def test_batch_metrics_snapshot():
+    """BatchMetrics 클래스에 대한 테스트"""
+
+    # Arrange
+    metrics = BatchMetrics()
+
+    # Act
+    metrics.record([0.5, 3.0])
+    metrics.record([1000.0])
+    snapshot = metrics.snapshot()
+
+    # Assert
+    assert snapshot["batches"] == 2
+    assert snapshot["mean_batch_size"] == 1.5
+    assert snapshot["batch_size_counts"] == {"1": 1, "2": 1}
+    assert snapshot["queue_delay_ms"]["max"] == 1000.0
+    assert snapshot["queue_delay_ms"]["buckets"]["le_1"] == 1
+    assert snapshot["queue_delay_ms"]["buckets"]["le_5"] == 1
+    assert snapshot["queue_delay_ms"]["buckets"]["inf"] == 1
@@ -0,0 +1,93 @@
+"""
+app.services.ranking 모듈의 함수에 대한 테스트
+"""
+
+import numpy as np
+import pytest
+from app.services.ranking import (
+    get_distinct_labels,
+    get_top_k_labels,
+    get_top_k_labels_batch,
+)
+from app.services.vector_index import ExactIndex
+
+
+def get_top_k_labels_by_full_sort(similarities, label_codes, top_k):
+    """전체 정렬 후 순서대로 중복을 제거하는 기존 방식의 결과를 반환하는 함수"""
+
+    result = []
+
+    for index in np.argsort(-similarities, kind="stable"):
+        if label_codes[index] not in result:
+            result.append(label_codes[index])
+        if len(result) >= top_k:
+            break
+
+    return result
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "candidates, label_codes, top_k, expected",
+    [
+        ([], [], 3, []),
+        ([1, 2, 0], [0, 1, 2], 0, []),
+        ([1, 2, 0], [0, 1, 2], 2, [1, 2]),
+        ([0, 1, 2, 3], [0, 0, 0, 1], 2, [0, 1]),
+        ([1, 2, 0], [1, 0, 0], 5, [0, 1]),
+    ],
+)
+def test_get_distinct_labels(candidates, label_codes, top_k, expected):
+    """get_distinct_labels 함수에 대한 테스트"""
+
+    # Act
+    result = get_distinct_labels(
+        np.array(candidates, dtype=np.int64),
+        np.array(label_codes, dtype=np.int32),
+        top_k,
+    )
+
+    # Assert
+    assert result.tolist() == expected
+
+
+def test_get_top_k_labels_matches_full_sort():
+    """get_top_k_labels 함수에 대한 테스트: 레이블 중복이 많은 코퍼스에서 전체 정렬 결과와 비교"""
+
+    # Arrange
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(5_000, 16)).astype(np.float32)
+    label_codes = rng.integers(0, 50, size=5_000).astype(np.int32)
+    query_embedding = rng.normal(size=16).astype(np.float32)
+    similarities = (embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)) @ (
+        query_embedding / np.linalg.norm(query_embedding)
+    )
+
+    # Act
+    result = get_top_k_labels(ExactIndex(embeddings), query_embedding, label_codes, 10)
+
+    # Assert
+    assert result.tolist() == get_top_k_labels_by_full_sort(
+        similarities, label_codes, 10
+    )
+
+
+def test_get_top_k_labels_batch_matches_single_queries():
+    """get_top_k_labels_batch 함수에 대한 테스트: 질의별로 get_top_k_labels를 실행한 결과와 비교"""
+
+    # Arrange
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(2_000, 16)).astype(np.float32)
+    label_codes = rng.integers(0, 5, size=2_000).astype(np.int32)
+    query_embeddings = rng.normal(size=(3, 16)).astype(np.float32)
+    index = ExactIndex(embeddings)
+    top_ks = [1, 5, 10]
+
+    # Act
+    results = get_top_k_labels_batch(index, query_embeddings, label_codes, top_ks)
+
+    # Assert
+    assert [result.tolist() for result in results] == [
+        get_top_k_labels(index, query_embedding, label_codes, top_k).tolist()
+        for query_embedding, top_k in zip(query_embeddings, top_ks)
+    ]
@@ -0,0 +1,273 @@
+"""
+app.services.speech_recognizer 모듈의 클래스에 대한 테스트
+"""
+
+import asyncio
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, ServiceUnavailable
+from google.cloud import speech_v2
+from app.core.exceptions import CustomException
+from app.services.speech_recognizer import SpeechRecognizer
+from app.settings.constants import HTTP_STATUS_CODE
+from app.tests.fakes import (
+    WAV_HEADER,
+    FakeSpeechClient,
+    FakeStreamingSpeechClient,
+)
+
+
+def create_recognizer(client, **kwargs):
+    """테스트용 설정으로 SpeechRecognizer를 만드는 함수"""
+
+    options = {
+        "config": speech_v2.RecognitionConfig(),
+        "max_concurrency": 2,
+        "timeout_seconds": 1,
+        "max_retries": 2,
+        "retry_backoff_ms": 1,
+        **kwargs,
+    }
+
+    return SpeechRecognizer(lambda: client, "recognizers/_", **options)
+
+
+def test_speech_recognizer_recognizes_audio():
+    """SpeechRecognizer 클래스에 대한 테스트: 음성을 인식하는 경우"""
+
+    # Arrange
+    client = FakeSpeechClient()
+    recognizer = create_recognizer(client)
+
+    # Act
+    response = asyncio.run(recognizer.recognize(b"audio"))
+
+    # Assert
+    assert response.results[0].alternatives[0].transcript == "big ben"
+    assert client.requests[0].content == b"audio"
+    assert client.requests[0].recognizer == "recognizers/_"
+    assert 0 < client.timeouts[0] <= 1
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "errors, expected_calls",
+    [
+        ([ServiceUnavailable("unavailable")], 2),
+        ([ServiceUnavailable("unavailable")] * 2, 3),
+    ],
+)
+def test_speech_recognizer_retries_transient_errors(errors, expected_calls):
+    """SpeechRecognizer 클래스에 대한 테스트: 일시적인 오류 후 재시도로 인식하는 경우"""
+
+    client = FakeSpeechClient(errors)
+    recognizer = create_recognizer(client)
+
+    # Act
+    response = asyncio.run(recognizer.recognize(b"audio"))
+
+    # Assert
+    assert response.results
+    assert len(client.requests) == expected_calls
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "errors, expected_error, expected_calls",
+    [
+        ([ServiceUnavailable("unavailable")] * 3, ServiceUnavailable, 3),
+        ([InvalidArgument("bad audio")], InvalidArgument, 1),
+    ],
+)
+def test_speech_recognizer_raises_errors(errors, expected_error, expected_calls):
+    """SpeechRecognizer 클래스에 대한 테스트: 재시도를 모두 실패하거나 재시도하지 않는 오류인 경우"""
+
+    client = FakeSpeechClient(errors)
+    recognizer = create_recognizer(client)
+
+    # Act, Assert
+    with pytest.raises(expected_error):
+        asyncio.run(recognizer.recognize(b"audio"))
+
+    assert len(client.requests) == expected_calls
+
+
+def test_speech_recognizer_times_out():
+    """SpeechRecognizer 클래스에 대한 테스트: 기한 안에 응답을 받지 못한 경우"""
+
+    # Arrange
+    recognizer = create_recognizer(FakeSpeechClient(delay=1), timeout_seconds=0.05)
+
+    # Act, Assert
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(recognizer.recognize(b"audio"))
+
+    assert recognizer.in_flight == 0
+
+
+def test_speech_recognizer_bounds_concurrency():
+    """SpeechRecognizer 클래스에 대한 테스트: 동시 호출 수를 제한하는 경우"""
+
+    # Arrange
+    client = FakeSpeechClient(delay=0.02)
+    recognizer = create_recognizer(client)
+
+    async def run():
+        return await asyncio.gather(*[recognizer.recognize(b"audio") for _ in range(6)])
+
+    # Act
+    responses = asyncio.run(run())
+
+    # Assert
+    assert len(responses) == 6
+    assert client.max_in_flight == 2
+
+
+def test_speech_recognizer_rejects_when_no_slot_is_free():
+    """SpeechRecognizer 클래스에 대한 테스트: 기한 안에 동시 실행 자리를 얻지 못한 경우"""
+
+    # Arrange
+    client = FakeSpeechClient()
+    recognizer = create_recognizer(client, max_concurrency=1, timeout_seconds=0.05)
+
+    async def run():
+        await recognizer._semaphore.acquire()
+        return await recognizer.recognize(b"audio")
+
+    # Act, Assert
+    with pytest.raises(CustomException) as exc_info:
+        asyncio.run(run())
+
+    assert exc_info.value.status_code == HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"]
+    assert not client.requests
+
+
+def test_speech_recognizer_streams_audio():
+    """SpeechRecognizer 클래스에 대한 테스트: 음성 청크를 스트리밍으로 인식하는 경우"""
+
+    # Arrange
+    responses = [
+        {"results": [{"alternatives": [{"transcript": "big"}], "stability": 0.5}]},
+        {
+            "results": [
+                {
+                    "alternatives": [{"transcript": "big ben", "confidence": 0.9}],
+                    "is_final": True,
+                }
+            ]
+        },
+    ]
+    client = FakeStreamingSpeechClient(responses)
+    recognizer = create_recognizer(
+        client, stream_timeout_seconds=30, stream_chunk_bytes=4
+    )
+
+    async def chunks():
+        yield b"abcdef"
+        yield b"gh"
+
+    async def run():
+        return [response async for response in recognizer.streaming_recognize(chunks())]
+
+    # Act
+    results = asyncio.run(run())
+
+    # Assert
+    assert [result.results[0].is_final for result in results] == [False, True]
+    assert client.requests[0].recognizer == "recognizers/_"
+    assert client.requests[0].streaming_config.streaming_features.interim_results
+    assert [request.audio for request in client.requests[1:]] == [
+        b"abcd",
+        b"ef",
+        b"gh",
+    ]
+    assert client.timeout == 30
+    assert recognizer.streams_in_flight == 0
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "audio_chunks, expected_model",
+    [
+        ([WAV_HEADER + b"data"], "wav"),
+        ([WAV_HEADER[:6], WAV_HEADER[6:]], "wav"),
+        ([b"\x00\x01" * 8], "raw"),
+        ([b"\x00\x01", b"\x00\x01"], "raw"),
+    ],
+)
+def test_speech_recognizer_chooses_stream_config(audio_chunks, expected_model):
+    """SpeechRecognizer 클래스에 대한 테스트: WAV 헤더 여부로 스트리밍 인식 설정을 고르는 경우"""
+
+    client = FakeStreamingSpeechClient()
+    recognizer = create_recognizer(
+        client,
+        config=speech_v2.RecognitionConfig(model="wav"),
+        raw_config=speech_v2.RecognitionConfig(model="raw"),
+    )
+
+    async def chunks():
+        for chunk in audio_chunks:
+            yield chunk
+
+    async def run():
+        return [response async for response in recognizer.streaming_recognize(chunks())]
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert client.requests[0].streaming_config.config.model == expected_model
+    assert [request.audio for request in client.requests[1:]] == audio_chunks
+
+
+def test_speech_recognizer_releases_slot_when_stream_fails():
+    """SpeechRecognizer 클래스에 대한 테스트: 스트리밍 인식 중 오류가 발생한 경우"""
+
+    # Arrange
+    client = FakeStreamingSpeechClient(error=ServiceUnavailable("unavailable"))
+    recognizer = create_recognizer(client, stream_max_concurrency=1)
+
+    async def chunks():
+        yield b"audio"
+
+    async def run():
+        async for _ in recognizer.streaming_recognize(chunks()):
+            pass
+
+    # Act, Assert
+    with pytest.raises(ServiceUnavailable):
+        asyncio.run(run())
+
+    assert recognizer.streams_in_flight == 0
+    assert not recognizer._stream_semaphore.locked()
+
+
+def test_speech_recognizer_streams_do_not_take_recognize_slots():
+    """SpeechRecognizer 클래스에 대한 테스트: 스트리밍 세션이 열려 있는 동안 음성을 인식하는 경우"""
+
+    # Arrange
+    client = FakeSpeechClient()
+    recognizer = create_recognizer(
+        client, max_concurrency=1, stream_max_concurrency=1, timeout_seconds=0.05
+    )
+
+    async def run():
+        await recognizer._stream_semaphore.acquire()
+        response = await recognizer.recognize(b"audio")
+
+        async def chunks():
+            yield b"audio"
+
+        with pytest.raises(CustomException) as exc_info:
+            async for _ in recognizer.streaming_recognize(chunks()):
+                pass
+
+        return response, exc_info.value
+
+    # Act
+    response, exception = asyncio.run(run())
+
+    # Assert
+    assert response.results
+    assert exception.status_code == HTTP_STATUS_CODE["SERVICE_UNAVAILABLE"]
+    assert recognizer.streams_in_flight == 0
@@ -0,0 +1,203 @@
+"""
+app.services.transcription_cache 모듈의 클래스에 대한 테스트
+"""
+
+import asyncio
+
+import pytest
+from google.api_core.exceptions import InvalidArgument
+from google.cloud import speech_v2
+from app.core.cache import LRUCache
+from app.services.transcription_cache import TranscriptionCache
+
+
+class FakeRecognize:
+    """transcript와 confidence의 신뢰도로 응답하거나 error를 발생시키는 음성 인식 함수"""
+
+    def __init__(self, confidence=0.9, error=None, delay=0.0, transcript="big ben"):
+        self.confidence = confidence
+        self.transcript = transcript
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, audio):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+
+        if self.error:
+            raise self.error
+
+        return speech_v2.RecognizeResponse(
+            results=[
+                {
+                    "alternatives": [
+                        {"transcript": self.transcript, "confidence": self.confidence}
+                    ]
+                }
+            ]
+        )
+
+
+def create_cache(
+    disk_dir="", disk_max_bytes=0, language_code="en-US", preprocess_settings=""
+):
+    """테스트용 설정으로 TranscriptionCache를 만드는 함수"""
+
+    return TranscriptionCache(
+        "recognizers/_",
+        speech_v2.RecognitionConfig(language_codes=[language_code]),
+        LRUCache(100, 1024 * 1024),
+        disk_dir,
+        disk_max_bytes,
+        min_confidence=0.5,
+        preprocess_settings=preprocess_settings,
+    )
+
+
+def test_transcription_cache_reuses_results():
+    """TranscriptionCache 클래스에 대한 테스트: 같은 음성 데이터를 다시 인식하는 경우"""
+
+    # Arrange
+    cache = create_cache()
+    recognize = FakeRecognize()
+
+    async def run():
+        await cache.recognize(b"audio", recognize)
+        return await cache.recognize(b"audio", recognize)
+
+    # Act
+    response = asyncio.run(run())
+
+    # Assert
+    assert response.results[0].alternatives[0].transcript == "big ben"
+    assert recognize.calls == 1
+    assert cache.snapshot()["hits"] == 1
+
+
+def test_transcription_cache_keys_by_audio_and_config():
+    """TranscriptionCache 클래스에 대한 테스트: 음성 데이터나 음성 인식, 전처리 설정이 다른 경우"""
+
+    # Arrange
+    cache = create_cache()
+
+    # Act
+    keys = {
+        cache.create_key(b"audio"),
+        cache.create_key(b"other audio"),
+        create_cache(language_code="ko-KR").create_key(b"audio"),
+        create_cache(preprocess_settings="True:8000").create_key(b"audio"),
+    }
+
+    # Assert
+    assert len(keys) == 4
+    assert cache.create_key(b"audio") == create_cache().create_key(b"audio")
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "recognize",
+    [
+        FakeRecognize(confidence=0.1),
+        FakeRecognize(transcript=" "),
+        FakeRecognize(error=InvalidArgument("bad audio")),
+    ],
+)
+def test_transcription_cache_skips_low_confidence_and_errors(recognize):
+    """TranscriptionCache 클래스에 대한 테스트: 신뢰도가 낮거나, 텍스트가 비어 있거나, 오류가 발생한 경우"""
+
+    cache = create_cache()
+
+    async def run():
+        for _ in range(2):
+            try:
+                await cache.recognize(b"audio", recognize)
+            except InvalidArgument:
+                pass
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert recognize.calls == 2
+    assert cache.snapshot()["entries"] == 0
+
+
+def test_transcription_cache_coalesces_in_flight_calls():
+    """TranscriptionCache 클래스에 대한 테스트: 같은 음성 데이터를 동시에 인식하는 경우"""
+
+    # Arrange
+    cache = create_cache()
+    recognize = FakeRecognize(delay=0.02)
+
+    async def run():
+        return await asyncio.gather(
+            *[cache.recognize(b"audio", recognize) for _ in range(5)]
+        )
+
+    # Act
+    responses = asyncio.run(run())
+
+    # Assert
+    assert len(responses) == 5
+    assert recognize.calls == 1
+    assert cache.snapshot()["coalesced"] == 4
+    assert cache.snapshot()["in_flight"] == 0
+
+
+def test_transcription_cache_reads_disk(tmp_path):
+    """TranscriptionCache 클래스에 대한 테스트: 다른 프로세스가 디스크에 저장한 결과를 읽는 경우"""
+
+    # Arrange
+    recognize = FakeRecognize()
+    asyncio.run(create_cache(str(tmp_path)).recognize(b"audio", recognize))
+    cache = create_cache(str(tmp_path))
+
+    # Act
+    response = asyncio.run(cache.recognize(b"audio", recognize))
+
+    # Assert
+    assert response.results[0].alternatives[0].confidence == pytest.approx(0.9)
+    assert recognize.calls == 1
+    assert cache.disk_hits == 1
+
+
+def test_transcription_cache_prunes_disk(tmp_path):
+    """TranscriptionCache 클래스에 대한 테스트: 디스크 사용량이 한도를 넘은 경우"""
+
+    # Arrange
+    cache = create_cache(str(tmp_path), disk_max_bytes=100)
+    recognize = FakeRecognize()
+
+    async def run():
+        for index in range(10):
+            await cache.recognize(f"audio {index}".encode(), recognize)
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    disk_bytes = sum(path.stat().st_size for path in tmp_path.rglob("*.bin"))
+    assert 0 < disk_bytes <= 100
+
+
+def test_transcription_cache_counts_rewritten_disk_file_once(tmp_path):
+    """TranscriptionCache 클래스에 대한 테스트: 같은 키의 결과를 디스크에 다시 쓰는 경우"""
+
+    # Arrange
+    cache = create_cache(str(tmp_path), disk_max_bytes=10_000)
+    response = speech_v2.RecognizeResponse(
+        results=[{"alternatives": [{"transcript": "big ben", "confidence": 0.9}]}]
+    )
+    key = cache.create_key(b"audio")
+
+    async def run():
+        for _ in range(3):
+            await cache.set(key, response)
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    disk_bytes = sum(path.stat().st_size for path in tmp_path.rglob("*.bin"))
+    assert cache.snapshot()["disk_bytes"] == disk_bytes
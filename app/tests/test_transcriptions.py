@@ -0,0 +1,96 @@
+"""
+app.routers.transcriptions 모듈의 스트리밍 음성 인식 엔드포인트에 대한 테스트
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from google.api_core.exceptions import ServiceUnavailable
+from app.routers import transcriptions
+from app.services.speech_recognizer import speech_recognizer
+from app.tests.fakes import FakeStreamingSpeechClient
+
+STREAM_PATH = "/api/v1/transcriptions/stream"
+
+INTERIM_RESPONSE = {
+    "results": [{"alternatives": [{"transcript": "big"}], "stability": 0.5}]
+}
+
+
+def create_final_response(confidence):
+    """confidence의 신뢰도를 가진 최종 결과를 만드는 함수"""
+
+    return {
+        "results": [
+            {
+                "alternatives": [{"transcript": "big ben", "confidence": confidence}],
+                "is_final": True,
+            }
+        ]
+    }
+
+
+def stream_audio(monkeypatch, client):
+    """client로 음성을 인식하는 엔드포인트에 음성 청크를 보내고 받은 메시지를 반환하는 함수"""
+
+    monkeypatch.setattr(speech_recognizer, "get_client", lambda: client)
+
+    app = FastAPI()
+    app.include_router(transcriptions.router)
+    messages = []
+
+    with TestClient(app).websocket_connect(STREAM_PATH) as websocket:
+        websocket.send_bytes(b"RIFF")
+        websocket.send_bytes(b"audio")
+        websocket.send_text(transcriptions.STREAM_END_MESSAGE)
+
+        while True:
+            message = websocket.receive()
+
+            if message["type"] == "websocket.close":
+                return messages, message["code"]
+
+            messages.append(message["text"])
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "confidence, expected_status",
+    [(0.9, "success"), (0.1, "error")],
+)
+def test_stream_transcription(monkeypatch, confidence, expected_status):
+    """stream_transcription 함수에 대한 테스트: 중간 결과와 최종 결과를 보내는 경우"""
+
+    client = FakeStreamingSpeechClient(
+        [INTERIM_RESPONSE, create_final_response(confidence)]
+    )
+
+    # Act
+    messages, close_code = stream_audio(monkeypatch, client)
+
+    # Assert
+    interim, final = [json.loads(message) for message in messages]
+    assert interim["type"] == "interim"
+    assert interim["data"]["transcription"] == "big"
+    assert final["type"] == "final"
+    assert final["status"] == expected_status
+    assert close_code == 1000
+    assert [request.audio for request in client.requests[1:]] == [b"RIFF", b"audio"]
+
+
+def test_stream_transcription_error(monkeypatch):
+    """stream_transcription 함수에 대한 테스트: 음성 인식 서버에서 오류가 발생한 경우"""
+
+    # Arrange
+    client = FakeStreamingSpeechClient(error=ServiceUnavailable("unavailable"))
+
+    # Act
+    messages, close_code = stream_audio(monkeypatch, client)
+
+    # Assert
+    [error] = [json.loads(message) for message in messages]
+    assert error["status"] == "error"
+    assert error["details"]["attribute"] == "external"
+    assert close_code == 1011
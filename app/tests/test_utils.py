@@ -2,9 +2,26 @@
 app.api.utils 모듈의 유틸 함수들에 대한 테스트
 """
 
+import asyncio
 import base64
 import pytest
-from app.api.utils import is_audio_content_valid
+from app.api.utils import (
+    decode_audio_content,
+    get_prediction_item_error,
+    is_audio_content_valid,
+    is_wav_header_valid,
+    read_audio_body,
+)
+from app.core.exceptions import CustomException
+from app.settings.constants import HTTP_STATUS_CODE, PREDICTION_MAX_TOP_K
+from app.tests.fakes import WAV_HEADER
+
+
+async def iterate_chunks(chunks):
+    """요청 본문처럼 청크를 하나씩 내보내는 함수"""
+
+    for chunk in chunks:
+        yield chunk
 
 
 # Arrange
@@ -21,3 +38,102 @@ def test_is_audio_content_valid(audio_content, expected):
 
     # Act, Assert
     assert is_audio_content_valid(audio_content) == expected
+
+
+def test_decode_audio_content():
+    """decode_audio_content 함수에 대한 테스트"""
+
+    # Arrange
+    audio = b"RIFF" + b"random bytes"
+
+    # Act, Assert
+    assert decode_audio_content(base64.b64encode(audio).decode("utf-8")) == audio
+    assert decode_audio_content("not_base64") is None
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (WAV_HEADER, True),
+        (WAV_HEADER[:11], False),
+        (b"RIFF\x24\x00\x00\x00AVI LIST", False),
+        (b"OggS" + WAV_HEADER[4:], False),
+    ],
+)
+def test_is_wav_header_valid(header, expected):
+    """is_wav_header_valid 함수에 대한 테스트"""
+
+    # Act, Assert
+    assert is_wav_header_valid(header) == expected
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [WAV_HEADER + b"data"],
+        [WAV_HEADER[:3], WAV_HEADER[3:], b"data"],
+    ],
+)
+def test_read_audio_body(chunks):
+    """read_audio_body 함수에 대한 테스트: 청크를 이어 붙이는 경우"""
+
+    # Act
+    audio = asyncio.run(read_audio_body(iterate_chunks(chunks), 100))
+
+    # Assert
+    assert audio == b"".join(chunks)
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "chunks, max_bytes, expected_status_code",
+    [
+        ([b"OggS" + WAV_HEADER[4:], b"data"], 100, HTTP_STATUS_CODE["BAD_REQUEST"]),
+        ([WAV_HEADER[:6]], 100, HTTP_STATUS_CODE["BAD_REQUEST"]),
+        ([WAV_HEADER, b"data" * 10], 30, HTTP_STATUS_CODE["PAYLOAD_TOO_LARGE"]),
+    ],
+)
+def test_read_audio_body_rejects(chunks, max_bytes, expected_status_code):
+    """read_audio_body 함수에 대한 테스트: 헤더가 유효하지 않거나 크기를 넘는 경우"""
+
+    # Act
+    with pytest.raises(CustomException) as exc_info:
+        asyncio.run(read_audio_body(iterate_chunks(chunks), max_bytes))
+
+    # Assert
+    assert exc_info.value.status_code == expected_status_code
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "description, top_k, expected",
+    [
+        ("A place in New York", 3, None),
+        ("A place in New York", PREDICTION_MAX_TOP_K, None),
+        (
+            "   ",
+            3,
+            (
+                "description",
+                "The description is empty. Please check the data and resend it.",
+            ),
+        ),
+        (
+            "A place in New York",
+            0,
+            ("top_k", f"The top_k should be between 1 and {PREDICTION_MAX_TOP_K}."),
+        ),
+        (
+            "A place in New York",
+            PREDICTION_MAX_TOP_K + 1,
+            ("top_k", f"The top_k should be between 1 and {PREDICTION_MAX_TOP_K}."),
+        ),
+    ],
+)
+def test_get_prediction_item_error(description, top_k, expected):
+    """get_prediction_item_error 함수에 대한 테스트"""
+
+    # Act, Assert
+    assert get_prediction_item_error(description, top_k) == expected
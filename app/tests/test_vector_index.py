@@ -0,0 +1,198 @@
+"""
+app.services.vector_index 모듈의 함수와 클래스에 대한 테스트
+"""
+
+import numpy as np
+import pytest
+from app.services import vector_index
+from app.services.vector_index import (
+    ExactIndex,
+    IVFIndex,
+    QuantizedIndex,
+    VectorIndex,
+    build_index,
+    get_top_k_indices,
+)
+
+
+def create_embeddings(size=2_000, dimension=16):
+    """테스트에 사용할 임의의 임베딩을 만드는 함수"""
+
+    rng = np.random.default_rng(0)
+
+    return rng.normal(size=(size, dimension)).astype(np.float32)
+
+
+# Arrange
+@pytest.mark.parametrize(
+    "scores, k, expected",
+    [
+        ([], 3, []),
+        ([0.1, 0.9, 0.5], 0, []),
+        ([0.1, 0.9, 0.5], 2, [1, 2]),
+        ([0.1, 0.9, 0.5], 5, [1, 2, 0]),
+    ],
+)
+def test_get_top_k_indices(scores, k, expected):
+    """get_top_k_indices 함수에 대한 테스트"""
+
+    # Act, Assert
+    assert get_top_k_indices(np.array(scores, dtype=np.float32), k).tolist() == expected
+
+
+def test_exact_index_matches_cosine_similarity():
+    """ExactIndex 클래스에 대한 테스트: 정규화되지 않은 임베딩의 코사인 유사도 순서와 같은 경우"""
+
+    # Arrange
+    embeddings = create_embeddings() * np.arange(1, 2_001, dtype=np.float32)[:, None]
+    query_embedding = embeddings[0] * 3 + 0.1
+    similarities = (embeddings @ query_embedding) / (
+        np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_embedding)
+    )
+
+    # Act
+    result = ExactIndex(embeddings).search(query_embedding, 10)
+
+    # Assert
+    assert result.tolist() == np.argsort(-similarities)[:10].tolist()
+
+
+def test_exact_index_reuses_normalized_embeddings():
+    """ExactIndex 클래스에 대한 테스트: 이미 정규화된 임베딩은 복사하지 않는 경우"""
+
+    # Arrange
+    embeddings = create_embeddings()
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    # Act
+    index = ExactIndex(embeddings)
+
+    # Assert
+    assert index.embeddings is embeddings
+
+
+def test_exact_index_searches_float16_embeddings_in_chunks(monkeypatch):
+    """ExactIndex 클래스에 대한 테스트: float16 임베딩을 나누어 비교하는 경우"""
+
+    # Arrange
+    monkeypatch.setattr(vector_index, "EXACT_SEARCH_CHUNK_SIZE", 300)
+    embeddings = create_embeddings()
+    query_embeddings = embeddings[:3] + 0.1
+
+    # Act
+    results = ExactIndex(embeddings.astype(np.float16)).search_batch(
+        query_embeddings, 5
+    )
+
+    # Assert
+    expected = ExactIndex(embeddings).search_batch(query_embeddings, 5)
+    assert [result[0] for result in results] == [0, 1, 2]
+    assert all(
+        len(set(result.tolist()) & set(expected_result.tolist())) >= 4
+        for result, expected_result in zip(results, expected)
+    )
+
+
+def test_ivf_index_probing_every_list_matches_exact_index():
+    """IVFIndex 클래스에 대한 테스트: 모든 군집을 살펴보면 ExactIndex와 결과가 같은 경우"""
+
+    # Arrange
+    embeddings = create_embeddings()
+    query_embedding = embeddings[0] + 0.1
+    ivf_index = IVFIndex(embeddings, n_lists=16, n_probe=16)
+
+    # Act
+    result = ivf_index.search(query_embedding, 10)
+
+    # Assert
+    assert (
+        result.tolist() == ExactIndex(embeddings).search(query_embedding, 10).tolist()
+    )
+
+
+def test_ivf_index_returns_only_probed_candidates():
+    """IVFIndex 클래스에 대한 테스트: 살펴본 군집의 벡터 수보다 많이 요청한 경우"""
+
+    # Arrange
+    embeddings = create_embeddings()
+    ivf_index = IVFIndex(embeddings, n_lists=16, n_probe=1)
+
+    # Act
+    result = ivf_index.search(embeddings[0], embeddings.shape[0])
+
+    # Assert
+    assert 0 < result.size < embeddings.shape[0]
+    assert result[0] == 0
+
+
+def test_vector_index_requires_search():
+    """VectorIndex 클래스에 대한 테스트: search를 구현하지 않은 하위 클래스인 경우"""
+
+    # Arrange
+    class IncompleteIndex(VectorIndex):
+        pass
+
+    # Act, Assert
+    with pytest.raises(TypeError):
+        IncompleteIndex(create_embeddings())
+
+
+def test_build_index_unsupported_backend():
+    """build_index 함수에 대한 테스트: 지원하지 않는 백엔드인 경우"""
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        build_index(create_embeddings(), backend="unknown")
+
+
+@pytest.mark.parametrize("kind", ["int8", "float16"])
+def test_quantized_index_recall_against_exact_index(kind):
+    """QuantizedIndex 클래스에 대한 테스트: 재정렬 후 ExactIndex 결과와 거의 같은지 확인"""
+
+    # Arrange
+    embeddings = create_embeddings()
+    query_embeddings = create_embeddings(size=20) + embeddings[:20]
+    exact_results = ExactIndex(embeddings).search_batch(query_embeddings, 10)
+
+    # Act
+    results = QuantizedIndex(embeddings, kind, rerank_factor=4).search_batch(
+        query_embeddings, 10
+    )
+
+    # Assert
+    recall = np.mean(
+        [
+            len(set(result.tolist()) & set(exact_result.tolist())) / 10
+            for result, exact_result in zip(results, exact_results)
+        ]
+    )
+    assert recall >= 0.95
+    assert [result[0] for result in results] == [
+        exact_result[0] for exact_result in exact_results
+    ]
+
+
+def test_quantized_index_int8_codes_and_scales():
+    """QuantizedIndex 클래스에 대한 테스트: int8 압축 결과가 정규화 임베딩을 복원하는지 확인"""
+
+    # Arrange
+    embeddings = create_embeddings(size=100)
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    # Act
+    index = QuantizedIndex(embeddings, "int8")
+
+    # Assert
+    assert index.codes.dtype == np.int8
+    assert np.abs(index.codes).max() == 127
+    np.testing.assert_allclose(
+        index.codes * index.scales[:, None], normalized, atol=index.scales.max()
+    )
+
+
+def test_quantized_index_rejects_unknown_kind():
+    """QuantizedIndex 클래스에 대한 테스트: 지원하지 않는 압축 방식인 경우"""
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        QuantizedIndex(create_embeddings(size=10), "int4")
@@ -0,0 +1,136 @@
+"""
+app.routers.voice_predictions 모듈의 함수에 대한 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app import global_config
+from app.core.exceptions import CustomException
+from app.core.exception_handlers import custom_exception_handler
+from app.routers import voice_predictions
+from app.services.speech_recognizer import speech_recognizer
+from app.services.transcription_cache import transcription_cache
+from app.tests.fakes import WAV_HEADER, FakeSpeechClient, create_registry
+
+VOICE_PREDICTION_PATH = "/api/v1/predictions/voice"
+
+PREDICTIONS = [{"word": "big ben", "rank": 1}]
+
+
+@pytest.fixture(name="speech_client")
+def fixture_speech_client(monkeypatch):
+    """음성 인식 클라이언트와 단어 추론을 테스트용으로 바꾸는 fixture"""
+
+    speech_client = FakeSpeechClient()
+    queries = []
+
+    async def predict(query, bundle=None):
+        queries.append((query, bundle))
+        return PREDICTIONS
+
+    monkeypatch.setattr(global_config, "model_registry", create_registry(["v1"]))
+    monkeypatch.setattr(speech_recognizer, "get_client", lambda: speech_client)
+    monkeypatch.setattr(voice_predictions, "predict", predict)
+    transcription_cache.memory.clear()
+    speech_client.queries = queries
+
+    return speech_client
+
+
+def post_audio(headers=None):
+    """WAV 음성 데이터를 음성 단어 추론 엔드포인트로 보내고 응답을 반환하는 함수"""
+
+    app = FastAPI()
+    app.include_router(voice_predictions.router)
+    app.add_exception_handler(CustomException, custom_exception_handler)
+
+    return TestClient(app).post(
+        VOICE_PREDICTION_PATH,
+        content=WAV_HEADER + b"audio",
+        headers={"Content-Type": "audio/wav", **(headers or {})},
+    )
+
+
+def test_get_stage_timings():
+    """get_stage_timings 함수에 대한 테스트"""
+
+    # Arrange
+    checkpoints = {"read": 1.001, "transcription": 1.201, "prediction": 1.251}
+
+    # Act
+    timings = voice_predictions.get_stage_timings(checkpoints, 1.0)
+
+    # Assert
+    assert timings == {
+        "read_ms": 1.0,
+        "transcription_ms": 200.0,
+        "prediction_ms": 50.0,
+        "total_ms": 251.0,
+    }
+    assert voice_predictions.create_server_timing(timings).startswith(
+        "read;dur=1.0, transcription;dur=200.0"
+    )
+
+
+def test_create_voice_prediction(monkeypatch, speech_client):
+    """create_voice_prediction 함수에 대한 테스트: 음성을 인식해 단어를 추론하는 경우"""
+
+    # Arrange
+    monkeypatch.setattr(
+        global_config, "startup_state", global_config.STARTUP_STATE_READY
+    )
+
+    # Act
+    response = post_audio()
+
+    # Assert
+    data = response.json()["data"]
+    assert response.status_code == 200
+    assert data["transcription"] == "big ben"
+    assert data["predictions"] == PREDICTIONS
+    assert data["model_version"] == "v1"
+    assert set(data["timings"]) == {
+        "read_ms",
+        "transcription_ms",
+        "prediction_ms",
+        "total_ms",
+    }
+    assert "prediction;dur=" in response.headers["Server-Timing"]
+    assert speech_client.requests[0].content == WAV_HEADER + b"audio"
+    assert speech_client.queries == [
+        ("big ben", global_config.model_registry.find("v1"))
+    ]
+
+
+def test_create_voice_prediction_unknown_model_version(monkeypatch, speech_client):
+    """create_voice_prediction 함수에 대한 테스트: 없는 모델 버전을 지정한 경우"""
+
+    # Arrange
+    monkeypatch.setattr(
+        global_config, "startup_state", global_config.STARTUP_STATE_READY
+    )
+
+    # Act
+    response = post_audio({"X-Model-Version": "v9"})
+
+    # Assert
+    assert response.status_code == 404
+    assert response.json()["details"]["attribute"] == "model_version"
+    assert not speech_client.requests
+
+
+def test_create_voice_prediction_before_loading(monkeypatch, speech_client):
+    """create_voice_prediction 함수에 대한 테스트: 모델을 불러오기 전인 경우"""
+
+    # Arrange
+    monkeypatch.setattr(
+        global_config, "startup_state", global_config.STARTUP_STATE_PENDING
+    )
+
+    # Act
+    response = post_audio()
+
+    # Assert
+    assert response.status_code == 503
+    assert not speech_client.requests
@@ -0,0 +1,163 @@
+"""
+음성 전처리(모노 변환, 16kHz 리샘플링, 앞뒤 무음 제거) 전후의 음성 인식 지연 시간에 대한 벤치마크
+
+--clips-dir의 WAV 파일(없으면 앞뒤에 무음이 있는 44.1kHz 스테레오 합성 음성)을 전처리해
+크기와 길이가 얼마나 줄었는지, 전처리에 걸린 시간을 출력한다.
+기본적으로 업로드 시간(--bandwidth-mbps)과 음성 길이에 비례하는 인식 시간(--recognition-rtf)으로
+음성 인식 지연 시간을 추정하며, --live를 주면 실제 음성 인식 API를 호출해 측정한다.
+--live는 STT_SERVICE_ACCOUNT_FILE의 서비스 계정과 GCP_PROJECT_ID가 필요하다.
+
+실행 방법:
+    python -m benchmarks.bench_audio_preprocess --clips-dir ./clips --live
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import struct
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from app.services.audio_preprocessor import AudioPreprocessor
+
+
+def create_synthetic_clips(count: int) -> List[Tuple[str, bytes]]:
+    """
+    앞뒤에 무음이 있는 44.1kHz 스테레오 16비트 합성 음성을 만든다.
+    """
+
+    rng = np.random.default_rng(0)
+    sample_rate = 44100
+    clips = []
+
+    for index in range(count):
+        leading, voiced, trailing = rng.uniform([0.5, 1.0, 0.5], [2.0, 4.0, 2.0])
+        times = np.arange(int(voiced * sample_rate)) / sample_rate
+        tone = 0.3 * np.sin(2 * np.pi * rng.uniform(150, 400) * times)
+        noise = rng.normal(0, 0.001, int((leading + voiced + trailing) * sample_rate))
+        start = int(leading * sample_rate)
+        noise[start : start + len(tone)] += tone
+
+        stereo = np.repeat(np.clip(noise * 32767, -32768, 32767)[:, None], 2, axis=1)
+        pcm = stereo.astype("<i2").tobytes()
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + len(pcm),
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,
+            2,
+            sample_rate,
+            sample_rate * 4,
+            4,
+            16,
+            b"data",
+            len(pcm),
+        )
+        clips.append((f"synthetic-{index}", header + pcm))
+
+    return clips
+
+
+def load_clips(clips_dir: str) -> List[Tuple[str, bytes]]:
+    clips = []
+
+    for path in sorted(glob.glob(os.path.join(clips_dir, "*.wav"))):
+        with open(path, "rb") as clip_file:
+            clips.append((os.path.basename(path), clip_file.read()))
+
+    return clips
+
+
+def estimate_latency(
+    content_bytes: int, seconds: float, bandwidth_mbps: float, recognition_rtf: float
+) -> float:
+    return content_bytes * 8 / (bandwidth_mbps * 1_000_000) + seconds * recognition_rtf
+
+
+async def measure_live_latency(content: bytes, repeat: int) -> float:
+    from app.services.speech_recognizer import speech_recognizer
+
+    latencies = []
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await speech_recognizer.recognize(content)
+        latencies.append(time.perf_counter() - started_at)
+
+    return float(np.median(latencies))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clips-dir", default="")
+    parser.add_argument("--synthetic-clips", type=int, default=5)
+    parser.add_argument("--bandwidth-mbps", type=float, default=5.0)
+    parser.add_argument("--recognition-rtf", type=float, default=0.3)
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    clips = (
+        load_clips(args.clips_dir)
+        if args.clips_dir
+        else create_synthetic_clips(args.synthetic_clips)
+    )
+    preprocessor = AudioPreprocessor(enabled=True)
+    total_before, total_after = 0.0, 0.0
+
+    print(
+        f"{'clip':>16} {'bytes':>17} {'seconds':>13} {'prep ms':>8} "
+        f"{'latency ms (before -> after)':>30}"
+    )
+
+    for name, data in clips:
+        started_at = time.perf_counter()
+        result = preprocessor.process(data)
+        preprocess_ms = (time.perf_counter() - started_at) * 1000
+
+        if result.original_seconds is None:
+            print(f"{name:>16} skipped (unsupported format)")
+            continue
+
+        if args.live:
+            before = asyncio.run(measure_live_latency(data, args.repeat))
+            after = asyncio.run(measure_live_latency(result.content, args.repeat))
+        else:
+            before = estimate_latency(
+                result.original_bytes,
+                result.original_seconds,
+                args.bandwidth_mbps,
+                args.recognition_rtf,
+            )
+            after = estimate_latency(
+                result.processed_bytes,
+                result.processed_seconds,
+                args.bandwidth_mbps,
+                args.recognition_rtf,
+            )
+
+        after += preprocess_ms / 1000
+        total_before += before
+        total_after += after
+
+        print(
+            f"{name[-16:]:>16} {result.original_bytes:>8}->{result.processed_bytes:<8} "
+            f"{result.original_seconds:>5.2f}->{result.processed_seconds:<5.2f} "
+            f"{preprocess_ms:>8.1f} {before * 1000:>13.1f} -> {after * 1000:<13.1f}"
+        )
+
+    if total_before:
+        print(
+            f"total latency: {total_before * 1000:.1f}ms -> {total_after * 1000:.1f}ms "
+            f"({(1 - total_after / total_before) * 100:.1f}% lower)"
+        )
+
+
+if __name__ == "__main__":
+    main()
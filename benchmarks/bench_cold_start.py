@@ -0,0 +1,131 @@
+"""
+워커의 콜드 스타트 시간에 대한 벤치마크
+
+ENABLED_ROUTERS 구성별로 새 인터프리터에서 `python -X importtime -c "import app.main"`을 실행해
+app.main의 import 시간과 import 시간이 큰 최상위 패키지를 출력한다.
+--load를 주면 이어서 sentence_transformers import, 모델 로드, 코퍼스 조회(scan_corpus),
+코퍼스 인코딩(encode_corpus) 시간을 차례로 측정한다. 이 단계는 MODEL_LOCAL의 모델과
+MONGODB_URI의 데이터베이스가 필요하다.
+
+실행 방법:
+    python -m benchmarks.bench_cold_start --load
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROUTER_CONFIGS = [
+    "transcriptions",
+    "predictions",
+    "admin",
+    "transcriptions,predictions,admin,voice_predictions",
+]
+
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure_import_times(enabled_routers: str, repeat: int) -> Dict[str, int]:
+    """
+    새 인터프리터에서 app.main을 import하며 모듈별 누적 import 시간(us)을 구한다.
+
+    repeat번 실행해 모듈별로 가장 짧은 시간을 사용한다.
+    """
+
+    import_times = {}
+
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main"],
+            env={**os.environ, "ENABLED_ROUTERS": enabled_routers},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        for line in result.stderr.splitlines():
+            match = IMPORT_TIME_PATTERN.match(line)
+
+            if match:
+                module, cumulative_us = match.group(4), int(match.group(2))
+                import_times[module] = min(
+                    import_times.get(module, cumulative_us), cumulative_us
+                )
+
+    return import_times
+
+
+def get_slowest_packages(
+    import_times: Dict[str, int], top: int
+) -> List[Tuple[str, int]]:
+    packages = [
+        (module, cumulative_us)
+        for module, cumulative_us in import_times.items()
+        if "." not in module and module != "app"
+    ]
+
+    return sorted(packages, key=lambda package: -package[1])[:top]
+
+
+def measure_load_times(chunk_size: int) -> Dict[str, float]:
+    """
+    모델 로드와 코퍼스 조회, 인코딩 단계별 소요 시간(초)을 구한다.
+    """
+
+    timings = {}
+
+    started_at = time.perf_counter()
+    import sentence_transformers  # noqa: F401
+
+    timings["import sentence_transformers"] = time.perf_counter() - started_at
+
+    from app import global_config
+    from app.core.mongodb_utils import get_mongodb_client
+    from app.services.corpus_loader import encode_corpus, scan_corpus
+
+    started_at = time.perf_counter()
+    model = global_config.create_model_instance()
+    timings["model load"] = time.perf_counter() - started_at
+
+    client = get_mongodb_client()
+    started_at = time.perf_counter()
+    scan = scan_corpus(client, chunk_size)
+    timings[f"corpus fetch ({scan.size} rows)"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    encode_corpus(client, model, scan, chunk_size)
+    timings["corpus encode"] = time.perf_counter() - started_at
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--load", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    for enabled_routers in ROUTER_CONFIGS:
+        import_times = measure_import_times(enabled_routers, args.repeat)
+
+        print(f"ENABLED_ROUTERS={enabled_routers}")
+        print(f"{'app.main':>32}: {import_times['app.main'] / 1000:8.1f}ms")
+
+        for package, cumulative_us in get_slowest_packages(import_times, args.top):
+            print(f"{package:>32}: {cumulative_us / 1000:8.1f}ms")
+
+    if args.load:
+        print("load")
+
+        for name, seconds in measure_load_times(args.chunk_size).items():
+            print(f"{name:>32}: {seconds * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
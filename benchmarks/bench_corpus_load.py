@@ -0,0 +1,139 @@
+"""
+코퍼스 로드 방식별 최대 메모리 사용량에 대한 벤치마크
+
+get_collection으로 전체 문서를 DataFrame에 올린 뒤 인코딩하는 기존 방식과
+scan_corpus / encode_corpus로 문서를 나누어 읽는 방식의 최대 메모리 사용량(tracemalloc)과
+소요 시간을 비교한다. mongomock은 커서를 만들 때 모든 문서를 복사하므로,
+드라이버처럼 문서를 하나씩 만들어 내는 GeneratedCollection을 사용한다.
+인코더는 모델 대신 0 벡터를 반환한다.
+
+실행 방법:
+    python -m benchmarks.bench_corpus_load --corpus-size 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from bson import ObjectId
+
+from app.core import mongodb_utils
+from app.core.mongodb_utils import get_collection
+from app.services.corpus_loader import encode_corpus, scan_corpus
+from app.services.embedding_cache import compute_corpus_hash
+
+
+class GeneratedCursor:
+    """pymongo 커서처럼 한 번만 순회할 수 있고, 문서를 하나씩 새로 만들어 내는 커서"""
+
+    def __init__(self, ids: list, projection: dict):
+        self.ids = ids
+        self.projection = projection
+        self.documents = self.generate()
+
+    def sort(self, *args):
+        return self
+
+    def batch_size(self, *args):
+        return self
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.documents)
+
+    def generate(self):
+        for position, document_id in enumerate(self.ids):
+            document = {
+                "_id": document_id,
+                "description": f"landmark {position % 5000} description {position}",
+                "correct_word": f"landmark {position % 5000}",
+                "created_date": datetime(2023, 8, 1),
+                "source": "benchmark",
+                "tags": ["place", "travel"],
+            }
+
+            if self.projection:
+                document = {
+                    key: value
+                    for key, value in document.items()
+                    if key == "_id" or key in self.projection
+                }
+
+            yield document
+
+
+class GeneratedCollection:
+    """corpus_size개의 training_data 문서를 흉내 내는 컬렉션"""
+
+    def __init__(self, corpus_size: int):
+        self.ids = [ObjectId() for _ in range(corpus_size)]
+
+    def find(self, filters=None, projection=None):
+        return GeneratedCursor(self.ids, projection)
+
+
+class ZeroEncoder:
+    """문장 수만큼 0 벡터를 반환하는 인코더"""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    def encode(self, sentences, batch_size=32):
+        return np.zeros((len(sentences), self.dimension), dtype=np.float32)
+
+
+def load_with_dataframe(client: dict, encoder: ZeroEncoder) -> None:
+    corpus_df = get_collection(client, "training_data")
+    compute_corpus_hash(corpus_df.description, corpus_df.correct_word)
+    encoder.encode(corpus_df.description.tolist())
+    pd.factorize(corpus_df.correct_word)
+
+
+def load_in_chunks(client: dict, encoder: ZeroEncoder, chunk_size: int) -> None:
+    scan = scan_corpus(client, chunk_size)
+    encode_corpus(client, encoder, scan, chunk_size)
+
+
+def measure(func, *args) -> tuple:
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - started_at
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus-size", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    mongodb_utils.MONGODB_DB_NAME = "benchmark"
+    client = {"benchmark": {"training_data": GeneratedCollection(args.corpus_size)}}
+    encoder = ZeroEncoder(args.dimension)
+    embedding_mb = args.corpus_size * args.dimension * 4 / 2**20
+
+    print(f"corpus_size={args.corpus_size} embeddings={embedding_mb:.1f}MB")
+
+    for name, func, func_args in [
+        ("dataframe", load_with_dataframe, (client, encoder)),
+        ("chunked", load_in_chunks, (client, encoder, args.chunk_size)),
+    ]:
+        peak, elapsed = measure(func, *func_args)
+        print(f"{name:>10}: peak={peak / 2**20:8.1f}MB elapsed={elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+코퍼스 표현 방식별 메모리 사용량에 대한 벤치마크
+
+training_data 문서 전체를 담은 DataFrame과 임베딩을 함께 보관하던 기존 방식과
+CorpusStore(float32, float16)에 문서 ID 배열을 더한 방식의 메모리 사용량을 비교한다.
+
+실행 방법:
+    python -m benchmarks.bench_corpus_memory --corpus-size 100000
+"""
+
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from bson import ObjectId
+
+from app.services.corpus_store import CorpusStore
+
+
+def create_corpus_df(corpus_size: int, n_labels: int) -> pd.DataFrame:
+    """MongoDB training_data 문서를 흉내 낸 DataFrame을 만든다."""
+
+    return pd.DataFrame(
+        {
+            "_id": [ObjectId() for _ in range(corpus_size)],
+            "description": [
+                f"landmark {i % n_labels} described by user number {i}"
+                for i in range(corpus_size)
+            ],
+            "correct_word": [f"landmark {i % n_labels}" for i in range(corpus_size)],
+            "created_date": [datetime(2023, 8, 1)] * corpus_size,
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus-size", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--labels", type=int, default=5_000)
+    args = parser.parse_args()
+
+    corpus_df = create_corpus_df(args.corpus_size, args.labels)
+    embeddings = np.zeros((args.corpus_size, args.dimension), dtype=np.float32)
+    ids = np.array([str(document_id) for document_id in corpus_df["_id"]], dtype="U24")
+    label_codes, labels = pd.factorize(corpus_df.correct_word)
+
+    dataframe_bytes = int(corpus_df.memory_usage(deep=True).sum())
+    rows = [("dataframe + float32 embeddings", dataframe_bytes + embeddings.nbytes)]
+
+    for dtype in ["float32", "float16"]:
+        store = CorpusStore(embeddings, label_codes, labels.tolist(), dtype)
+        usage = store.memory_usage()
+        rows.append((f"store ({dtype}) + ids", usage["total"] + ids.nbytes))
+        print(
+            f"store ({dtype}):", {key: value / 2**20 for key, value in usage.items()}
+        )
+
+    print(f"dataframe without embeddings: {dataframe_bytes / 2**20:.1f}MB")
+
+    for name, total_bytes in rows:
+        print(f"{name:>32}: {total_bytes / 2**20:8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
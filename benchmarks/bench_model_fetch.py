@@ -0,0 +1,118 @@
+"""
+모델 압축 파일을 받을 때 동시에 보내는 범위 요청 수에 따른 준비 시간에 대한 벤치마크
+
+--size-mb 크기의 합성 모델을 압축해 임시 저장소 디렉터리에 올리고, --concurrency의 값마다
+받기와 압축 풀기에 걸린 시간과 로컬 복사본을 확인만 하는 시간(두 번째 호출)을 출력한다.
+S3의 연결당 처리량을 흉내 내기 위해 범위 요청마다 --latency-ms의 지연과
+--connection-mbps의 전송 시간을 더한다. --s3-version을 주면 실제 S3 버킷에서 받는다.
+
+실행 방법:
+    python -m benchmarks.bench_model_fetch --size-mb 256 --concurrency 1 4 8 16
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import zipfile
+
+from app.services.model_artifacts import (
+    FileSystemBackend,
+    ModelArtifactManager,
+    S3Backend,
+    create_manifest,
+)
+from app.settings.constants import AWS_S3_BUCKET_NAME, MODEL_DOWNLOAD_PART_BYTES
+
+
+class ThrottledBackend(FileSystemBackend):
+    """범위 요청마다 지연 시간과 연결당 전송 시간을 더하는 저장소"""
+
+    def __init__(self, root: str, latency_ms: float, connection_mbps: float):
+        super().__init__(root)
+        self.latency_ms = latency_ms
+        self.connection_mbps = connection_mbps
+
+    def read_range(self, key: str, start: int, end: int) -> bytes:
+        data = super().read_range(key, start, end)
+        time.sleep(
+            self.latency_ms / 1000 + len(data) * 8 / (self.connection_mbps * 1_000_000)
+        )
+
+        return data
+
+
+def publish_synthetic_model(store_dir: str, size_mb: int) -> None:
+    version_dir = os.path.join(store_dir, "models", "bench")
+    os.makedirs(version_dir)
+    archive_path = os.path.join(version_dir, "model.zip")
+
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("modules.json", b"[]")
+        archive.writestr("pytorch_model.bin", os.urandom(size_mb * 1024 * 1024))
+
+    with open(
+        os.path.join(version_dir, "manifest.json"), "w", encoding="utf-8"
+    ) as manifest_file:
+        json.dump(create_manifest(archive_path), manifest_file)
+
+
+def measure(backend, version: str, concurrency: int, part_bytes: int) -> tuple:
+    with tempfile.TemporaryDirectory() as model_root:
+        manager = ModelArtifactManager(
+            backend,
+            root=model_root,
+            part_bytes=part_bytes,
+            concurrency=concurrency,
+        )
+
+        started_at = time.perf_counter()
+        manager.ensure(version)
+        fetch_seconds = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        manager.ensure(version)
+        cached_seconds = time.perf_counter() - started_at
+
+    return fetch_seconds, cached_seconds, manager.downloaded_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--part-bytes", type=int, default=MODEL_DOWNLOAD_PART_BYTES)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--connection-mbps", type=float, default=400.0)
+    parser.add_argument("--s3-version", default="")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        if args.s3_version:
+            version = args.s3_version
+        else:
+            version = "bench"
+            publish_synthetic_model(store_dir, args.size_mb)
+
+        print(f"{'concurrency':>11} {'fetch s':>8} {'MB/s':>8} {'cached ms':>10}")
+
+        for concurrency in args.concurrency:
+            backend = (
+                S3Backend(AWS_S3_BUCKET_NAME, concurrency)
+                if args.s3_version
+                else ThrottledBackend(store_dir, args.latency_ms, args.connection_mbps)
+            )
+            fetch_seconds, cached_seconds, downloaded_bytes = measure(
+                backend, version, concurrency, args.part_bytes
+            )
+
+            print(
+                f"{concurrency:>11} {fetch_seconds:>8.2f} "
+                f"{downloaded_bytes / fetch_seconds / 1_000_000:>8.1f} "
+                f"{cached_seconds * 1000:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+문장 인코더 실행 방식(PyTorch, ONNX Runtime, ONNX Runtime int8)별 인코딩 지연 시간과 처리량에 대한 벤치마크
+
+MODEL_LOCAL의 모델로 질의 하나의 지연 시간(p50, p95)과 --batch-size개씩 인코딩할 때의
+처리량(문장/초), PyTorch 임베딩과의 최소 코사인 유사도를 출력한다.
+ONNX 모델이 없으면 먼저 내보내며, --threads의 값마다 ONNX Runtime의 연산 스레드 수를 바꿔 측정한다.
+
+실행 방법:
+    python -m benchmarks.bench_onnx_encoder --threads 1 2 4 --batch-size 32
+"""
+
+import argparse
+import time
+from typing import Any, List, Tuple
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from app.services.onnx_encoder import create_onnx_encoder
+from app.settings.constants import MODEL_LOCAL
+
+SENTENCES = [
+    "A place in New York where a lot of people are gathering.",
+    "An ancient amphitheatre in the centre of Rome.",
+    "A tall clock tower next to the Houses of Parliament in London.",
+    "A sweet frozen dessert made from milk and sugar.",
+    "The animal with a long neck that eats leaves from tall trees.",
+    "A musical instrument with black and white keys.",
+    "tower",
+    "Something you use to keep the rain off your head.",
+]
+
+
+def measure(
+    encoder: Any, queries: List[str], batch_size: int, repeat: int
+) -> Tuple[float, float, float]:
+    encoder.encode(queries[:batch_size])
+    latencies = []
+
+    for _ in range(repeat):
+        for query in queries:
+            started_at = time.perf_counter()
+            encoder.encode([query])
+            latencies.append((time.perf_counter() - started_at) * 1000)
+
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        encoder.encode(queries, batch_size=batch_size)
+
+    throughput = repeat * len(queries) / (time.perf_counter() - started_at)
+
+    return (
+        float(np.percentile(latencies, 50)),
+        float(np.percentile(latencies, 95)),
+        throughput,
+    )
+
+
+def get_min_cosine(embeddings: np.ndarray, expected: np.ndarray) -> float:
+    cosines = (embeddings * expected).sum(axis=1) / (
+        np.linalg.norm(embeddings, axis=1) * np.linalg.norm(expected, axis=1)
+    )
+
+    return float(cosines.min())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--queries", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    queries = [SENTENCES[index % len(SENTENCES)] for index in range(args.queries)]
+    torch_encoder = SentenceTransformer(MODEL_LOCAL, device="cpu")
+    expected = torch_encoder.encode(queries)
+
+    print(
+        f"{'backend':>12} {'threads':>7} {'p50 ms':>7} {'p95 ms':>7} "
+        f"{'sent/s':>8} {'min cos':>8}"
+    )
+
+    p50, p95, throughput = measure(torch_encoder, queries, args.batch_size, args.repeat)
+    print(
+        f"{'torch':>12} {'-':>7} {p50:>7.2f} {p95:>7.2f} {throughput:>8.1f} "
+        f"{1.0:>8.4f}"
+    )
+
+    for quantize in (False, True):
+        for threads in args.threads:
+            encoder = create_onnx_encoder(MODEL_LOCAL, quantize, threads)
+            p50, p95, throughput = measure(
+                encoder, queries, args.batch_size, args.repeat
+            )
+            min_cosine = get_min_cosine(encoder.encode(queries), expected)
+            backend = "onnx-int8" if quantize else "onnx"
+
+            print(
+                f"{backend:>12} {threads:>7} {p50:>7.2f} {p95:>7.2f} "
+                f"{throughput:>8.1f} {min_cosine:>8.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+압축 인덱스(int8, float16)의 재현율(recall@k), 지연 시간, 메모리 사용량에 대한 벤치마크
+
+코퍼스 전체와 비교하는 ExactIndex의 검색 결과를 정답으로 두고,
+QuantizedIndex의 압축 방식과 재정렬 후보 배수(rerank_factor)에 따른 결과를 비교한다.
+메모리는 압축된 행렬(과 scale)의 크기를 float32 임베딩과 비교한다.
+
+실행 방법:
+    python -m benchmarks.bench_quantized_index --corpus-size 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.services.vector_index import ExactIndex, QuantizedIndex
+from benchmarks.bench_vector_index import create_clustered_embeddings
+
+RERANK_FACTORS = [1, 2, 4, 8]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus-size", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=12)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embeddings = create_clustered_embeddings(
+        rng, args.corpus_size, args.dimension, n_clusters=1_000
+    )
+    queries = embeddings[rng.choice(args.corpus_size, size=args.queries)] + rng.normal(
+        scale=1.0, size=(args.queries, args.dimension)
+    ).astype(np.float32)
+
+    exact_index = ExactIndex(embeddings)
+    started_at = time.perf_counter()
+    expected = [set(exact_index.search(query, args.k).tolist()) for query in queries]
+    exact_ms = (time.perf_counter() - started_at) / args.queries * 1000
+
+    print(f"corpus_size={args.corpus_size} dimension={args.dimension} k={args.k}")
+    print(
+        f"{'backend':>12} {'recall@k':>9} {'latency(ms)':>12} {'index(MB)':>10}"
+        f" {'vs float32':>10}"
+    )
+    print(
+        f"{'exact':>12} {1.0:>9.3f} {exact_ms:>12.3f}"
+        f" {embeddings.nbytes / 2**20:>10.1f} {1.0:>10.2f}"
+    )
+
+    for kind in ["int8", "float16"]:
+        index = QuantizedIndex(embeddings, kind)
+        index_bytes = index.codes.nbytes + (
+            index.scales.nbytes if index.scales is not None else 0
+        )
+
+        for rerank_factor in RERANK_FACTORS:
+            index.rerank_factor = rerank_factor
+            started_at = time.perf_counter()
+            results = [index.search(query, args.k) for query in queries]
+            latency_ms = (time.perf_counter() - started_at) / args.queries * 1000
+            recall = np.mean(
+                [
+                    len(expected_ids & set(result.tolist())) / args.k
+                    for expected_ids, result in zip(expected, results)
+                ]
+            )
+
+            print(
+                f"{f'{kind}/{rerank_factor}':>12} {recall:>9.3f} {latency_ms:>12.3f}"
+                f" {index_bytes / 2**20:>10.1f}"
+                f" {index_bytes / embeddings.nbytes:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
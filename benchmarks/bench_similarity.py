@@ -0,0 +1,80 @@
+"""
+코사인 유사도 계산 방식별 질의당 지연 시간에 대한 벤치마크
+
+요청마다 util.cos_sim으로 코퍼스 전체를 정규화하던 기존 방식과,
+인덱스를 만들 때 코퍼스를 한 번 정규화해 두고 질의만 정규화한 뒤
+행렬 곱 한 번으로 계산하는 ExactIndex의 지연 시간을 비교한다.
+
+실행 방법:
+    python -m benchmarks.bench_similarity --corpus-size 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sentence_transformers import util
+
+from app.services.vector_index import ExactIndex
+
+
+def measure(func, queries: np.ndarray, repeat: int) -> float:
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        for query in queries:
+            func(query)
+
+    return (time.perf_counter() - started_at) / (repeat * len(queries)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus-size", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(args.corpus_size, args.dimension)).astype(np.float32)
+    queries = rng.normal(size=(args.queries, args.dimension)).astype(np.float32)
+    batch = rng.normal(size=(args.batch_size, args.dimension)).astype(np.float32)
+
+    started_at = time.perf_counter()
+    index = ExactIndex(embeddings)
+    build_ms = (time.perf_counter() - started_at) * 1000
+
+    np.testing.assert_allclose(
+        index.get_similarities(queries),
+        util.cos_sim(queries, embeddings).numpy(),
+        atol=1e-5,
+    )
+
+    rows = [
+        (
+            "cos_sim",
+            measure(lambda q: util.cos_sim(q, embeddings), queries, args.repeat),
+        ),
+        ("dot", measure(index.get_similarities, queries, args.repeat)),
+        (
+            f"cos_sim x{args.batch_size}",
+            measure(lambda b: util.cos_sim(b, embeddings), [batch], args.repeat)
+            / args.batch_size,
+        ),
+        (
+            f"dot x{args.batch_size}",
+            measure(index.get_similarities, [batch], args.repeat) / args.batch_size,
+        ),
+    ]
+
+    print(f"corpus_size={args.corpus_size} dimension={args.dimension}")
+    print(f"normalize corpus once: {build_ms:.1f}ms")
+
+    for name, latency_ms in rows:
+        print(f"{name:>14}: {latency_ms:8.3f}ms/query")
+
+
+if __name__ == "__main__":
+    main()
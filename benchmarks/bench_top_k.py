@@ -0,0 +1,115 @@
+"""
+단어 추론 결과의 상위 k개 레이블 선택 방식에 대한 벤치마크
+
+기존 방식(전체 argsort 후 DataFrame.iloc로 한 행씩 조회)과
+app.services.ranking.get_top_k_labels(argpartition + 레이블 코드 배열)의 지연 시간을 비교한다.
+
+실행 방법:
+    python -m benchmarks.bench_top_k
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from app.services.ranking import get_top_k_labels
+from app.services.vector_index import VectorIndex, get_top_k_indices
+
+CORPUS_SIZES = [10_000, 100_000, 1_000_000]
+
+
+class PrecomputedScoreIndex(VectorIndex):
+    """유사도 계산 비용을 빼고 레이블 선택만 비교하기 위해, 미리 계산한 점수로 검색하는 인덱스"""
+
+    def __init__(self, similarities: np.ndarray):
+        super().__init__(similarities.reshape(-1, 1))
+        self.similarities = similarities
+
+    def search(self, query_embedding: np.ndarray, k: int) -> np.ndarray:
+        return get_top_k_indices(self.similarities, k)
+
+
+def get_top_k_labels_legacy(
+    similarities: np.ndarray, corpus_df: pd.DataFrame, top_k: int
+) -> List[str]:
+    """기존 get_predictions의 레이블 선택 방식"""
+
+    top_k_labels = []
+    seen_labels = set()
+
+    for index in np.argsort(-similarities):
+        label = corpus_df.iloc[index.item()]["correct_word"]
+
+        if label not in seen_labels:
+            seen_labels.add(label)
+            top_k_labels.append(label)
+
+        if len(top_k_labels) >= top_k:
+            break
+
+    return top_k_labels
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """함수를 repeat번 실행한 평균 시간(ms)을 반환한다."""
+
+    func()
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - started_at) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--labels", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    print(
+        f"{'corpus_size':>12} {'legacy(ms)':>12} {'vectorized(ms)':>15} {'speedup':>8}"
+    )
+
+    for corpus_size in CORPUS_SIZES:
+        similarities = rng.random(corpus_size).astype(np.float32)
+        words = np.array([f"word_{i}" for i in range(args.labels)])
+        corpus_df = pd.DataFrame(
+            {"correct_word": words[rng.integers(0, args.labels, size=corpus_size)]}
+        )
+        label_codes, labels = pd.factorize(corpus_df.correct_word)
+        label_codes = label_codes.astype(np.int32)
+        labels = labels.tolist()
+        index = PrecomputedScoreIndex(similarities)
+
+        legacy_result = get_top_k_labels_legacy(similarities, corpus_df, args.top_k)
+        vectorized_result = [
+            labels[code]
+            for code in get_top_k_labels(index, None, label_codes, args.top_k)
+        ]
+        assert legacy_result == vectorized_result
+
+        legacy_ms = measure(
+            lambda: get_top_k_labels_legacy(similarities, corpus_df, args.top_k),
+            args.repeat,
+        )
+        vectorized_ms = measure(
+            lambda: get_top_k_labels(index, None, label_codes, args.top_k),
+            args.repeat,
+        )
+
+        print(
+            f"{corpus_size:>12} {legacy_ms:>12.3f} {vectorized_ms:>15.3f} "
+            f"{legacy_ms / vectorized_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
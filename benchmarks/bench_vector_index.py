@@ -0,0 +1,80 @@
+"""
+벡터 인덱스 백엔드별 재현율(recall@k)과 지연 시간에 대한 벤치마크
+
+ExactIndex의 검색 결과를 정답으로 두고, IVFIndex의 n_probe 값에 따른 재현율과
+질의당 평균 지연 시간을 비교한다.
+
+실행 방법:
+    python -m benchmarks.bench_vector_index --corpus-size 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.services.vector_index import ExactIndex, IVFIndex
+
+N_PROBES = [1, 2, 4, 8, 16, 32]
+
+
+def create_clustered_embeddings(
+    rng: np.random.Generator, size: int, dimension: int, n_clusters: int
+) -> np.ndarray:
+    """문장 임베딩처럼 군집을 이루는 임의의 임베딩을 만든다."""
+
+    centers = rng.normal(size=(n_clusters, dimension))
+    assignments = rng.integers(0, n_clusters, size=size)
+    noise = rng.normal(scale=1.5, size=(size, dimension))
+
+    return (centers[assignments] + noise).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus-size", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=12)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embeddings = create_clustered_embeddings(
+        rng, args.corpus_size, args.dimension, n_clusters=1_000
+    )
+    queries = embeddings[rng.choice(args.corpus_size, size=args.queries)] + rng.normal(
+        scale=1.0, size=(args.queries, args.dimension)
+    ).astype(np.float32)
+
+    exact_index = ExactIndex(embeddings)
+    started_at = time.perf_counter()
+    expected = [set(exact_index.search(query, args.k).tolist()) for query in queries]
+    exact_ms = (time.perf_counter() - started_at) / args.queries * 1000
+
+    started_at = time.perf_counter()
+    ivf_index = IVFIndex(embeddings)
+    build_s = time.perf_counter() - started_at
+
+    print(f"corpus_size={args.corpus_size} n_lists={ivf_index.centroids.shape[0]}")
+    print(f"ivf build time: {build_s:.2f}s")
+    print(f"{'backend':>12} {'recall@k':>9} {'latency(ms)':>12}")
+    print(f"{'exact':>12} {1.0:>9.3f} {exact_ms:>12.3f}")
+
+    for n_probe in N_PROBES:
+        started_at = time.perf_counter()
+        results = [
+            ivf_index.search(query, args.k, n_probe=n_probe) for query in queries
+        ]
+        latency_ms = (time.perf_counter() - started_at) / args.queries * 1000
+        recall = np.mean(
+            [
+                len(expected_ids & set(result.tolist())) / args.k
+                for expected_ids, result in zip(expected, results)
+            ]
+        )
+
+        print(f"{f'ivf/{n_probe}':>12} {recall:>9.3f} {latency_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()